@@ -0,0 +1,71 @@
+"""
+요청 DTO → 고정 순서 float 배열 변환
+- 요청 경로에서 pandas DataFrame을 만들지 않고 6개 재무지표를 바로 배열로 만든다
+- 열 순서는 스케일러/KMeans 학습 순서와 같다 (시가총액, per, pbr, ROE, 부채비율, 배당수익률)
+"""
+
+import numpy as np
+
+# DTO 속성명 (학습 피처 순서와 동일)
+FEATURE_ATTRS = ("market_cap", "per", "pbr", "roe", "debt_ratio", "dividend_yield")
+
+# 배열 열 인덱스
+MARKET_CAP, PER, PBR, ROE, DEBT_RATIO, DIVIDEND_YIELD = range(6)
+
+
+def raw_feature_matrix(items) -> np.ndarray:
+    """
+    DTO 리스트 → (N, 6) 원본 재무지표 배열 (inf/nan 그대로)
+
+    Args:
+        items: market_cap/per/pbr/roe/debt_ratio/dividend_yield 속성을 가진 객체 리스트
+    """
+    return np.array(
+        [[getattr(item, attr) for attr in FEATURE_ATTRS] for item in items],
+        dtype=float,
+    ).reshape(-1, len(FEATURE_ATTRS))
+
+
+def sanitize_features(features: np.ndarray) -> np.ndarray:
+    """inf, -inf, NaN → 0 (모델 예측 시 오류 방지, 기존 replace+fillna와 동일)"""
+    return np.nan_to_num(features, nan=0.0, posinf=0.0, neginf=0.0)
+
+
+def feature_matrix(items) -> np.ndarray:
+    """DTO 리스트 → (N, 6) 모델 입력용 재무지표 배열"""
+    return sanitize_features(raw_feature_matrix(items))
+
+
+def portfolio_vectors(holdings, style_model) -> tuple:
+    """
+    보유 종목 → (6차원 피처 벡터, 8차원 클러스터 벡터)
+
+    기존 DataFrame 경로(투자금액 가중평균 + get_portfolio_style_vector)와 같은 계산을
+    한번의 스케일링/클러스터 예측으로 수행한다.
+    - 피처 벡터: 스케일링된 재무지표의 투자금액 가중평균
+    - 클러스터 벡터: 클러스터별 투자 비중 합 (합이 1이 되도록 정규화)
+    투자금액이 0 이하인 종목은 제외하며, 남는 종목이 없으면 각각 None.
+
+    Args:
+        holdings: investment_amount 속성을 가진 보유 종목 DTO 리스트
+        style_model: StyleModel (app.ai_models.inference)
+    """
+    if not holdings:
+        return None, None
+
+    amounts = np.array([h.investment_amount for h in holdings], dtype=float)
+    mask = amounts > 0
+    if not mask.any():
+        return None, None
+
+    scaled = style_model.transform(feature_matrix(holdings))[mask]
+    weights = amounts[mask] / amounts[mask].sum()
+
+    user_feature_vector = np.average(scaled, axis=0, weights=weights)
+
+    groups = style_model.predict(scaled)
+    cluster_weights = np.bincount(groups, weights=weights, minlength=style_model.n_clusters)
+    vector_sum = cluster_weights.sum()
+    user_cluster_vector = cluster_weights / vector_sum if vector_sum != 0 else None
+
+    return user_feature_vector, user_cluster_vector
@@ -0,0 +1,112 @@
+"""
+scikit-learn 없이 동작하는 스타일 추론기 (StandardScaler + KMeans)
+- joblib 아티팩트에서 mean_, scale_, cluster_centers_ 만 꺼내 NumPy 배열로 보관
+- 표준화 + 최근접 중심점 계산을 직접 수행 (sklearn 입력 검증/피처명 체크 없음)
+- style_model.npz 가 최신이면 런타임에 scikit-learn을 import하지 않는다
+
+아티팩트 내보내기 (모델/스케일러 재학습 후 실행):
+    python -m app.ai_models.inference
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MODEL_DIR = Path(__file__).resolve().parent
+SCALER_FILE = "scaler.pkl"
+KMEANS_FILE = "kmeans_model.pkl"
+STYLE_MODEL_FILE = "style_model.npz"
+
+
+class StyleModel:
+    """표준화 + 최근접 중심점 분류기 (scaler.transform / model.predict 대체)"""
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray, centers: np.ndarray):
+        self.mean = np.asarray(mean, dtype=float)
+        self.scale = np.asarray(scale, dtype=float)
+        self.centers = np.asarray(centers, dtype=float)
+
+    @property
+    def n_clusters(self) -> int:
+        return len(self.centers)
+
+    @classmethod
+    def from_sklearn(cls, scaler, model) -> "StyleModel":
+        """학습된 StandardScaler / KMeans 객체에서 파라미터 추출"""
+        n_features = model.cluster_centers_.shape[1]
+        mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)
+        return cls(mean, scale, model.cluster_centers_)
+
+    def transform(self, features) -> np.ndarray:
+        """StandardScaler.transform 과 동일: (X - mean) / scale"""
+        features = np.asarray(features, dtype=float)
+        return (features - self.mean) / self.scale
+
+    def predict(self, scaled) -> np.ndarray:
+        """KMeans.predict 와 동일: 유클리드 거리가 가장 가까운 중심점 번호"""
+        scaled = np.atleast_2d(np.asarray(scaled, dtype=float))
+        diff = scaled[:, None, :] - self.centers[None, :, :]
+        return np.einsum("ijk,ijk->ij", diff, diff).argmin(axis=1)
+
+    def save(self, path: Path, source_digest: str = "") -> None:
+        np.savez(
+            path,
+            mean=self.mean,
+            scale=self.scale,
+            centers=self.centers,
+            source_digest=np.array(source_digest),
+        )
+
+
+def _artifact_digest(model_dir: Path) -> str:
+    """joblib 아티팩트 내용 해시 (npz가 최신인지 확인용)"""
+    digest = hashlib.sha256()
+    for name in (SCALER_FILE, KMEANS_FILE):
+        digest.update((model_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def export_style_model(model_dir: Path = MODEL_DIR) -> Path:
+    """joblib 아티팩트 → style_model.npz 내보내기 (scikit-learn 필요)"""
+    import joblib
+
+    scaler = joblib.load(str(model_dir / SCALER_FILE))
+    model = joblib.load(str(model_dir / KMEANS_FILE))
+    path = model_dir / STYLE_MODEL_FILE
+    StyleModel.from_sklearn(scaler, model).save(path, _artifact_digest(model_dir))
+    return path
+
+
+def load_style_model(model_dir: Path = MODEL_DIR) -> StyleModel:
+    """
+    StyleModel 로드
+
+    - style_model.npz 가 있고 joblib 아티팩트와 해시가 같으면 npz 사용 (sklearn 불필요)
+    - joblib 아티팩트가 없으면 npz를 그대로 사용
+    - npz가 없거나 오래되었으면 joblib 아티팩트에서 추출 (sklearn 필요)
+    """
+    npz_path = model_dir / STYLE_MODEL_FILE
+    has_joblib = (model_dir / SCALER_FILE).exists() and (model_dir / KMEANS_FILE).exists()
+
+    if npz_path.exists():
+        with np.load(npz_path) as data:
+            stored_digest = str(data["source_digest"])
+            style_model = StyleModel(data["mean"], data["scale"], data["centers"])
+        if not has_joblib or stored_digest == _artifact_digest(model_dir):
+            return style_model
+        logger.warning("%s 가 joblib 아티팩트보다 오래되어 pkl에서 다시 추출합니다", STYLE_MODEL_FILE)
+
+    import joblib
+
+    scaler = joblib.load(str(model_dir / SCALER_FILE))
+    model = joblib.load(str(model_dir / KMEANS_FILE))
+    return StyleModel.from_sklearn(scaler, model)
+
+
+if __name__ == "__main__":
+    print(f"저장 완료: {export_style_model()}")
@@ -6,7 +6,6 @@ Step 3: 멀티팩터 스코어링 알고리즘
 """
 
 import numpy as np
-import pandas as pd
 from numpy.linalg import norm
 
 
@@ -31,6 +30,22 @@ def cosine_similarity_to_score(similarity: float) -> float:
     return round((similarity + 1) / 2 * 100, 2)
 
 
+def _round2(values: np.ndarray) -> np.ndarray:
+    """
+    배열 버전 round(x, 2) — 파이썬 내장 round와 비트 단위로 동일한 결과
+
+    np.round는 x*100을 거쳐 반올림하므로 .5 경계 근처에서 내장 round와
+    다를 수 있다. 경계에 걸린 소수의 원소만 내장 round로 다시 계산한다.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.array(np.round(values, 2))
+    scaled = values * 100
+    near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        rounded[near_half] = [round(float(v), 2) for v in values[near_half]]
+    return rounded
+
+
 # ============================================================
 # 2. 성장성 점수
 # ============================================================
@@ -49,30 +64,32 @@ def growth_score(roe: float, per: float) -> float:
       - PER 5~10, 20~25: 감점
       - PER < 0 (적자) 또는 > 50: 0점
     """
-    # ROE 점수
-    if roe <= 0:
-        roe_score = 0.0
-    elif roe >= 20:
-        roe_score = 100.0
-    else:
-        roe_score = (roe / 20) * 100
-
-    # PER 적정성 점수
-    if per <= 0 or per > 100:
-        per_score = 0.0
-    elif 10 <= per <= 20:
-        per_score = 100.0
-    elif 5 <= per < 10:
-        per_score = (per - 5) / 5 * 100
-    elif 20 < per <= 35:
-        per_score = (35 - per) / 15 * 100
-    elif 35 < per <= 100:
-        per_score = 0.0
-    else:
-        per_score = 0.0
+    return round(float(_growth_score_raw(roe, per)), 2)
+
+
+def _growth_score_raw(roe, per) -> np.ndarray:
+    """
+    성장성 점수 커널 (반올림 전) — 스칼라/배열 모두 허용
+
+    if/elif 구간을 clip 기반 조각별 선형식으로 표현한다.
+    - ROE: clip(ROE, 0, 20) / 20 * 100
+    - PER: 상승 구간 (PER-5)/5 와 하락 구간 (35-PER)/15 중 작은 값을
+      0~100으로 clip → 5 미만·35 초과(100 초과 포함)는 0, 10~20은 만점
+    """
+    roe = np.asarray(roe, dtype=float)
+    per = np.asarray(per, dtype=float)
+
+    roe_score = np.clip(roe, 0, 20) / 20 * 100
+    per_score = np.minimum(
+        np.clip((per - 5) / 5 * 100, 0, 100),
+        np.clip((35 - per) / 15 * 100, 0, 100),
+    )
+    return np.clip(roe_score * 0.6 + per_score * 0.4, 0, 100)
 
-    score = roe_score * 0.6 + per_score * 0.4
-    return round(max(0, min(100, score)), 2)
+
+def growth_score_array(roe: np.ndarray, per: np.ndarray) -> np.ndarray:
+    """growth_score의 배열 버전 (구간 경계 동일)"""
+    return _round2(_growth_score_raw(roe, per))
 
 
 # ============================================================
@@ -93,24 +110,27 @@ def stability_score(debt_ratio: float, dividend_yield: float) -> float:
       - 0~5%: 선형 비례
       - 0%: 0점
     """
-    # 부채비율 점수
-    if debt_ratio <= 50:
-        debt_score = 100.0
-    elif debt_ratio <= 200:
-        debt_score = (200 - debt_ratio) / 150 * 100
-    else:
-        debt_score = 0.0
+    return round(float(_stability_score_raw(debt_ratio, dividend_yield)), 2)
 
-    # 배당수익률 점수
-    if dividend_yield <= 0:
-        div_score = 0.0
-    elif dividend_yield >= 5:
-        div_score = 100.0
-    else:
-        div_score = (dividend_yield / 5) * 100
 
-    score = debt_score * 0.6 + div_score * 0.4
-    return round(max(0, min(100, score)), 2)
+def _stability_score_raw(debt_ratio, dividend_yield) -> np.ndarray:
+    """
+    안정성 점수 커널 (반올림 전) — 스칼라/배열 모두 허용
+
+    - 부채비율: clip((200-부채비율)/150 * 100, 0, 100) → 50 이하 만점, 200 이상 0점
+    - 배당수익률: clip(배당, 0, 5) / 5 * 100
+    """
+    debt_ratio = np.asarray(debt_ratio, dtype=float)
+    dividend_yield = np.asarray(dividend_yield, dtype=float)
+
+    debt_score = np.clip((200 - debt_ratio) / 150 * 100, 0, 100)
+    div_score = np.clip(dividend_yield, 0, 5) / 5 * 100
+    return np.clip(debt_score * 0.6 + div_score * 0.4, 0, 100)
+
+
+def stability_score_array(debt_ratio: np.ndarray, dividend_yield: np.ndarray) -> np.ndarray:
+    """stability_score의 배열 버전 (구간 경계 동일)"""
+    return _round2(_stability_score_raw(debt_ratio, dividend_yield))
 
 
 # ============================================================
@@ -208,32 +228,188 @@ def score_stock(
     }
 
 
+def score_stocks_array(
+    roe: np.ndarray,
+    per: np.ndarray,
+    debt_ratio: np.ndarray,
+    dividend_yield: np.ndarray,
+    user_vector: np.ndarray = None,
+    clusters: np.ndarray = None,
+    persona: str = None,
+) -> dict:
+    """
+    여러 종목에 score_stock을 적용한 것과 같은 결과를 배열로 계산
+
+    Args:
+        roe, per, debt_ratio, dividend_yield: 종목별 재무지표 (N,)
+        user_vector: 사용자 포트폴리오 스타일 벡터 (8차원, 없으면 유사도 50점 기본)
+        clusters: 종목별 클러스터 번호 (N,) — 원-핫 벡터 대신 사용
+        persona: 페르소나 이름 (가중치 프리셋 선택용)
+
+    Returns:
+        {"growth_score", "stability_score", "similarity_score", "composite_score"} — 각 (N,) 배열
+    """
+    g_scores = growth_score_array(roe, per)
+    s_scores = stability_score_array(debt_ratio, dividend_yield)
+
+    if user_vector is not None and clusters is not None:
+        sim_scores = cosine_similarity_to_score_array(
+            cluster_cosine_similarity(user_vector, clusters)
+        )
+    else:
+        sim_scores = np.full(len(g_scores), 50.0)
+
+    weights = PERSONA_WEIGHTS.get(persona, DEFAULT_WEIGHTS)
+    return {
+        "growth_score": g_scores,
+        "stability_score": s_scores,
+        "similarity_score": sim_scores,
+        "composite_score": composite_score_array(sim_scores, g_scores, s_scores, weights),
+    }
+
+
 # ============================================================
-# 6. 배치 스코어링 (전체 종목 대상 추천용)
+# 6. 벡터화 스코어링 엔진 (전체 종목 배열 연산)
 # ============================================================
 
-def score_all_stocks(
-    stock_db: pd.DataFrame,
-    scaler,
-    model,
+def cosine_similarity_rows(
+    matrix: np.ndarray, vec: np.ndarray, row_norms: np.ndarray = None
+) -> np.ndarray:
+    """
+    행렬의 각 행과 벡터 간 코사인 유사도 (cosine_similarity의 배열 버전)
+
+    Args:
+        matrix: (N, D) 행렬
+        vec: (D,) 벡터
+        row_norms: 행별 L2 norm (미리 계산해 두었다면 전달)
+
+    Returns:
+        (N,) 유사도 배열, norm이 0이면 0.0
+    """
+    if row_norms is None:
+        row_norms = norm(matrix, axis=1)
+    denom = row_norms * norm(vec)
+    dots = matrix @ vec
+    return np.divide(dots, denom, out=np.zeros(len(matrix)), where=denom != 0)
+
+
+def cluster_cosine_similarity(user_vector: np.ndarray, clusters: np.ndarray) -> np.ndarray:
+    """
+    사용자 스타일 벡터와 종목별 클러스터 원-핫 벡터 간 코사인 유사도
+
+    원-핫 벡터와의 코사인은 user_vector[cluster] / ||user_vector|| 이므로
+    8차원 원-핫 배열을 만들지 않고 바로 계산한다.
+    """
+    clusters = np.asarray(clusters, dtype=int)
+    user_norm = norm(user_vector)
+    if user_norm == 0:
+        return np.zeros(len(clusters))
+    return np.asarray(user_vector)[clusters] / user_norm
+
+
+def cosine_similarity_to_score_array(similarity: np.ndarray) -> np.ndarray:
+    """cosine_similarity_to_score의 배열 버전"""
+    return _round2((similarity + 1) / 2 * 100)
+
+
+def composite_score_array(
+    similarity_score: np.ndarray,
+    growth: np.ndarray,
+    stability: np.ndarray,
+    weights: dict = None,
+) -> np.ndarray:
+    """composite_score의 배열 버전"""
+    if weights is None:
+        weights = DEFAULT_WEIGHTS
+
+    score = (
+        weights["similarity"] * similarity_score
+        + weights["growth"] * growth
+        + weights["stability"] * stability
+    )
+    return _round2(np.clip(score, 0, 100))
+
+
+def similarity_score_array(
+    scaled: np.ndarray,
+    clusters: np.ndarray,
+    user_feature_vector: np.ndarray = None,
+    user_cluster_vector: np.ndarray = None,
+    row_norms: np.ndarray = None,
+) -> np.ndarray:
+    """
+    2단계 유사도 점수 (0~100) 배열 — 스코어 중 사용자에 의존하는 부분
+
+    - 피처 유사도 (70%): 스케일링된 6차원 벡터 간 코사인 유사도
+    - 클러스터 유사도 (30%): 8차원 클러스터 벡터와 원-핫 벡터 간 코사인 유사도
+    """
+    n = len(scaled)
+    if user_feature_vector is None and user_cluster_vector is None:
+        return np.full(n, 50.0)
+
+    # (1) 피처 유사도: 스케일링된 6차원 벡터 (70% 비중)
+    feature_sim_score = np.full(n, 50.0)
+    if user_feature_vector is not None:
+        feature_sim = cosine_similarity_rows(scaled, user_feature_vector, row_norms)
+        feature_sim_score = cosine_similarity_to_score_array(feature_sim)
+
+    # (2) 클러스터 유사도: 8차원 원-핫 벡터 (30% 비중)
+    cluster_sim_score = np.full(n, 50.0)
+    if user_cluster_vector is not None:
+        cluster_sim = cluster_cosine_similarity(user_cluster_vector, clusters)
+        cluster_sim_score = cosine_similarity_to_score_array(cluster_sim)
+
+    return _round2(feature_sim_score * 0.7 + cluster_sim_score * 0.3)
+
+
+def top_n_indices(scores: np.ndarray, tie_break: np.ndarray, top_n: int) -> np.ndarray:
+    """
+    점수 내림차순 상위 N개 인덱스 (전체 정렬 없이 부분 선택)
+
+    np.partition으로 N번째 점수를 O(n)에 찾고, 그 이상인 후보만 정렬한다.
+    동점은 tie_break 오름차순으로 정해지므로 결과 순서가 항상 같다.
+
+    Args:
+        scores: (N,) 점수 배열
+        tie_break: (N,) 동점 시 정렬 키 (예: 종목코드 순위)
+        top_n: 반환할 개수
+
+    Returns:
+        상위 N개 인덱스 (점수 내림차순)
+    """
+    n = len(scores)
+    if top_n <= 0 or n == 0:
+        return np.empty(0, dtype=int)
+
+    if top_n < n:
+        kth = np.partition(scores, n - top_n)[n - top_n]
+        candidates = np.flatnonzero(scores >= kth)
+    else:
+        candidates = np.arange(n)
+
+    order = np.lexsort((tie_break[candidates], -scores[candidates]))
+    return candidates[order[:top_n]]
+
+
+# ============================================================
+# 7. 배치 스코어링 (전체 종목 대상 추천용)
+# ============================================================
+
+def recommend_from_universe(
+    universe,
     user_feature_vector: np.ndarray = None,
     user_cluster_vector: np.ndarray = None,
     persona: str = None,
     top_n: int = 10,
 ) -> list:
     """
-    전체 종목 DB에서 종합 점수 기준 상위 N개 추천
+    미리 계산된 UniverseSnapshot에서 종합 점수 기준 상위 N개 추천
 
-    유사도를 2단계로 계산합니다:
-    - 피처 유사도 (70%): 스케일링된 6차원 재무지표 벡터 간 코사인 유사도
-      → 같은 클러스터 내에서도 종목별로 다른 점수 (변별력 높음)
-    - 클러스터 유사도 (30%): 8차원 클러스터 벡터 간 코사인 유사도
-      → 투자 스타일 그룹 수준의 매칭
+    종목 고유 값(스케일링, 클러스터, 성장성/안정성)은 스냅샷에 이미 있으므로
+    요청마다 유사도와 종합 점수만 계산한다.
 
     Args:
-        stock_db: 전체 종목 DataFrame
-        scaler: StandardScaler (학습된 스케일러)
-        model: KMeans 모델
+        universe: UniverseSnapshot (app.ai_models.universe)
         user_feature_vector: 사용자 포트폴리오의 가중평균 스케일링 벡터 (6차원)
         user_cluster_vector: 사용자 포트폴리오 스타일 벡터 (8차원)
         persona: 페르소나 이름
@@ -242,120 +418,96 @@ def score_all_stocks(
     Returns:
         [{"stock_code", "stock_name", "composite_score", ...}, ...]
     """
-    from app.domain.stock_analyze.service import tag_mapping, is_valid_stock_for_analysis
+    arrays, rows = universe.all, universe.candidates
+    weights = PERSONA_WEIGHTS.get(persona, DEFAULT_WEIGHTS)
 
-    features = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
-    df = stock_db.copy()
+    sim_scores = _candidate_similarity(universe, user_feature_vector, user_cluster_vector)
+    total = composite_score_array(
+        sim_scores, arrays.growth[rows], arrays.stability[rows], weights
+    )
 
-    # 유효 종목만 필터링
-    if "한글명" in df.columns:
-        name_col = df["한글명"].astype(str).str.split().str[0]
-        df["clean_name"] = name_col
-        df = df[df["clean_name"].apply(is_valid_stock_for_analysis)]
+    # 종합 점수 상위 N개만 부분 선택 (동점은 종목코드 오름차순)
+    order = top_n_indices(total, arrays.code_rank[rows], top_n)
+    return _recommendation_rows(arrays, rows, order, sim_scores, total)
 
-    # inf/nan 처리
-    df[features] = df[features].replace([np.inf, -np.inf], np.nan).fillna(0)
 
-    # 스케일링 + 클러스터 예측 (벡터화 연산으로 한번에)
-    scaled = scaler.transform(df[features])
-    df["cluster"] = model.predict(scaled)
+def recommend_from_universe_all_personas(
+    universe,
+    user_feature_vector: np.ndarray = None,
+    user_cluster_vector: np.ndarray = None,
+    top_n: int = 10,
+) -> dict:
+    """
+    모든 페르소나(PERSONA_WEIGHTS + DEFAULT_WEIGHTS)의 상위 N개 추천을 한번에 계산
 
-    # 가중치 미리 가져오기
-    weights = PERSONA_WEIGHTS.get(persona, DEFAULT_WEIGHTS)
+    종합 점수는 세 하위 점수의 선형 결합이므로
+    (종목 × 3) 하위 점수 행렬과 (3 × 페르소나) 가중치 행렬의 곱으로
+    모든 페르소나의 점수를 한번에 구한다. 유사도는 한번만 계산한다.
 
-    results = []
-    for i, (idx, row) in enumerate(df.iterrows()):
-        # 성장성/안정성 점수
-        g_score = growth_score(roe=row["ROE"], per=row["per"])
-        s_score = stability_score(debt_ratio=row["부채비율"], dividend_yield=row["배당수익률"])
-
-        # === 2단계 유사도 계산 ===
-        if user_feature_vector is not None or user_cluster_vector is not None:
-            sim_score = 50.0  # 기본값
-
-            # (1) 피처 유사도: 스케일링된 6차원 벡터 (70% 비중)
-            feature_sim_score = 50.0
-            if user_feature_vector is not None:
-                stock_scaled_vec = scaled[i]
-                feature_sim = cosine_similarity(user_feature_vector, stock_scaled_vec)
-                feature_sim_score = cosine_similarity_to_score(feature_sim)
-
-            # (2) 클러스터 유사도: 8차원 원-핫 벡터 (30% 비중)
-            cluster_sim_score = 50.0
-            if user_cluster_vector is not None:
-                cluster_vec = np.zeros(8)
-                cluster_vec[int(row["cluster"])] = 1.0
-                cluster_sim = cosine_similarity(user_cluster_vector, cluster_vec)
-                cluster_sim_score = cosine_similarity_to_score(cluster_sim)
-
-            # 혼합 유사도
-            sim_score = round(feature_sim_score * 0.7 + cluster_sim_score * 0.3, 2)
-        else:
-            sim_score = 50.0
-
-        total = composite_score(sim_score, g_score, s_score, weights)
-
-        stock_code = idx if isinstance(idx, str) else row.get("단축코드", str(idx))
-        stock_name = row.get("clean_name", row.get("한글명", "알 수 없음"))
-        if isinstance(stock_name, str):
-            stock_name = stock_name.split()[0]
+    Returns:
+        {페르소나 이름(기본 가중치는 None): [{"stock_code", ...}, ...]}
+    """
+    arrays, rows = universe.all, universe.candidates
+    personas = [None, *PERSONA_WEIGHTS]
+    weight_matrix = np.array([
+        [w["similarity"], w["growth"], w["stability"]]
+        for w in (PERSONA_WEIGHTS.get(p, DEFAULT_WEIGHTS) for p in personas)
+    ]).T  # (3, P)
+
+    sim_scores = _candidate_similarity(universe, user_feature_vector, user_cluster_vector)
+
+    # (N, 3) · (3, P) — composite_score와 같은 덧셈 순서로 풀어 써서 결과를 일치시킴
+    totals = (
+        sim_scores[:, None] * weight_matrix[0]
+        + arrays.growth[rows][:, None] * weight_matrix[1]
+        + arrays.stability[rows][:, None] * weight_matrix[2]
+    )
+    totals = _round2(np.clip(totals, 0, 100))
 
-        results.append({
-            "stock_code": stock_code,
-            "stock_name": stock_name,
-            "style_tag": tag_mapping.get(int(row["cluster"]), ""),
-            "growth_score": g_score,
-            "stability_score": s_score,
-            "similarity_score": sim_score,
-            "composite_score": total,
-        })
+    code_rank = arrays.code_rank[rows]
+    results = {}
+    for j, persona in enumerate(personas):
+        total = totals[:, j]
+        order = top_n_indices(total, code_rank, top_n)
+        results[persona] = _recommendation_rows(arrays, rows, order, sim_scores, total)
+    return results
 
-    # 종합 점수 기준 정렬
-    results.sort(key=lambda x: x["composite_score"], reverse=True)
-    return results[:top_n]
 
+def _candidate_similarity(universe, user_feature_vector, user_cluster_vector) -> np.ndarray:
+    """
+    분석 가능 종목(universe.candidates 순서)의 유사도 점수
 
-def compute_user_feature_vector(stocks_data: list, scaler) -> np.ndarray:
+    유사도는 행 단위 계산이라 공유 배열(메모리 매핑) 전체에서 바로 계산하고
+    결과만 candidates 로 고른다 — 입력 배열을 요청마다 복사하지 않는다.
     """
-    사용자 포트폴리오의 투자금액 가중평균 스케일링 벡터 (6차원) 계산
+    arrays = universe.all
+    return similarity_score_array(
+        arrays.scaled,
+        arrays.clusters,
+        user_feature_vector,
+        user_cluster_vector,
+        arrays.row_norms,
+    )[universe.candidates]
 
-    Args:
-        stocks_data: [{"market_cap", "per", "pbr", "roe", "debt_ratio", "dividend_yield", "investment_amount"}, ...]
-        scaler: StandardScaler
 
-    Returns:
-        6차원 스케일링된 가중평균 벡터
-    """
-    features = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
-
-    rows = []
-    amounts = []
-    for s in stocks_data:
-        amt = s.get("investment_amount", 0)
-        if amt <= 0:
-            continue
-        rows.append([
-            s.get("market_cap", 0),
-            s.get("per", 0),
-            s.get("pbr", 0),
-            s.get("roe", 0),
-            s.get("debt_ratio", 0),
-            s.get("dividend_yield", 0),
-        ])
-        amounts.append(amt)
-
-    if not rows:
-        return None
-
-    df = pd.DataFrame(rows, columns=features)
-    df = df.replace([np.inf, -np.inf], np.nan).fillna(0)
-
-    # 스케일링
-    scaled = scaler.transform(df)
-
-    # 투자금액 비중으로 가중평균
-    amounts = np.array(amounts)
-    weights = amounts / amounts.sum()
-    weighted_vector = np.average(scaled, axis=0, weights=weights)
-
-    return weighted_vector
+def _recommendation_rows(arrays, rows, order, sim_scores, total) -> list:
+    """
+    선택된 인덱스만 추천 결과 dict로 변환
+
+    order 는 candidates 기준 위치, rows[order] 가 arrays 의 행 번호
+    """
+    from app.domain.stock_analyze.service import tag_mapping
+
+    results = []
+    for i in order:
+        row = rows[i]
+        results.append({
+            "stock_code": arrays.codes[row],
+            "stock_name": arrays.names[row],
+            "style_tag": tag_mapping.get(int(arrays.clusters[row]), ""),
+            "growth_score": float(arrays.growth[row]),
+            "stability_score": float(arrays.stability[row]),
+            "similarity_score": float(sim_scores[i]),
+            "composite_score": float(total[i]),
+        })
+    return results
@@ -0,0 +1,208 @@
+"""
+종목 DB + 모델 아티팩트 스냅샷 (무중단 교체)
+- stock_db, StyleModel, UniverseSnapshot, 종목 인덱스(코드 → 종목명/분석 가능 여부)를 하나의 버전으로 묶어 보관
+- reload_snapshot()은 새 스냅샷을 옆에서 만든 뒤 참조만 교체하므로
+  처리 중인 요청(SSE 포함)은 시작할 때 잡은 이전 스냅샷으로 끝까지 처리된다
+- 요청 단위 고정(pin): 미들웨어가 요청 시작 시점의 스냅샷을 contextvar에 고정하고,
+  응답 헤더(X-Model-Version)로 그 버전을 내보낸다
+- 감시 스레드: data_collector.py / train_model.py 가 파일을 갱신하면 모든 워커가 자동 재로드
+"""
+
+import contextvars
+import hashlib
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pandas as pd
+from prometheus_client import Counter, Gauge
+
+from app.ai_models.inference import (
+    KMEANS_FILE,
+    SCALER_FILE,
+    STYLE_MODEL_FILE,
+    StyleModel,
+    load_style_model,
+)
+from app.ai_models.stock_filters import StockEntry, build_stock_index, is_valid_stock_for_analysis
+from app.ai_models.universe import UniverseSnapshot
+from app.ai_models.universe_store import (
+    DATA_DIR,
+    MANIFEST_FILE,
+    MODEL_DIR,
+    STOCK_DB_FILE,
+    STORE_DIR,
+    load_universe_csv,
+    load_universe_store,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_INFO = Gauge(
+    "stockit_model_snapshot_info",
+    "현재 활성화된 종목 DB/모델 스냅샷 (값이 1인 version 라벨이 활성 버전)",
+    ["version"],
+)
+SNAPSHOT_RELOADS = Counter(
+    "stockit_model_snapshot_reloads_total",
+    "스냅샷 재로드 시도 수",
+    ["result"],
+)
+
+
+class ModelSnapshot:
+    """한 버전의 종목 DB + 모델 (읽기 전용으로 공유)"""
+
+    def __init__(
+        self,
+        version: str,
+        stock_db: pd.DataFrame,
+        style_model: StyleModel,
+        universe: UniverseSnapshot,
+    ):
+        self.version = version
+        self.stock_db = stock_db
+        self.style_model = style_model
+        self.universe = universe
+        self.stock_index = build_stock_index(stock_db.index, stock_db["한글명"])
+        self.loaded_at = datetime.now(timezone.utc)
+
+    def lookup(self, stock_code: str) -> StockEntry | None:
+        """종목코드 → (정리된 종목명, 분석 가능 여부, 사유 코드), DB에 없으면 None"""
+        return self.stock_index.get(stock_code)
+
+    def info(self) -> dict:
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at.isoformat(),
+            "stock_count": len(self.stock_db),
+        }
+
+
+_current: ModelSnapshot | None = None
+_build_lock = threading.Lock()
+_pinned: contextvars.ContextVar[ModelSnapshot | None] = contextvars.ContextVar(
+    "pinned_model_snapshot", default=None
+)
+
+
+def _source_files() -> list[Path]:
+    files = [
+        DATA_DIR / STOCK_DB_FILE,
+        MODEL_DIR / SCALER_FILE,
+        MODEL_DIR / KMEANS_FILE,
+        MODEL_DIR / STYLE_MODEL_FILE,
+        STORE_DIR / MANIFEST_FILE,
+    ]
+    return [f for f in files if f.exists()]
+
+
+def _source_fingerprint() -> tuple:
+    """파일 변경 감지용 (mtime, size) — 내용 해시보다 훨씬 싸다"""
+    return tuple((f.name, f.stat().st_mtime_ns, f.stat().st_size) for f in _source_files())
+
+
+def _content_version() -> str:
+    """데이터 + 모델 파일 내용 해시 앞 12자리 (같은 내용이면 같은 버전)"""
+    digest = hashlib.sha256()
+    for f in _source_files():
+        digest.update(f.name.encode())
+        digest.update(f.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def build_snapshot() -> ModelSnapshot:
+    """디스크의 최신 파일로 새 스냅샷 생성 (현재 스냅샷에는 영향 없음)"""
+    version = _content_version()
+    style_model = load_style_model(MODEL_DIR)
+
+    # 최신 저장소가 있으면 메모리 매핑 (CSV 파싱/스케일링 생략), 없으면 CSV에서 계산
+    stored = load_universe_store(style_model, is_valid_stock_for_analysis)
+    if stored is None:
+        # stockit_ai_features_v1.csv 사용 (3621개 종목)
+        stored = load_universe_csv(style_model, is_valid_stock_for_analysis, DATA_DIR / STOCK_DB_FILE)
+    stock_db, universe = stored
+    return ModelSnapshot(version, stock_db, style_model, universe)
+
+
+def _activate(snapshot: ModelSnapshot) -> None:
+    global _current
+    previous = _current
+    _current = snapshot  # 참조 교체 한번 — 읽는 쪽은 락 없이 항상 온전한 스냅샷을 본다
+    if previous is not None and previous.version != snapshot.version:
+        SNAPSHOT_INFO.labels(version=previous.version).set(0)
+    SNAPSHOT_INFO.labels(version=snapshot.version).set(1)
+
+
+def get_snapshot() -> ModelSnapshot:
+    """
+    현재 요청이 사용할 스냅샷
+
+    미들웨어가 고정한 스냅샷이 있으면 그것을, 없으면 최신 스냅샷을 반환한다.
+    """
+    pinned = _pinned.get()
+    if pinned is not None:
+        return pinned
+    if _current is None:
+        with _build_lock:
+            if _current is None:
+                _activate(build_snapshot())
+    return _current
+
+
+def reload_snapshot(force: bool = False) -> ModelSnapshot:
+    """
+    디스크에서 새 스냅샷을 만들어 원자적으로 교체
+
+    내용이 같으면(버전 동일) 교체하지 않는다. 빌드 실패 시 현재 스냅샷을 유지한다.
+    """
+    with _build_lock:
+        if not force and _current is not None and _current.version == _content_version():
+            return _current
+        try:
+            snapshot = build_snapshot()
+        except Exception:
+            SNAPSHOT_RELOADS.labels(result="failure").inc()
+            logger.exception("스냅샷 재로드 실패 — 이전 버전 유지")
+            raise
+        previous_version = _current.version if _current is not None else None
+        _activate(snapshot)
+    SNAPSHOT_RELOADS.labels(result="success").inc()
+    logger.info("스냅샷 교체: %s → %s", previous_version, snapshot.version)
+    return snapshot
+
+
+def pin_snapshot() -> tuple[ModelSnapshot, contextvars.Token]:
+    """요청 시작 시 현재 스냅샷을 고정 (요청 처리 중 교체되어도 같은 버전 사용)"""
+    snapshot = get_snapshot()
+    return snapshot, _pinned.set(snapshot)
+
+
+def unpin_snapshot(token: contextvars.Token) -> None:
+    _pinned.reset(token)
+
+
+def start_snapshot_watcher(interval: float) -> threading.Thread:
+    """
+    데이터/모델 파일 변경 감시 스레드 시작
+
+    interval 초마다 파일 (mtime, size)를 확인하고 바뀌었으면 재로드한다.
+    워커 프로세스마다 하나씩 돌므로 재시작 없이 모든 워커가 새 버전으로 넘어간다.
+    """
+    def watch():
+        last = _source_fingerprint()
+        while True:
+            time.sleep(interval)
+            try:
+                current = _source_fingerprint()
+                if current != last:
+                    reload_snapshot()
+                    last = current
+            except Exception as e:
+                logger.warning("스냅샷 감시 중 오류 (다음 주기에 재시도): %s", e)
+
+    thread = threading.Thread(target=watch, name="model-snapshot-watcher", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,113 @@
+"""
+종목 분석 가능 여부 규칙 + 종목 인덱스 (표준 라이브러리만 사용)
+- SPAC/우선주/인버스·레버리지 필터링 규칙과 분석 불가 사유는 이 모듈에만 둔다
+- build_stock_index: 스냅샷 로드 시 종목코드 → (정리된 종목명, 분석 가능 여부, 사유 코드)를 한번 계산
+  → 요청 경로는 dict 조회 한번 (요청마다 정규식/부분 문자열 검사를 반복하지 않음)
+"""
+
+import re
+from typing import NamedTuple
+
+UNKNOWN_STOCK_NAME = "알 수 없는 종목"
+
+_PREFERRED_SUFFIX = re.compile(r"\d+우[A-Z]?$")  # 1우, 2우B, 3우C
+
+# 분석 불가 사유 코드 → 응답 메시지
+REASON_NOT_IN_DB = "not_in_db"
+REASON_PREFERRED = "preferred"
+REASON_SPAC = "spac"
+REASON_INVERSE_LEVERAGE = "inverse_leverage"
+REASON_HOLDING = "holding"
+REASON_OTHER = "other"
+
+REASON_MESSAGES = {
+    REASON_NOT_IN_DB: "이 종목은 AI 학습 데이터에 포함되지 않아 투자 스타일 분석이 불가능합니다. 포트폴리오 분석을 위해 다른 종목을 선택해주세요.",
+    REASON_PREFERRED: "이 종목은 우선주로 분류되어 투자 스타일 분석이 불가능합니다. 포트폴리오 분석을 위해 보통주를 선택해주세요.",
+    REASON_SPAC: "이 종목은 SPAC(기업인수목적회사)으로 투자 스타일 분석이 불가능합니다.",
+    REASON_INVERSE_LEVERAGE: "이 종목은 인버스/레버리지 상품으로 투자 스타일 분석이 불가능합니다.",
+    REASON_HOLDING: "이 종목은 지주회사로 투자 스타일 분석이 불가능합니다.",
+    REASON_OTHER: "이 종목은 AI 학습 데이터에 포함되지 않아 투자 스타일 분석이 불가능합니다.",
+}
+
+
+def clean_stock_name(raw) -> str:
+    """한글명에 붙은 불필요한 텍스트 제거 (첫 단어만, 비어 있으면 '알 수 없는 종목')"""
+    parts = str(raw).split() if raw else []
+    return parts[0] if parts else UNKNOWN_STOCK_NAME
+
+
+def is_valid_stock_for_analysis(stock_name: str) -> bool:
+    """
+    스타일 태그 생성이 가능한 종목인지 검증
+
+    Returns:
+        True: 분석 가능 (정상 종목)
+        False: 분석 불가 (SPAC, 우선주, 인버스 등)
+    """
+    if not stock_name or stock_name == UNKNOWN_STOCK_NAME:
+        return False
+
+    # 1. 우선주 필터링
+    if "(우)" in stock_name:
+        return False
+    # "숫자+우" 또는 "숫자+우+영문" 패턴 (예: 1우, 2우B, 3우C)
+    if _PREFERRED_SUFFIX.search(stock_name):
+        return False
+    # 종목명 끝이 "우"로 끝나는 경우 (예: SK텔레콤우, LG화학우)
+    if stock_name.endswith("우"):
+        return False
+
+    # 2. SPAC 필터링
+    if "스팩" in stock_name or "SPAC" in stock_name.upper():
+        return False
+
+    # 3. 인버스/레버리지 필터링
+    if "인버스" in stock_name or "레버리지" in stock_name:
+        return False
+
+    # 4. 홀딩스/지주 필터링 (선택적 - 필요시 주석 해제)
+    # if "홀딩스" in stock_name or "홀딩" in stock_name or "지주" in stock_name:
+    #     return False
+
+    return True
+
+
+def unanalyzable_reason_code(stock_name: str, in_db: bool = True) -> str:
+    """분석 불가 사유 코드 (분석 불가로 판정된 종목에 사용)"""
+    if not in_db:
+        return REASON_NOT_IN_DB
+    if "(우)" in stock_name or _PREFERRED_SUFFIX.search(stock_name):
+        return REASON_PREFERRED
+    if "스팩" in stock_name or "SPAC" in stock_name.upper():
+        return REASON_SPAC
+    if "인버스" in stock_name or "레버리지" in stock_name:
+        return REASON_INVERSE_LEVERAGE
+    if "홀딩스" in stock_name or "홀딩" in stock_name or "지주" in stock_name:
+        return REASON_HOLDING
+    return REASON_OTHER
+
+
+class StockEntry(NamedTuple):
+    """종목 인덱스 항목"""
+
+    name: str
+    analyzable: bool
+    reason: str | None  # 사유 코드 (분석 가능하면 None)
+
+
+def build_stock_index(codes, raw_names) -> dict[str, StockEntry]:
+    """
+    종목코드 → StockEntry (스냅샷 로드 시 한번)
+
+    Args:
+        codes: 종목코드 목록 (stock_db.index)
+        raw_names: 같은 순서의 한글명 (정리 전이어도 됨)
+    """
+    index = {}
+    for code, raw in zip(codes, raw_names):
+        name = clean_stock_name(raw)
+        if is_valid_stock_for_analysis(name):
+            index[code] = StockEntry(name, True, None)
+        else:
+            index[code] = StockEntry(name, False, unanalyzable_reason_code(name))
+    return index
@@ -0,0 +1,109 @@
+"""
+전체 종목 유니버스 스냅샷
+- 사용자와 무관한 값(종목명 정리, 분석 가능 여부, 스케일링, 클러스터,
+  성장성/안정성 점수)을 로드 시점에 한번만 계산해 둔다
+- 추천 요청은 스냅샷을 공유하고 사용자 의존 부분(유사도, 종합 점수)만 계산
+"""
+
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+from numpy.linalg import norm
+
+from app.ai_models.scoring import growth_score_array, stability_score_array
+
+FEATURE_COLUMNS = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
+
+
+class UniverseArrays:
+    """종목 단위 배열 묶음 (모든 배열은 같은 행 순서)"""
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        names: np.ndarray,
+        features: np.ndarray,
+        scaled: np.ndarray,
+        row_norms: np.ndarray,
+        clusters: np.ndarray,
+        growth: np.ndarray,
+        stability: np.ndarray,
+        code_rank: np.ndarray = None,
+    ):
+        self.codes = codes
+        self.names = names
+        self.features = features
+        self.scaled = scaled
+        self.row_norms = row_norms
+        self.clusters = clusters
+        self.growth = growth
+        self.stability = stability
+        # 종목코드 정렬 순위 — 동점 tie-break를 정수 비교로 처리
+        if code_rank is None:
+            code_rank = np.argsort(np.argsort(codes.astype(str), kind="stable"))
+        self.code_rank = code_rank
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+
+class UniverseSnapshot:
+    """
+    로드 시점에 한번 만들어 모든 추천 요청이 공유하는 읽기 전용 스냅샷
+
+    Attributes:
+        all: 전체 종목 배열 (DB 순서)
+        valid: 분석 가능 여부 마스크 (SPAC/우선주 등 False)
+        candidates: 분석 가능 종목의 행 번호 (추천 스코어링 대상)
+
+    candidates 는 복사본이 아니라 all 의 행 번호만 들고 있다.
+    저장소에서 메모리 매핑한 배열을 미리 잘라 두면 워커마다 사설 메모리로 복사되므로,
+    스코어링은 전체 배열 위에서 계산한 뒤 결과만 candidates 로 고른다.
+    """
+
+    def __init__(self, arrays: UniverseArrays, valid: np.ndarray):
+        self.all = arrays
+        self.valid = valid
+        self.candidates = np.flatnonzero(valid)
+
+    def __len__(self) -> int:
+        return len(self.all)
+
+
+def build_universe_snapshot(
+    stock_db: pd.DataFrame,
+    style_model,
+    is_valid: Callable[[str], bool],
+) -> UniverseSnapshot:
+    """
+    종목 DB(단축코드 인덱스)로 UniverseSnapshot 생성
+
+    Args:
+        stock_db: 전체 종목 DataFrame (index: 단축코드)
+        style_model: 스케일러 + KMeans 추론기 (app.ai_models.inference.StyleModel)
+        is_valid: 정리된 종목명 → 분석 가능 여부 (is_valid_stock_for_analysis)
+    """
+    if "한글명" in stock_db.columns:
+        names = stock_db["한글명"].astype(str).str.split().str[0].to_numpy()
+        valid = np.fromiter((is_valid(n) for n in names), dtype=bool, count=len(names))
+    else:
+        names = np.full(len(stock_db), "알 수 없음", dtype=object)
+        valid = np.ones(len(stock_db), dtype=bool)
+
+    features = stock_db[FEATURE_COLUMNS].replace([np.inf, -np.inf], np.nan).fillna(0)
+    scaled = style_model.transform(features)
+    clusters = style_model.predict(scaled)
+
+    values = features.to_numpy(dtype=float)
+    arrays = UniverseArrays(
+        codes=stock_db.index.to_numpy(),
+        names=names,
+        features=values,
+        scaled=scaled,
+        row_norms=norm(scaled, axis=1),
+        clusters=clusters,
+        growth=growth_score_array(values[:, 3], values[:, 1]),
+        stability=stability_score_array(values[:, 4], values[:, 5]),
+    )
+    return UniverseSnapshot(arrays, valid)
@@ -0,0 +1,212 @@
+"""
+메모리 매핑용 유니버스 저장소 (CSV 대신 .npy 묶음)
+- stockit_ai_features_v1.csv 의 한글명에는 마스터 파일 고정폭 꼬리가 붙어 있어 파일이 크고,
+  워커마다 pandas로 다시 파싱해야 한다
+- 빌드 단계에서 정리된 종목명, 재무지표(float32), 스케일링 결과, 클러스터,
+  성장성/안정성 점수를 미리 계산해 .npy 로 저장한다
+- 앱은 np.load(mmap_mode="r") 로 읽으므로 여러 uvicorn 워커가 같은 페이지를 공유한다
+- manifest.json 에 원본 CSV / 모델 해시를 기록하고, 다르면 CSV 경로로 대체한다
+
+저장소 빌드 (data_collector.py / train_model.py 가 마지막에 rebuild_serving_artifacts 로 자동 실행):
+    python -m app.ai_models.universe_store
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+from app.ai_models.inference import StyleModel, load_style_model
+from app.ai_models.universe import (
+    FEATURE_COLUMNS,
+    UniverseArrays,
+    UniverseSnapshot,
+    build_universe_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parents[1]  # /app
+MODEL_DIR = BASE_DIR / "ai_models"
+DATA_DIR = BASE_DIR / "data"
+STOCK_DB_FILE = "stockit_ai_features_v1.csv"
+STORE_DIR = DATA_DIR / "universe_store"
+MANIFEST_FILE = "manifest.json"
+STORE_FORMAT = 1
+
+# 저장하는 배열 (파일명 = 이름.npy)
+# features 는 표시/조회용이라 float32, 점수 계산에 쓰는 값은 원본(float64)에서 미리 계산해 둔다
+_ARRAYS = (
+    "codes", "names", "features", "scaled", "row_norms",
+    "clusters", "growth", "stability", "code_rank", "valid",
+)
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def model_digest(style_model: StyleModel) -> str:
+    """StyleModel 파라미터 해시 (스케일링/클러스터 결과가 유효한지 확인용)"""
+    digest = hashlib.sha256()
+    for values in (style_model.mean, style_model.scale, style_model.centers):
+        digest.update(np.ascontiguousarray(values, dtype=float).tobytes())
+    return digest.hexdigest()
+
+
+def read_stock_db(csv_path: Path = DATA_DIR / STOCK_DB_FILE) -> pd.DataFrame:
+    """종목 DB CSV → DataFrame (index: 단축코드)"""
+    return pd.read_csv(str(csv_path), dtype={"단축코드": str}).set_index("단축코드")
+
+
+def serving_stock_db(arrays: UniverseArrays) -> pd.DataFrame:
+    """
+    서빙용 stock_db (index: 단축코드, 열: 한글명 + 재무지표)
+
+    저장소/CSV 어느 경로로 로드해도 같은 모양이 되도록 UniverseArrays 에서 만든다.
+    - 한글명: 고정폭 꼬리를 뗀 정리된 종목명
+    - 재무지표: inf/NaN → 0, 저장소와 같은 float32
+    """
+    stock_db = pd.DataFrame(
+        np.asarray(arrays.features, dtype=np.float32),
+        columns=FEATURE_COLUMNS,
+        index=pd.Index(arrays.codes.astype(str), name="단축코드"),
+    )
+    stock_db.insert(0, "한글명", arrays.names.astype(str))
+    return stock_db
+
+
+def build_universe_store(
+    is_valid: Callable[[str], bool],
+    csv_path: Path = DATA_DIR / STOCK_DB_FILE,
+    store_dir: Path = STORE_DIR,
+    style_model: StyleModel = None,
+) -> Path:
+    """
+    종목 DB CSV + StyleModel → 저장소 디렉터리 생성
+
+    Args:
+        is_valid: 정리된 종목명 → 분석 가능 여부 (is_valid_stock_for_analysis)
+    """
+    if style_model is None:
+        style_model = load_style_model(MODEL_DIR)
+    universe = build_universe_snapshot(read_stock_db(csv_path), style_model, is_valid)
+    arrays = universe.all
+
+    columns = {
+        "codes": arrays.codes.astype(str),
+        "names": arrays.names.astype(str),
+        "features": arrays.features.astype(np.float32),
+        "scaled": arrays.scaled,
+        "row_norms": arrays.row_norms,
+        "clusters": arrays.clusters,
+        "growth": arrays.growth,
+        "stability": arrays.stability,
+        "code_rank": arrays.code_rank,
+        "valid": universe.valid,
+    }
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    for name in _ARRAYS:
+        np.save(store_dir / f"{name}.npy", np.ascontiguousarray(columns[name]))
+
+    manifest = {
+        "format": STORE_FORMAT,
+        "rows": len(arrays),
+        "feature_columns": FEATURE_COLUMNS,
+        "source_file": Path(csv_path).name,
+        "source_digest": file_digest(csv_path),
+        "model_digest": model_digest(style_model),
+    }
+    # manifest 는 마지막에 쓴다 — 중간에 실패하면 이전 manifest와 해시가 맞지 않아 CSV로 대체됨
+    (store_dir / MANIFEST_FILE).write_text(
+        json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return store_dir
+
+
+def load_universe_store(
+    style_model: StyleModel,
+    is_valid: Callable[[str], bool],
+    csv_path: Path = DATA_DIR / STOCK_DB_FILE,
+    store_dir: Path = STORE_DIR,
+):
+    """
+    저장소를 메모리 매핑으로 읽어 (stock_db, UniverseSnapshot) 반환
+
+    - 저장소가 없거나, 원본 CSV / 모델 해시가 manifest와 다르면 None
+    - 원본 CSV가 없으면(저장소만 배포) 모델 해시만 확인
+    - 필터 규칙이 바뀌어 분석 가능 여부가 달라졌으면 종목명으로 다시 계산
+    """
+    manifest_path = store_dir / MANIFEST_FILE
+    if not manifest_path.exists():
+        return None
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    if manifest.get("format") != STORE_FORMAT:
+        logger.warning("유니버스 저장소 형식이 달라 CSV에서 로드합니다")
+        return None
+    if Path(csv_path).exists() and manifest.get("source_digest") != file_digest(csv_path):
+        logger.warning("유니버스 저장소가 %s 보다 오래되어 CSV에서 로드합니다", Path(csv_path).name)
+        return None
+    if manifest.get("model_digest") != model_digest(style_model):
+        logger.warning("유니버스 저장소가 현재 모델과 맞지 않아 CSV에서 로드합니다")
+        return None
+
+    # np.asarray: memmap 서브클래스 대신 같은 매핑을 보는 일반 ndarray 뷰 (연산 오버헤드 없음)
+    columns = {
+        name: np.asarray(np.load(store_dir / f"{name}.npy", mmap_mode="r"))
+        for name in _ARRAYS
+    }
+
+    arrays = UniverseArrays(
+        codes=columns["codes"],
+        names=columns["names"],
+        features=columns["features"],
+        scaled=columns["scaled"],
+        row_norms=columns["row_norms"],
+        clusters=columns["clusters"],
+        growth=columns["growth"],
+        stability=columns["stability"],
+        code_rank=columns["code_rank"],
+    )
+    valid = np.fromiter(
+        (is_valid(name) for name in arrays.names.tolist()), dtype=bool, count=len(arrays)
+    )
+    if not np.array_equal(valid, columns["valid"]):
+        logger.info("종목 필터 규칙이 저장소와 달라 분석 가능 여부를 다시 계산했습니다")
+
+    return serving_stock_db(arrays), UniverseSnapshot(arrays, valid)
+
+
+def load_universe_csv(
+    style_model: StyleModel,
+    is_valid: Callable[[str], bool],
+    csv_path: Path = DATA_DIR / STOCK_DB_FILE,
+):
+    """저장소를 쓸 수 없을 때의 CSV 경로 — load_universe_store 와 같은 (stock_db, UniverseSnapshot) 반환"""
+    universe = build_universe_snapshot(read_stock_db(csv_path), style_model, is_valid)
+    return serving_stock_db(universe.all), universe
+
+
+def rebuild_serving_artifacts(model_dir: Path = MODEL_DIR) -> Path:
+    """
+    데이터 수집/학습 후 서빙 아티팩트 재생성 (style_model.npz → 저장소 + manifest.json)
+
+    갱신하지 않으면 manifest 해시가 맞지 않아 모든 워커가 CSV 경로로 돌아간다.
+    """
+    from app.ai_models.inference import export_style_model
+    from app.ai_models.stock_filters import is_valid_stock_for_analysis
+
+    export_style_model(model_dir)
+    return build_universe_store(is_valid_stock_for_analysis, style_model=load_style_model(model_dir))
+
+
+if __name__ == "__main__":
+    from app.ai_models.stock_filters import is_valid_stock_for_analysis
+
+    print(f"저장 완료: {build_universe_store(is_valid_stock_for_analysis)}")
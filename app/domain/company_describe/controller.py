@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from .dto import CompanyDescribeRequest, CompanyDescribeResponse
-from .service import get_company_description
+from .service import get_company_description_async
 
 router = APIRouter()
 
@@ -9,10 +9,10 @@ router = APIRouter()
 async def describe_company(request: CompanyDescribeRequest):
     """
     기업명을 받아 Gemini LLM을 활용하여 두 문장 요약을 생성합니다.
-    Redis 캐시를 사용하여 API 호출을 최소화합니다 (TTL: 3시간).
+    Redis 캐시 → 영구 저장소(company_descriptions) 순으로 조회하여 API 호출을 최소화합니다.
     """
     try:
-        description, cached = get_company_description(request.한글명)
+        description, cached = await get_company_description_async(request.한글명)
         
         return CompanyDescribeResponse(
             한글명=request.한글명,
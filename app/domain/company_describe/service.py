@@ -1,21 +1,50 @@
+import asyncio
 import os
 import time
-import redis
 from google import genai
 from google.genai.errors import APIError, ClientError
+from app.infrastructure.tiered_cache import SWRCache, TieredCache, swr_codec
+from app.infrastructure.single_flight import (
+    async_single_flight,
+    refresh_in_background,
+    single_flight,
+)
+from app.infrastructure.description_store import load_description, save_description
 
+# 기업 설명 캐시 (L1 프로세스 메모리 30분 → Redis)
+# - soft 3시간: 지나면 캐시 값을 바로 응답하고 백그라운드로 갱신
+# - hard 7일: 값이 아예 없을 때만 요청이 Gemini 응답을 기다린다
+description_cache = SWRCache(
+    TieredCache(
+        "company_desc", redis_ttl=7 * 86400, l1_ttl=1800, maxsize=2048, codec=swr_codec()
+    ),
+    soft_ttl=10800,
+)
 
-# Redis 클라이언트 초기화
-def get_redis_client():
-    """Redis 클라이언트 반환 (싱글톤 패턴)"""
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    return redis.Redis(
-        host=redis_host,
-        port=redis_port,
-        decode_responses=True,
-        socket_connect_timeout=2,
-    )
+# 종목명 → 종목코드 (영구 저장소 키), 스냅샷 버전별로 한번 만든다
+_code_index: tuple[str, dict[str, str]] | None = None
+
+
+def stock_code_for(company_name: str, snapshot=None) -> str | None:
+    """
+    종목명에 해당하는 종목코드 (없거나 여러 종목이 같은 이름이면 None)
+
+    이름은 snapshot.stock_index 의 정리된 종목명 (CSV 경로의 한글명 열은 고정폭 꼬리가 붙어 있음)
+    정리된 이름은 첫 단어만 남긴 이름이라 "CJ", "LS" 처럼 여러 종목이 겹칠 수 있다.
+    겹치는 이름은 어느 종목 설명인지 알 수 없으므로 영구 저장소를 쓰지 않는다.
+    """
+    global _code_index
+    if snapshot is None:
+        from app.ai_models.snapshot import get_snapshot
+
+        snapshot = get_snapshot()
+    if _code_index is None or _code_index[0] != snapshot.version:
+        codes_by_name: dict[str, list[str]] = {}
+        for code, entry in snapshot.stock_index.items():
+            codes_by_name.setdefault(entry.name, []).append(code)
+        unique = {name: codes[0] for name, codes in codes_by_name.items() if len(codes) == 1}
+        _code_index = (snapshot.version, unique)
+    return _code_index[1].get(company_name)
 
 
 # Gemini 클라이언트 초기화
@@ -41,36 +70,83 @@ PROMPT_TEMPLATE = """당신은 한국 주식시장의 상장 기업을 전문적
 """
 
 
+# ✅ 유료 모드: Gemini 2.5 Flash 사용 (최신 안정 버전)
+MODEL_NAME = "models/gemini-2.5-flash"
+MAX_RETRIES = 3
+
+
+def _is_retryable(error: ClientError) -> bool:
+    """429(한도초과) / 503(서버과부하) 계열 오류인지"""
+    error_str = str(error)
+    return "429" in error_str or "503" in error_str or "RESOURCE_EXHAUSTED" in error_str
+
+
+def fallback_description(company_name: str) -> str:
+    """LLM 호출이 모두 실패했을 때 응답하는 기본 설명 (캐시에 저장하지 않음)"""
+    return f"{company_name}은(는) 한국 주식시장에 상장된 기업입니다. (현재 AI 분석량이 많아 상세 정보를 불러오지 못했습니다.)"
+
+
 def get_company_description(
-    company_name: str, use_cache: bool = True
+    company_name: str, use_cache: bool = True, client=None
 ) -> tuple[str, bool]:
     """
     기업 설명을 생성합니다. (재시도 및 에러 처리 강화)
 
+    - soft TTL이 지난 설명은 바로 응답하고 백그라운드로 갱신 (stale-while-revalidate)
+    - 캐시 미스가 동시에 몰리면 한 요청만 Gemini를 호출하고 나머지는 그 결과를 기다린다.
+    - Redis 미스 → 영구 저장소(company_descriptions) → Gemini 순서로 조회 (read-through)
+    - client: Gemini 클라이언트 대체 (일괄 워밍업의 호출 수 집계/속도 제한, 테스트용 스텁)
     """
-    cache_key = f"company_desc:{company_name}"
+    cache_key = company_name
 
     # 1. 캐시 확인
-    if use_cache:
-        try:
-            cache_client = get_redis_client()
-            cached_desc = cache_client.get(cache_key)
-            if cached_desc:
-                return cached_desc, True
-        except Exception as e:
-            print(f"Redis 캐시 조회 실패 (무시): {e}")
+    if not use_cache:
+        return _generate_description(company_name, use_cache=False, client=client)
+    cached_desc, stale = description_cache.get(cache_key)
+    if cached_desc:
+        if stale:
+            refresh_in_background(
+                description_cache.redis_key(cache_key),
+                lambda: _generate_description(company_name, use_cache=True, client=client),
+            )
+        return cached_desc, True
 
-    # 2. 캐시 미스 → LLM API 호출 (재시도 로직 포함)
-    gemini_client = get_gemini_client()
+    # 2. 캐시 미스 → 같은 기업 요청은 하나로 합쳐서 영구 저장소 확인 / LLM 호출
+    def lookup():
+        description = description_cache.get(cache_key)[0]
+        return (description, True) if description else None
+
+    (description, cached), _ = single_flight(
+        description_cache.redis_key(cache_key),
+        lookup=lookup,
+        compute=lambda: _restore_or_generate(company_name, client),
+        lock_ttl=30,
+        wait_timeout=20,
+    )
+    return description, cached
+
+
+def _restore_or_generate(company_name: str, client=None) -> tuple[str, bool]:
+    """영구 저장소에 있으면 캐시에 다시 채우고, 없으면 LLM으로 생성"""
+    stock_code = stock_code_for(company_name)
+    if stock_code:
+        stored = load_description(stock_code)
+        if stored:
+            description_cache.set(company_name, stored)
+            return stored, True
+    return _generate_description(company_name, use_cache=True, client=client)
+
+
+def _generate_description(company_name: str, use_cache: bool, client=None) -> tuple[str, bool]:
+    """LLM API 호출 (재시도 로직 포함) — 성공하면 캐시에 저장"""
+    cache_key = company_name
+    gemini_client = client or get_gemini_client()
     prompt = PROMPT_TEMPLATE.format(company_name=company_name)
 
-    # ✅ 유료 모드: Gemini 2.5 Flash 사용 (최신 안정 버전)
-    model_name = "models/gemini-2.5-flash"
-    max_retries = 3
-    for attempt in range(max_retries):
+    for attempt in range(MAX_RETRIES):
         try:
             response = gemini_client.models.generate_content(
-                model=model_name,
+                model=MODEL_NAME,
                 contents=prompt,
             )
 
@@ -78,27 +154,21 @@ def get_company_description(
             if not description:
                 raise Exception("Empty response")
 
-            # 3. 캐시 저장 (TTL: 3시간)
+            # 3. 캐시 + 영구 저장소 저장
             if use_cache:
-                try:
-                    cache_client = get_redis_client()
-                    cache_client.setex(cache_key, 10800, description)
-                except Exception as e:
-                    print(f"Redis 캐시 저장 실패 (무시): {e}")
+                description_cache.set(cache_key, description)
+                stock_code = stock_code_for(company_name)
+                if stock_code:
+                    save_description(stock_code, company_name, description)
 
             return description, False
 
         except ClientError as e:
             # 429(한도초과) 또는 503(서버과부하) 등은 재시도
-            error_str = str(e)
-            if (
-                "429" in error_str
-                or "503" in error_str
-                or "RESOURCE_EXHAUSTED" in error_str
-            ):
-                if attempt < max_retries - 1:
+            if _is_retryable(e):
+                if attempt < MAX_RETRIES - 1:
                     print(
-                        f"⚠️ API 과부하/제한 ({attempt+1}/{max_retries}). 2초 후 재시도..."
+                        f"⚠️ API 과부하/제한 ({attempt+1}/{MAX_RETRIES}). 2초 후 재시도..."
                     )
                     time.sleep(2)
                     continue
@@ -109,16 +179,104 @@ def get_company_description(
 
         except Exception as e:
             print(f"❌ 알 수 없는 오류: {e}")
-            if attempt < max_retries - 1:
+            if attempt < MAX_RETRIES - 1:
                 time.sleep(1)
                 continue
             break
 
     # 4. 모든 시도 실패 시 '안전한 기본값' 리턴 (사용자에게 에러창 안 띄우기 위함)
-    fallback_text = f"{company_name}은(는) 한국 주식시장에 상장된 기업입니다. (현재 AI 분석량이 많아 상세 정보를 불러오지 못했습니다.)"
-    return fallback_text, False
+    return fallback_description(company_name), False
+
+
+# ============================================================
+# asyncio 버전 — async 엔드포인트에서 Redis/Gemini 대기 중 이벤트 루프를 막지 않음
+# ============================================================
+
+async def get_company_description_async(
+    company_name: str, use_cache: bool = True, client=None
+) -> tuple[str, bool]:
+    """
+    get_company_description 의 asyncio 버전 (같은 캐시/영구 저장소/재시도 규칙)
+
+    - Redis: redis.asyncio, Gemini: client.aio, 영구 저장소(psycopg2): asyncio.to_thread
+    - stale 값 갱신은 기존처럼 백그라운드 스레드에서 동기 경로로 진행 (client 도 그대로 전달)
+    """
+    cache_key = company_name
+
+    if not use_cache:
+        return await _generate_description_async(company_name, use_cache=False, client=client)
+    cached_desc, stale = await description_cache.get_async(cache_key)
+    if cached_desc:
+        if stale:
+            refresh_in_background(
+                description_cache.redis_key(cache_key),
+                lambda: _generate_description(company_name, use_cache=True, client=client),
+            )
+        return cached_desc, True
 
+    async def lookup():
+        description = (await description_cache.get_async(cache_key))[0]
+        return (description, True) if description else None
+
+    (description, cached), _ = await async_single_flight(
+        description_cache.redis_key(cache_key),
+        lookup=lookup,
+        compute=lambda: _restore_or_generate_async(company_name, client),
+        lock_ttl=30,
+        wait_timeout=20,
+    )
+    return description, cached
+
+
+async def _restore_or_generate_async(company_name: str, client=None) -> tuple[str, bool]:
+    stock_code = stock_code_for(company_name)
+    if stock_code:
+        stored = await asyncio.to_thread(load_description, stock_code)
+        if stored:
+            await description_cache.set_async(company_name, stored)
+            return stored, True
+    return await _generate_description_async(company_name, use_cache=True, client=client)
+
+
+async def _generate_description_async(
+    company_name: str, use_cache: bool, client=None
+) -> tuple[str, bool]:
+    """_generate_description 의 asyncio 버전 (client.aio, 재시도 대기는 asyncio.sleep)"""
+    gemini_client = client or get_gemini_client()
+    prompt = PROMPT_TEMPLATE.format(company_name=company_name)
+
+    for attempt in range(MAX_RETRIES):
+        try:
+            response = await gemini_client.aio.models.generate_content(
+                model=MODEL_NAME,
+                contents=prompt,
+            )
+
+            description = response.text.strip()
+            if not description:
+                raise Exception("Empty response")
+
+            if use_cache:
+                await description_cache.set_async(company_name, description)
+                stock_code = stock_code_for(company_name)
+                if stock_code:
+                    await asyncio.to_thread(save_description, stock_code, company_name, description)
+
+            return description, False
+
+        except ClientError as e:
+            if _is_retryable(e) and attempt < MAX_RETRIES - 1:
+                print(f"⚠️ API 과부하/제한 ({attempt+1}/{MAX_RETRIES}). 2초 후 재시도...")
+                await asyncio.sleep(2)
+                continue
+            print(f"❌ Gemini API 호출 치명적 오류: {e}")
+            break
+
+        except Exception as e:
+            print(f"❌ 알 수 없는 오류: {e}")
+            if attempt < MAX_RETRIES - 1:
+                await asyncio.sleep(1)
+                continue
+            break
 
-def get_company_description_no_cache(company_name: str) -> str:
-    description, _ = get_company_description(company_name, use_cache=False)
-    return description
+    return fallback_description(company_name), False
@@ -0,0 +1,189 @@
+"""
+기업 설명 일괄 워밍업 (종목 DB의 분석 가능 종목)
+- 이미 영구 저장소(company_descriptions)에 있는 종목은 건너뜀 → 중단 후 다시 실행하면 이어서 진행
+- Redis에 남아 있는 설명은 LLM 호출 없이 영구 저장소로만 옮김
+- 나머지는 get_company_description 으로 생성 (Redis + 영구 저장소에 저장)
+- 초당 호출 수 제한 + 동시 실행 수 제한, 진행 상황/실패/API 호출 수 출력
+
+실행:
+    python -m app.domain.company_describe.warmup --rate 2 --concurrency 4
+"""
+
+import argparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable
+
+from app.domain.company_describe.service import (
+    description_cache,
+    fallback_description,
+    get_company_description,
+    get_gemini_client,
+)
+
+
+class RateLimiter:
+    """초당 rate 회 이하로 호출 간격을 맞추는 스레드 안전 제한기"""
+
+    def __init__(self, rate: float, clock=time.monotonic, sleep=time.sleep):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next_at)
+            self._next_at = start + self.interval
+        if start > now:
+            self._sleep(start - now)
+
+
+class _CountingModels:
+    def __init__(self, models, limiter: RateLimiter, on_call: Callable[[], None]):
+        self._models = models
+        self._limiter = limiter
+        self._on_call = on_call
+
+    def generate_content(self, **kwargs):
+        self._limiter.wait()
+        self._on_call()
+        return self._models.generate_content(**kwargs)
+
+
+class MeteredClient:
+    """Gemini 클라이언트 래퍼 — generate_content 호출(재시도 포함)마다 속도 제한 + 호출 수 집계"""
+
+    def __init__(self, client, limiter: RateLimiter):
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.models = _CountingModels(client.models, limiter, self._count)
+
+    def _count(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+
+def universe_companies(snapshot=None) -> list[tuple[str, str]]:
+    """
+    분석 가능한 종목 (종목코드, 정리된 종목명)
+
+    snapshot.stock_index 의 이름을 쓴다 — CSV 경로의 한글명 열에는 고정폭 꼬리가 붙어 있어
+    그대로 쓰면 요청이 읽지 않는 캐시 키를 채우고 Gemini 호출만 낭비한다.
+    """
+    if snapshot is None:
+        from app.ai_models.snapshot import get_snapshot
+
+        snapshot = get_snapshot()
+    return [(code, entry.name) for code, entry in snapshot.stock_index.items() if entry.analyzable]
+
+
+def warm_up(
+    companies: Iterable[tuple[str, str]],
+    client,
+    done_codes: set[str],
+    save: Callable[[str, str, str], None],
+    rate: float = 2.0,
+    concurrency: int = 4,
+    limit: int = 0,
+    progress_every: int = 50,
+) -> dict:
+    """
+    기업 설명 일괄 생성
+
+    Args:
+        companies: (종목코드, 종목명) 목록
+        client: Gemini 클라이언트 (models.generate_content 제공, 테스트에서는 스텁)
+        done_codes: 이미 영구 저장된 종목코드 (건너뜀)
+        save: (종목코드, 종목명, 설명) 영구 저장 함수
+        rate: 초당 최대 LLM 호출 수
+        concurrency: 동시에 생성하는 종목 수
+        limit: 이번 실행에서 처리할 최대 종목 수 (0 = 전체)
+
+    Returns:
+        {"total", "skipped", "from_cache", "generated", "failed", "api_calls", "failures", "elapsed_sec"}
+    """
+    metered = MeteredClient(client, RateLimiter(rate))
+    companies = list(companies)
+    todo = [(code, name) for code, name in companies if code not in done_codes]
+    if limit:
+        todo = todo[:limit]
+    stats = {
+        "total": len(companies),
+        "skipped": len(companies) - len(todo),
+        "from_cache": 0,
+        "generated": 0,
+        "failed": 0,
+        "api_calls": 0,
+        "failures": [],
+    }
+    started = time.monotonic()
+
+    def run(code: str, name: str) -> str:
+        cached, _ = description_cache.get(name)
+        if cached:
+            save(code, name, cached)
+            return "from_cache"
+        description, _ = get_company_description(name, client=metered)
+        if description == fallback_description(name):
+            return "failed"
+        save(code, name, description)
+        return "generated"
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        futures = {executor.submit(run, code, name): (code, name) for code, name in todo}
+        for i, future in enumerate(as_completed(futures), 1):
+            code, name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"❌ 워밍업 실패 [{code}] {name}: {e}")
+                result = "failed"
+            stats[result] += 1
+            if result == "failed":
+                stats["failures"].append(code)
+            if i % progress_every == 0 or i == len(todo):
+                print(
+                    f"[{i}/{len(todo)}] 생성 {stats['generated']} · 캐시 {stats['from_cache']}"
+                    f" · 실패 {stats['failed']} · API 호출 {metered.calls}"
+                )
+
+    stats["api_calls"] = metered.calls
+    stats["elapsed_sec"] = round(time.monotonic() - started, 1)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=2.0, help="초당 최대 Gemini 호출 수")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 생성 수")
+    parser.add_argument("--limit", type=int, default=0, help="이번 실행에서 처리할 최대 종목 수 (0 = 전체)")
+    args = parser.parse_args()
+
+    from app.infrastructure.description_store import fetch_described_codes, upsert_company_description
+
+    done_codes = fetch_described_codes()
+    print(f"이미 저장된 설명 {len(done_codes)}개는 건너뜁니다")
+
+    stats = warm_up(
+        universe_companies(),
+        client=get_gemini_client(),
+        done_codes=done_codes,
+        save=upsert_company_description,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        limit=args.limit,
+    )
+    print(
+        f"완료: 생성 {stats['generated']} · 캐시 {stats['from_cache']} · 실패 {stats['failed']}"
+        f" · API 호출 {stats['api_calls']} · {stats['elapsed_sec']}초"
+    )
+    if stats["failures"]:
+        print(f"실패 종목 (다시 실행하면 재시도): {', '.join(stats['failures'])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+from .dto import SnapshotInfoResponse
+from app.ai_models.snapshot import get_snapshot, reload_snapshot
+
+router = APIRouter()
+
+
+@router.get("/snapshot", response_model=SnapshotInfoResponse)
+async def snapshot_info():
+    """현재 요청을 처리 중인 종목 DB/모델 스냅샷 버전"""
+    return get_snapshot().info()
+
+
+@router.post("/snapshot/reload", response_model=SnapshotInfoResponse)
+def snapshot_reload(force: bool = False):
+    """
+    종목 DB/모델 파일을 다시 읽어 스냅샷 교체 (서버 재시작 없음)
+
+    - 파일 내용이 같으면 교체하지 않는다 (force=true 면 강제 재로드)
+    - 처리 중인 요청은 이전 스냅샷으로 끝까지 처리된다
+    - 이 워커 프로세스만 교체된다 (다른 워커는 감시 스레드가 파일 변경을 감지해 교체)
+    """
+    try:
+        return reload_snapshot(force=force).info()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"스냅샷 재로드 실패: {e}")
@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class SnapshotInfoResponse(BaseModel):
+    """현재 활성 스냅샷 정보"""
+    version: str  # 데이터 + 모델 파일 내용 해시 (앞 12자리)
+    loaded_at: str  # 로드 시각 (UTC, ISO 8601)
+    stock_count: int  # 종목 DB 종목 수
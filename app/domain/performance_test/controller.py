@@ -31,14 +31,14 @@ async def compare_performance(request: PerformanceTestRequest):
     try:
         # 1. 캐시 사용 O 테스트
         print(f"[테스트 시작] 캐시 사용 O - {request.request_count}회")
-        with_cache_metrics = run_performance_test_with_cache(
+        with_cache_metrics = await run_performance_test_with_cache(
             request.company_names,
             request.request_count
         )
         
         # 2. 캐시 사용 X 테스트
         print(f"[테스트 시작] 캐시 사용 X - {request.request_count}회")
-        without_cache_metrics = run_performance_test_without_cache(
+        without_cache_metrics = await run_performance_test_without_cache(
             request.company_names,
             request.request_count
         )
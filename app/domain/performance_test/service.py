@@ -1,18 +1,15 @@
 import time
 import statistics
 from typing import List
-from ..company_describe.service import (
-    get_company_description,
-    get_company_description_no_cache,
-)
+from ..company_describe.service import get_company_description_async
 from .dto import PerformanceMetrics
 
 
-def run_performance_test_with_cache(
+async def run_performance_test_with_cache(
     company_names: List[str], request_count: int
 ) -> PerformanceMetrics:
     """
-    캐시를 사용하는 성능 테스트
+    캐시를 사용하는 성능 테스트 (/company/describe 와 같은 async 경로)
     """
     times = []
     cache_hits = 0
@@ -24,7 +21,7 @@ def run_performance_test_with_cache(
 
         start_time = time.time()
         try:
-            description, cached = get_company_description(company_name, use_cache=True)
+            description, cached = await get_company_description_async(company_name, use_cache=True)
             if cached:
                 cache_hits += 1
             else:
@@ -50,7 +47,7 @@ def run_performance_test_with_cache(
     )
 
 
-def run_performance_test_without_cache(
+async def run_performance_test_without_cache(
     company_names: List[str], request_count: int
 ) -> PerformanceMetrics:
     """
@@ -64,7 +61,7 @@ def run_performance_test_without_cache(
 
         start_time = time.time()
         try:
-            description = get_company_description_no_cache(company_name)
+            description, _ = await get_company_description_async(company_name, use_cache=False)
         except Exception as e:
             print(f"Error: {e}")
         end_time = time.time()
@@ -1,28 +1,17 @@
 import pandas as pd
 import numpy as np
-import joblib
-from pathlib import Path
 from numpy.linalg import norm
 from app.ai_models import persona_definitions as pd_data  # '근거', '철학'을 모두 임포트
 from app.ai_models.scoring import (
     cosine_similarity,
     cosine_similarity_to_score,
-    score_stock,
+    score_stocks_array,
     PERSONA_WEIGHTS,
 )
+from app.ai_models.snapshot import get_snapshot
 from .dto import PortfolioAnalyzeRequest
 
-# 모델, 스케일러, DB 로드 (절대 경로 사용)
-BASE_DIR = Path(__file__).resolve().parents[2]  # /app
-MODEL_DIR = BASE_DIR / "ai_models"
-DATA_DIR = BASE_DIR / "data"
-
-model = joblib.load(str(MODEL_DIR / "kmeans_model.pkl"))
-scaler = joblib.load(str(MODEL_DIR / "scaler.pkl"))
-# stockit_ai_features_v1.csv 사용 (3621개 종목)
-stock_db = pd.read_csv(
-    str(DATA_DIR / "stockit_ai_features_v1.csv"), dtype={"단축코드": str}
-)
+# 스케일러 + KMeans, 종목 DB는 버전 스냅샷으로 관리 (app.ai_models.snapshot)
 
 tag_mapping = {
     0: "[안정형 일반주]",
@@ -58,8 +47,9 @@ def get_portfolio_style_vector(stocks_df: pd.DataFrame):
     # 안정성 강화: NaN 값을 0으로 채움 (모델 예측 시 오류 방지)
     stocks_df[feature_columns] = stocks_df[feature_columns].fillna(0)
 
-    scaled_data = scaler.transform(stocks_df[feature_columns])
-    predicted_groups = model.predict(scaled_data)
+    style_model = get_snapshot().style_model
+    scaled_data = style_model.transform(stocks_df[feature_columns])
+    predicted_groups = style_model.predict(scaled_data)
     stocks_df["group_tag"] = predicted_groups
 
     # 투자금액 0이거나 NaN인 경우 제외 (비중 계산 오류 방지)
@@ -116,6 +106,7 @@ def analyze_portfolio(request: PortfolioAnalyzeRequest):
             }
         )
     df = pd.DataFrame(stocks_data)
+    stock_db = get_snapshot().stock_db
 
     style_vector, merged_df = get_portfolio_style_vector(df)
 
@@ -135,7 +126,7 @@ def analyze_portfolio(request: PortfolioAnalyzeRequest):
     # Spring 서버에서 전달한 종목명이 있으면 우선 사용, 없으면 DB에서 찾기
     df_with_names = pd.merge(
         merged_df,
-        stock_db[["단축코드", "한글명"]],
+        stock_db["한글명"].reset_index(),
         on="단축코드",
         how="left",
         suffixes=("", "_db"),  # Java 전달값과 DB값 구분
@@ -151,35 +142,30 @@ def analyze_portfolio(request: PortfolioAnalyzeRequest):
     df_with_names["한글명"] = df_with_names["한글명"].fillna(df_with_names["한글명_db"])
     df_with_names["한글명"] = df_with_names["한글명"].fillna("알 수 없는 종목")
 
-    stock_details = []
-    for _, row in df_with_names.iterrows():
-        if pd.notna(row["final_style_tag"]):
-            # Step 3: 종목별 멀티팩터 스코어 계산
-            cluster_vec = np.zeros(8)
-            cluster_vec[int(row["group_tag"])] = 1.0
-
-            scores = score_stock(
-                stock_features={
-                    "roe": row["ROE"],
-                    "per": row["per"],
-                    "debt_ratio": row["부채비율"],
-                    "dividend_yield": row["배당수익률"],
-                },
-                user_vector=style_vector,
-                stock_cluster_vector=cluster_vec,
-            )
+    # Step 3: 보유 종목 멀티팩터 스코어를 한번에 계산
+    scores = score_stocks_array(
+        roe=df_with_names["ROE"].to_numpy(dtype=float),
+        per=df_with_names["per"].to_numpy(dtype=float),
+        debt_ratio=df_with_names["부채비율"].to_numpy(dtype=float),
+        dividend_yield=df_with_names["배당수익률"].to_numpy(dtype=float),
+        user_vector=style_vector,
+        clusters=df_with_names["group_tag"].to_numpy(dtype=int),
+    )
 
+    stock_details = []
+    for i, row in enumerate(df_with_names.itertuples(index=False)):
+        if pd.notna(row.final_style_tag):
             stock_details.append(
                 {
-                    "stock_code": row["단축코드"],  # Spring 서버 형식으로 반환
-                    "stock_name": row["한글명"],
-                    "style_tag": row["final_style_tag"],
-                    "description": row["style_description"],
+                    "stock_code": row.단축코드,  # Spring 서버 형식으로 반환
+                    "stock_name": row.한글명,
+                    "style_tag": row.final_style_tag,
+                    "description": row.style_description,
                     "scores": {
-                        "growth_score": scores["growth_score"],
-                        "stability_score": scores["stability_score"],
-                        "similarity_score": scores["similarity_score"],
-                        "composite_score": scores["composite_score"],
+                        "growth_score": float(scores["growth_score"][i]),
+                        "stability_score": float(scores["stability_score"][i]),
+                        "similarity_score": float(scores["similarity_score"][i]),
+                        "composite_score": float(scores["composite_score"][i]),
                     },
                 }
             )
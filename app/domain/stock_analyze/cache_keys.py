@@ -0,0 +1,82 @@
+"""
+스코어링/분석 결과 캐시 키
+- 같은 결과를 내는 요청은 같은 키가 되도록 입력을 정규화한다
+  - 실수: 소수점 4자리로 양자화 (12 == 12.0 == 12.00001, -0.0 == 0.0)
+  - 포트폴리오: 투자금액 0 이하 제외, 종목코드 순 정렬, 투자금액 → 비중(합 1)
+    (유사도는 비중만 사용하므로 금액 규모가 달라도 비중이 같으면 같은 결과)
+  - 페르소나: 가중치 프리셋에 없는 이름은 기본 가중치와 같은 키
+- 엔드포인트별로 결과에 영향을 주는 입력만 키에 넣는다
+  - /stock/score 종목 단위: 종목 재무지표
+  - /stock/score 사용자 단위: 종목 재무지표 + 포트폴리오 + 페르소나
+  - /stock/analyze: 종목 재무지표만 (유사도 50 고정, 기본 가중치)
+"""
+
+import hashlib
+
+from app.ai_models.features import FEATURE_ATTRS
+from app.ai_models.scoring import PERSONA_WEIGHTS
+
+FLOAT_DECIMALS = 4
+
+
+def quantize(value: float) -> str:
+    """실수 → 고정 소수점 문자열 (nan/inf 포함)"""
+    text = f"{float(value):.{FLOAT_DECIMALS}f}"
+    return "0.0000" if text == "-0.0000" else text
+
+
+def _features_part(item) -> str:
+    return ",".join(quantize(getattr(item, attr)) for attr in FEATURE_ATTRS)
+
+
+def canonical_persona(persona: str | None) -> str:
+    """가중치 프리셋이 있는 페르소나만 구분 (없거나 모르는 이름 → 기본 가중치)"""
+    return persona if persona in PERSONA_WEIGHTS else ""
+
+
+def canonical_portfolio(portfolio_stocks) -> str:
+    """
+    보유 종목 → 순서 무관 문자열
+
+    투자금액이 0 이하인 종목은 유사도 계산에서 빠지므로 키에서도 제외한다.
+    남는 종목이 없으면 포트폴리오가 없는 것과 같은 결과(유사도 50)라 빈 문자열.
+    """
+    holdings = [s for s in (portfolio_stocks or []) if s.investment_amount > 0]
+    if not holdings:
+        return ""
+    total = sum(s.investment_amount for s in holdings)
+    parts = sorted(
+        f"{s.stock_code}:{_features_part(s)}:{quantize(s.investment_amount / total)}"
+        for s in holdings
+    )
+    return ";".join(parts)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.md5("|".join(parts).encode()).hexdigest()
+
+
+def score_cache_key(request, version: str = "") -> str:
+    """/stock/score, /stock/score/batch 결과 키"""
+    return _digest(
+        version,
+        request.stock_code,
+        _features_part(request),
+        canonical_portfolio(request.portfolio_stocks),
+        canonical_persona(request.persona),
+    )
+
+
+def portfolio_cache_key(portfolio_stocks, version: str = "") -> str:
+    """포트폴리오 지문 (보유 종목 순서/금액 규모와 무관) — 포트폴리오 벡터 캐시 키"""
+    return _digest(version, canonical_portfolio(portfolio_stocks))
+
+
+def intrinsic_cache_key(request, version: str = "") -> str:
+    """종목 단위(사용자 무관) 결과 키 — 종목코드 + 재무지표"""
+    return _digest(version, request.stock_code, _features_part(request))
+
+
+def analyze_cache_key(request, version: str = "") -> str:
+    """/stock/analyze 결과 키 (포트폴리오/페르소나는 결과에 영향 없음)"""
+    return intrinsic_cache_key(request, version)
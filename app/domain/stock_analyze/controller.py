@@ -1,18 +1,29 @@
-import asyncio
 import json
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
-from .dto import StockAnalyzeRequest, StockAnalyzeResponse, ReportStreamRequest
-from .recommend_dto import RecommendRequest, RecommendResponse
-from .service import analyze_stock, recommend_stocks, score_stock_only
+from .dto import (
+    StockAnalyzeRequest, StockAnalyzeResponse, ReportStreamRequest, StockScoreBatchRequest,
+)
+from .recommend_dto import (
+    RecommendRequest, RecommendResponse, MultiPersonaRecommendRequest, MultiPersonaRecommendResponse,
+)
+from .service import (
+    analyze_stock_async, recommend_stocks, recommend_stocks_all_personas, score_stock_only, score_stocks_batch,
+)
 
 router = APIRouter()
 
 
 @router.post("/analyze", response_model=StockAnalyzeResponse, response_model_by_alias=False)
-def stock_analyze_endpoint(request: StockAnalyzeRequest):
-    return analyze_stock(request)
+async def stock_analyze_endpoint(request: StockAnalyzeRequest):
+    """
+    스타일 분석 + 뉴스 RAG + AI 리포트
+
+    네트워크 단계(뉴스 검색, 임베딩, pgvector, Gemini)를 비동기로 기다리므로
+    스레드풀 워커를 점유하지 않는다.
+    """
+    return await analyze_stock_async(request)
 
 
 @router.post("/score")
@@ -26,6 +37,17 @@ def stock_score_endpoint(request: StockAnalyzeRequest):
     return score_stock_only(request)
 
 
+@router.post("/score/batch")
+def stock_score_batch_endpoint(request: StockScoreBatchRequest):
+    """
+    여러 종목 빠른 스코어링 — 목록 화면용 (/stock/score 의 배치 버전)
+
+    포트폴리오/페르소나는 배치 전체가 공유하며,
+    결과는 요청한 종목 순서대로 반환한다.
+    """
+    return {"results": score_stocks_batch(request)}
+
+
 @router.post("/report/stream")
 async def stock_report_stream_endpoint(request: ReportStreamRequest):
     """
@@ -37,21 +59,13 @@ async def stock_report_stream_endpoint(request: ReportStreamRequest):
       data: {"type": "done"}                          ← 완료
     """
     async def event_generator():
-        # 1. 뉴스 수집 + RAG (sync → thread pool)
+        # 1. 뉴스 수집 + RAG (쿼리 임베딩은 수집과 동시에 → 검색)
         news_list = []
         try:
-            from app.infrastructure.news_pipeline import collect_and_store_news
-            from app.infrastructure.gemini_embedding_client import embed_text
-            from app.infrastructure.pgvector_client import search_similar_news
+            from app.infrastructure.news_pipeline import retrieve_news_async
 
-            await asyncio.to_thread(
-                collect_and_store_news, request.stock_code, request.stock_name, 10
-            )
-            query_vec = await asyncio.to_thread(
-                embed_text, f"{request.stock_name} 투자 분석"
-            )
-            news_list = await asyncio.to_thread(
-                search_similar_news, request.stock_code, query_vec, 5, 30
+            news_list = await retrieve_news_async(
+                request.stock_code, request.stock_name, display=10, top_k=5, days=30
             )
             yield f"data: {json.dumps({'type': 'news_ready', 'count': len(news_list)}, ensure_ascii=False)}\n\n"
         except Exception as e:
@@ -95,3 +109,14 @@ def stock_recommend_endpoint(request: RecommendRequest):
     3,600+ 종목을 멀티팩터 스코어링하여 Top N 추천
     """
     return recommend_stocks(request)
+
+
+@router.post("/recommend/personas", response_model=MultiPersonaRecommendResponse)
+def stock_recommend_personas_endpoint(request: MultiPersonaRecommendRequest):
+    """
+    모든 페르소나 탭의 추천을 한번에 반환
+
+    기본 가중치 + 8개 페르소나 가중치로 전 종목을 한번에 스코어링하여
+    페르소나별 Top N을 반환 (탭마다 /recommend 를 호출하지 않아도 됨)
+    """
+    return recommend_stocks_all_personas(request)
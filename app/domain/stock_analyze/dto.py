@@ -43,6 +43,18 @@ class StockAnalyzeRequest(BaseModel):
         populate_by_name = True  # 한글 필드명과 영문 필드명 둘 다 허용
 
 
+class StockScoreBatchRequest(BaseModel):
+    """
+    여러 종목 빠른 스코어링 요청 (/stock/score/batch)
+
+    포트폴리오/페르소나는 배치 전체가 공유한다.
+    (개별 항목의 portfolio_stocks/persona는 무시하고 공유 값으로 덮어씀)
+    """
+    stocks: List[StockAnalyzeRequest] = Field(..., description="스코어링할 종목 리스트", max_length=200)
+    portfolio_stocks: Optional[List[PortfolioStock]] = None
+    persona: Optional[str] = None
+
+
 class ScoreDetail(BaseModel):
     """멀티팩터 스코어링 결과 (Step 3)"""
     growth_score: float = Field(..., description="성장성 점수 (0~100)")
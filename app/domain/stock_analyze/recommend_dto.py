@@ -37,3 +37,21 @@ class RecommendResponse(BaseModel):
     persona: Optional[str] = Field(None, description="적용된 페르소나")
     total_scored: int = Field(..., description="스코어링 대상 총 종목 수")
     recommendations: List[RecommendStockResult]
+
+
+class MultiPersonaRecommendRequest(BaseModel):
+    """전체 페르소나 추천 요청 DTO (페르소나 탭 한번에 조회)"""
+    stocks: List[RecommendStock] = Field(..., description="사용자 보유 종목 리스트")
+    top_n: int = Field(10, description="페르소나별 추천 종목 수", ge=1, le=50)
+
+
+class PersonaRecommendations(BaseModel):
+    """페르소나 하나의 추천 결과"""
+    persona: Optional[str] = Field(None, description="페르소나 이름 (None: 기본 가중치)")
+    recommendations: List[RecommendStockResult]
+
+
+class MultiPersonaRecommendResponse(BaseModel):
+    """전체 페르소나 추천 응답 DTO"""
+    total_scored: int = Field(..., description="스코어링 대상 총 종목 수")
+    personas: List[PersonaRecommendations]
@@ -1,33 +1,34 @@
-import pandas as pd
 import numpy as np
-import joblib
-import json
-import hashlib
-import os
-import redis
-import re
-from pathlib import Path
 from numpy.linalg import norm
-from .dto import StockAnalyzeRequest, StockAnalyzeResponse
+from .dto import StockAnalyzeRequest, StockAnalyzeResponse, StockScoreBatchRequest
 from app.ai_models.scoring import (
     growth_score, stability_score, composite_score, DEFAULT_WEIGHTS,
-    PERSONA_WEIGHTS, score_all_stocks, compute_user_feature_vector,
-    cosine_similarity as cos_sim, cosine_similarity_to_score,
+    PERSONA_WEIGHTS, recommend_from_universe, recommend_from_universe_all_personas,
+    cosine_similarity_rows, cosine_similarity_to_score_array,
+    growth_score_array, stability_score_array, composite_score_array,
+    cluster_cosine_similarity, _round2,
 )
-from .recommend_dto import RecommendRequest
-
+from app.ai_models.snapshot import get_snapshot
+from app.ai_models.stock_filters import (
+    REASON_MESSAGES, REASON_NOT_IN_DB, UNKNOWN_STOCK_NAME,
+)
+from app.infrastructure.tiered_cache import SWRCache, TieredCache, swr_codec
+from app.infrastructure.single_flight import (
+    async_single_flight, refresh_in_background, refresh_in_background_async, single_flight,
+)
+from .cache_keys import (
+    score_cache_key, analyze_cache_key, intrinsic_cache_key,
+    portfolio_cache_key, canonical_portfolio,
+)
+from app.ai_models.features import (
+    feature_matrix, raw_feature_matrix, sanitize_features, portfolio_vectors,
+    PER, ROE, DEBT_RATIO, DIVIDEND_YIELD,
+)
+from .recommend_dto import RecommendRequest, MultiPersonaRecommendRequest
 
-# 모델, 스케일러, DB 로드 (절대 경로 사용)
-BASE_DIR = Path(__file__).resolve().parents[2]  # /app
-MODEL_DIR = BASE_DIR / "ai_models"
-DATA_DIR = BASE_DIR / "data"
 
-model = joblib.load(str(MODEL_DIR / "kmeans_model.pkl"))
-scaler = joblib.load(str(MODEL_DIR / "scaler.pkl"))
-# stockit_ai_features_v1.csv 사용 (3621개 종목)
-stock_db = pd.read_csv(
-    str(DATA_DIR / "stockit_ai_features_v1.csv"), dtype={"단축코드": str}
-).set_index("단축코드")
+# 종목 DB, 스케일러 + KMeans, 추천용 유니버스는 버전 스냅샷으로 관리 (무중단 재로드)
+# → 요청마다 get_snapshot()으로 한번 잡아서 끝까지 같은 버전을 사용
 
 
 tag_mapping = {
@@ -54,222 +55,274 @@ description_mapping = {
 }
 
 
-# Redis 클라이언트 초기화
-def get_redis_client():
-    """Redis 클라이언트 반환"""
-    redis_host = os.getenv("REDIS_HOST", "localhost")
-    redis_port = int(os.getenv("REDIS_PORT", "6379"))
-    return redis.Redis(
-        host=redis_host,
-        port=redis_port,
-        decode_responses=True,
-        socket_connect_timeout=2,
-    )
+# 결과 캐시 (L1 프로세스 메모리 5분 → Redis 1시간)
+# - intrinsic_cache: 종목 + 재무지표 단위 (사용자 무관 — 이름/필터/클러스터/성장성/안정성)
+# - user_score_cache: 종목 + 포트폴리오 + 페르소나 단위 [유사도, 종합 점수]
+intrinsic_cache = TieredCache("stock_intrinsic", redis_ttl=3600, l1_ttl=300, maxsize=8192)
+user_score_cache = TieredCache("stock_score_user", redis_ttl=3600, l1_ttl=300, maxsize=16384)
+# 포트폴리오 지문 → (피처 벡터, 클러스터 벡터) — 보유 종목 + 모델 버전에만 의존하므로 길게 보관
+portfolio_vector_cache = TieredCache("portfolio_vec", redis_ttl=86400, l1_ttl=1800, maxsize=4096)
+# 분석 리포트: soft 1시간이 지나면 이전 리포트를 바로 응답하고 백그라운드로 갱신 (hard 6시간)
+analyze_cache = SWRCache(
+    TieredCache("stock_analyze", redis_ttl=6 * 3600, l1_ttl=300, maxsize=1024, codec=swr_codec()),
+    soft_ttl=3600,
+)
 
 
-def generate_cache_key(request: StockAnalyzeRequest) -> str:
-    """요청 데이터로 캐시 키 생성 (재무 지표 + 포트폴리오 + 페르소나 포함)"""
-    data_str = f"{request.stock_code}:{request.market_cap}:{request.per}:{request.pbr}:{request.roe}:{request.debt_ratio}:{request.dividend_yield}"
-    # 포트폴리오 + 페르소나가 있으면 캐시 키에 포함 (다른 유저 = 다른 캐시)
-    if request.portfolio_stocks:
-        portfolio_str = ",".join(f"{s.stock_code}:{s.investment_amount}" for s in request.portfolio_stocks)
-        data_str += f":{portfolio_str}"
-    if request.persona:
-        data_str += f":{request.persona}"
-    hash_key = hashlib.md5(data_str.encode()).hexdigest()
-    return f"stock_analyze:{hash_key}"
+def _unanalyzable_score_result(stock_code: str, stock_name: str, reason: str) -> dict:
+    """/stock/score 분석 불가 응답 (reason: 사유 코드)"""
+    return {
+        "stock_code": stock_code,
+        "stock_name": stock_name,
+        "final_style_tag": None,
+        "style_description": None,
+        "analyzable": False,
+        "reason": REASON_MESSAGES[reason],
+        "scores": None,
+    }
 
 
-def is_valid_stock_for_analysis(stock_name: str) -> bool:
+def _cached_portfolio_vectors(snapshot, holdings, use_cache: bool = True) -> tuple:
     """
-    스타일 태그 생성이 가능한 종목인지 검증
+    보유 종목 → (6차원 피처 벡터, 8차원 클러스터 벡터), 포트폴리오 지문 단위 캐시
 
-    Returns:
-        True: 분석 가능 (정상 종목)
-        False: 분석 불가 (SPAC, 우선주, 인버스 등)
+    같은 포트폴리오로 여러 종목을 조회하는 동안 스케일링/클러스터 예측을 반복하지 않는다.
     """
-    if not stock_name or stock_name == "알 수 없는 종목":
-        return False
-
-    # 1. 우선주 필터링
-    if "(우)" in stock_name:
-        return False
-    # "숫자+우" 또는 "숫자+우+영문" 패턴 (예: 1우, 2우B, 3우C)
-    if re.search(r"\d+우[A-Z]?$", stock_name):
-        return False
-    # 종목명 끝이 "우"로 끝나는 경우 (예: SK텔레콤우, LG화학우)
-    if stock_name.endswith("우"):
-        return False
-
-    # 2. SPAC 필터링
-    if "스팩" in stock_name or "SPAC" in stock_name.upper():
-        return False
-
-    # 3. 인버스/레버리지 필터링
-    if "인버스" in stock_name or "레버리지" in stock_name:
-        return False
-
-    # 4. 홀딩스/지주 필터링 (선택적 - 필요시 주석 해제)
-    # if "홀딩스" in stock_name or "홀딩" in stock_name or "지주" in stock_name:
-    #     return False
-
-    return True
-
-
-def get_unanalyzable_reason(stock_name: str, in_db: bool = True) -> str:
-    """분석 불가 사유 생성"""
-    if not in_db:
-        return "이 종목은 AI 학습 데이터에 포함되지 않아 투자 스타일 분석이 불가능합니다. 포트폴리오 분석을 위해 다른 종목을 선택해주세요."
-
-    if "(우)" in stock_name or re.search(r"\d+우[A-Z]?$", stock_name):
-        return "이 종목은 우선주로 분류되어 투자 스타일 분석이 불가능합니다. 포트폴리오 분석을 위해 보통주를 선택해주세요."
-    elif "스팩" in stock_name or "SPAC" in stock_name.upper():
-        return "이 종목은 SPAC(기업인수목적회사)으로 투자 스타일 분석이 불가능합니다."
-    elif "인버스" in stock_name or "레버리지" in stock_name:
-        return "이 종목은 인버스/레버리지 상품으로 투자 스타일 분석이 불가능합니다."
-    elif "홀딩스" in stock_name or "홀딩" in stock_name or "지주" in stock_name:
-        return "이 종목은 지주회사로 투자 스타일 분석이 불가능합니다."
-    else:
-        return (
-            "이 종목은 AI 학습 데이터에 포함되지 않아 투자 스타일 분석이 불가능합니다."
-        )
+    if not canonical_portfolio(holdings):
+        return None, None  # 투자금액이 있는 종목 없음 → 벡터 없음
+    key = portfolio_cache_key(holdings, snapshot.version)
+    if use_cache:
+        cached = portfolio_vector_cache.get(key)
+        if cached is not None:
+            return (
+                None if cached["feature"] is None else np.array(cached["feature"]),
+                None if cached["cluster"] is None else np.array(cached["cluster"]),
+            )
 
+    user_feature_vec, user_cluster_vec = portfolio_vectors(holdings, snapshot.style_model)
+    if use_cache:
+        portfolio_vector_cache.set(key, {
+            "feature": None if user_feature_vec is None else user_feature_vec.tolist(),
+            "cluster": None if user_cluster_vec is None else user_cluster_vec.tolist(),
+        })
+    return user_feature_vec, user_cluster_vec
 
-def score_stock_only(request: StockAnalyzeRequest, use_cache: bool = True) -> dict:
+
+def _compute_portfolio_vectors(snapshot, portfolio_stocks, use_cache: bool = True) -> tuple:
     """
-    빠른 스코어링만 수행 — 뉴스/LLM 없음 (< 1초 목표)
+    포트폴리오 → (6차원 피처 벡터, 8차원 클러스터 벡터)
 
-    /stock/score 엔드포인트용.
-    프론트는 이 결과를 먼저 보여주고, 이후 /stock/report/stream 으로
-    AI 리포트를 스트리밍 받는다.
+    둘 중 하나라도 계산할 수 없으면 (None, None) — 유사도는 중립값(50) 사용
     """
-    cache_prefix = "stock_score"
+    try:
+        user_feature_vec, user_cluster_vec = _cached_portfolio_vectors(
+            snapshot, portfolio_stocks, use_cache
+        )
+    except Exception as e:
+        print(f"포트폴리오 벡터 계산 실패 (기본값 50 사용): {e}")
+        return None, None
 
-    # 1. 캐시 확인
-    if use_cache:
-        try:
-            cache_client = get_redis_client()
-            cache_key = f"{cache_prefix}:{generate_cache_key(request)}"
-            cached = cache_client.get(cache_key)
-            if cached:
-                return json.loads(cached)
-        except Exception as e:
-            print(f"Redis 캐시 조회 실패 (무시): {e}")
-
-    # 2. AI DB 존재 확인
-    if request.stock_code not in stock_db.index:
-        return {
-            "stock_code": request.stock_code,
-            "stock_name": "알 수 없는 종목",
-            "final_style_tag": None,
-            "style_description": None,
-            "analyzable": False,
-            "reason": get_unanalyzable_reason("", in_db=False),
-            "scores": None,
-        }
+    if user_feature_vec is None or user_cluster_vec is None:
+        return None, None
+    return user_feature_vec, user_cluster_vec
 
-    # 3. 종목명 조회
-    try:
-        stock_name_full = stock_db.loc[request.stock_code]["한글명"]
-        stock_name = str(stock_name_full).split()[0] if stock_name_full else "알 수 없는 종목"
-    except KeyError:
-        stock_name = "알 수 없는 종목"
 
-    # 4. SPAC/우선주 필터링
-    if not is_valid_stock_for_analysis(stock_name):
-        return {
-            "stock_code": request.stock_code,
-            "stock_name": stock_name,
-            "final_style_tag": None,
-            "style_description": None,
-            "analyzable": False,
-            "reason": get_unanalyzable_reason(stock_name, in_db=True),
-            "scores": None,
+def _intrinsic_entries(snapshot, requests: list) -> list:
+    """
+    사용자와 무관한 종목 단위 결과 (종목 + 재무지표가 같으면 누구에게나 같은 값)
+
+    - 분석 불가 종목: /stock/score 응답 그대로 (analyzable=False)
+    - 분석 가능 종목: 종목명, 클러스터, 성장성/안정성 점수, 스케일링된 6차원 피처
+      (분석 가능 종목은 한번의 스케일링/클러스터 예측으로 일괄 계산)
+    """
+    entries = [None] * len(requests)
+    pending, pending_names, pending_idx = [], [], []
+    for i, request in enumerate(requests):
+        # AI DB 존재 + SPAC/우선주 필터링 결과는 스냅샷 종목 인덱스에 미리 계산되어 있음
+        stock = snapshot.lookup(request.stock_code)
+        if stock is None:
+            entries[i] = _unanalyzable_score_result(request.stock_code, UNKNOWN_STOCK_NAME, REASON_NOT_IN_DB)
+            continue
+        if not stock.analyzable:
+            entries[i] = _unanalyzable_score_result(request.stock_code, stock.name, stock.reason)
+            continue
+        pending.append(request)
+        pending_names.append(stock.name)
+        pending_idx.append(i)
+
+    if not pending:
+        return entries
+
+    # KMeans + 성장성/안정성 스코어링
+    raw = raw_feature_matrix(pending)
+    scaled = snapshot.style_model.transform(sanitize_features(raw))
+    pred_groups = snapshot.style_model.predict(scaled)
+    g_scores = growth_score_array(raw[:, ROE], raw[:, PER])
+    s_scores = stability_score_array(raw[:, DEBT_RATIO], raw[:, DIVIDEND_YIELD])
+
+    for j, i in enumerate(pending_idx):
+        entries[i] = {
+            "stock_code": pending[j].stock_code,
+            "stock_name": pending_names[j],
+            "analyzable": True,
+            "cluster": int(pred_groups[j]),
+            "growth_score": float(g_scores[j]),
+            "stability_score": float(s_scores[j]),
+            "scaled": scaled[j].tolist(),
         }
+    return entries
 
-    # 5. KMeans + 멀티팩터 스코어링
-    df = pd.DataFrame([{
-        "단축코드": request.stock_code,
-        "시가총액": request.market_cap,
-        "per": request.per,
-        "pbr": request.pbr,
-        "ROE": request.roe,
-        "부채비율": request.debt_ratio,
-        "배당수익률": request.dividend_yield,
-    }])
-    features = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
-    df[features] = df[features].replace([np.inf, -np.inf], np.nan).fillna(0)
-    scaled = scaler.transform(df[features])
-    pred_group = model.predict(scaled)[0]
-
-    g_score = growth_score(roe=request.roe, per=request.per)
-    s_score = stability_score(debt_ratio=request.debt_ratio, dividend_yield=request.dividend_yield)
-
-    # 유사도 계산: 포트폴리오가 있으면 실제 계산, 없으면 50.0 (중립)
-    sim_score = 50.0
-    if request.portfolio_stocks and len(request.portfolio_stocks) > 0:
-        try:
-            from app.domain.portfolio_analyze.service import get_portfolio_style_vector
-
-            # 유저 6차원 피처 벡터 (가중평균)
-            stocks_data = [{
-                "market_cap": s.market_cap, "per": s.per, "pbr": s.pbr,
-                "roe": s.roe, "debt_ratio": s.debt_ratio,
-                "dividend_yield": s.dividend_yield,
-                "investment_amount": s.investment_amount,
-            } for s in request.portfolio_stocks]
-            user_feature_vec = compute_user_feature_vector(stocks_data, scaler)
-
-            # 유저 8차원 클러스터 벡터
-            portfolio_df = pd.DataFrame([{
-                "단축코드": s.stock_code, "시가총액": s.market_cap,
-                "per": s.per, "pbr": s.pbr, "ROE": s.roe,
-                "부채비율": s.debt_ratio, "배당수익률": s.dividend_yield,
-                "투자금액": s.investment_amount,
-            } for s in request.portfolio_stocks])
-            user_cluster_vec, _ = get_portfolio_style_vector(portfolio_df)
-
-            # 종목의 클러스터 벡터 (one-hot)
-            stock_cluster_vec = np.zeros(8)
-            stock_cluster_vec[pred_group] = 1.0
-
-            # 2단계 유사도: 피처(70%) + 클러스터(30%)
-            feature_sim = cosine_similarity_to_score(cos_sim(user_feature_vec, scaled[0]))
-            cluster_sim = cosine_similarity_to_score(cos_sim(user_cluster_vec, stock_cluster_vec))
-            sim_score = feature_sim * 0.7 + cluster_sim * 0.3
-        except Exception as e:
-            print(f"유사도 계산 실패 (기본값 50 사용): {e}")
-            sim_score = 50.0
+
+def _user_scores(
+    entries: list,
+    user_feature_vec: np.ndarray = None,
+    user_cluster_vec: np.ndarray = None,
+    persona: str = None,
+) -> list:
+    """
+    분석 가능 종목의 사용자 의존 점수 → [유사도, 종합 점수] 리스트
+
+    유사도 = 피처 유사도(70%) + 클러스터 유사도(30%),
+    포트폴리오 벡터가 없으면 중립값(50) 사용
+    """
+    g_scores = np.array([e["growth_score"] for e in entries], dtype=float)
+    s_scores = np.array([e["stability_score"] for e in entries], dtype=float)
+
+    if user_feature_vec is not None and user_cluster_vec is not None:
+        scaled = np.array([e["scaled"] for e in entries], dtype=float)
+        pred_groups = np.array([e["cluster"] for e in entries], dtype=int)
+        feature_sim = cosine_similarity_to_score_array(
+            cosine_similarity_rows(scaled, user_feature_vec)
+        )
+        cluster_sim = cosine_similarity_to_score_array(
+            cluster_cosine_similarity(user_cluster_vec, pred_groups)
+        )
+        sim_scores = feature_sim * 0.7 + cluster_sim * 0.3
+    else:
+        sim_scores = np.full(len(entries), 50.0)
 
     # 페르소나 가중치 적용
-    weights = PERSONA_WEIGHTS.get(request.persona, DEFAULT_WEIGHTS) if request.persona else DEFAULT_WEIGHTS
-    c_score = composite_score(sim_score, g_score, s_score, weights)
+    weights = PERSONA_WEIGHTS.get(persona, DEFAULT_WEIGHTS) if persona else DEFAULT_WEIGHTS
+    c_scores = composite_score_array(sim_scores, g_scores, s_scores, weights)
+    sim_rounded = _round2(sim_scores)
+    return [[float(sim), float(c)] for sim, c in zip(sim_rounded, c_scores)]
 
-    result = {
-        "stock_code": request.stock_code,
-        "stock_name": stock_name,
-        "final_style_tag": tag_mapping[pred_group],
-        "style_description": description_mapping[pred_group],
+
+def _score_result(entry: dict, user_scores: list) -> dict:
+    """종목 단위 결과 + [유사도, 종합 점수] → /stock/score 응답"""
+    cluster = entry["cluster"]
+    similarity, composite = user_scores
+    return {
+        "stock_code": entry["stock_code"],
+        "stock_name": entry["stock_name"],
+        "final_style_tag": tag_mapping[cluster],
+        "style_description": description_mapping[cluster],
         "analyzable": True,
         "reason": None,
         "scores": {
-            "growth_score": g_score,
-            "stability_score": s_score,
-            "similarity_score": round(sim_score, 2),
-            "composite_score": c_score,
+            "growth_score": entry["growth_score"],
+            "stability_score": entry["stability_score"],
+            "similarity_score": similarity,
+            "composite_score": composite,
         },
     }
 
-    # 캐시 저장 (TTL: 1시간)
+
+def _score_requests(snapshot, items: list, portfolio_stocks, persona, use_cache: bool) -> list:
+    """
+    2단계 캐시 스코어링 (단건/배치 공통)
+
+    1) 종목 단위 캐시 (intrinsic_cache): 종목 + 재무지표 → 종목명/필터/클러스터/성장성/안정성
+    2) 사용자 단위 캐시 (user_score_cache): 종목 + 포트폴리오 + 페르소나 → [유사도, 종합 점수]
+    캐시 미스는 각각 한번의 배열 계산으로 채운다. (포트폴리오 벡터는 필요할 때 한번만 계산)
+    """
+    intrinsic_keys = [intrinsic_cache_key(item, snapshot.version) for item in items]
+    entries = intrinsic_cache.get_many(intrinsic_keys) if use_cache else [None] * len(items)
+
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    if missing:
+        computed = _intrinsic_entries(snapshot, [items[i] for i in missing])
+        for i, entry in zip(missing, computed):
+            entries[i] = entry
+        if use_cache:
+            intrinsic_cache.set_many([(intrinsic_keys[i], entries[i]) for i in missing])
+
+    results = [None] * len(items)
+    analyzable_idx = []
+    for i, entry in enumerate(entries):
+        if entry["analyzable"]:
+            analyzable_idx.append(i)
+        else:
+            results[i] = entry
+    if not analyzable_idx:
+        return results
+
+    user_keys = {i: score_cache_key(items[i], snapshot.version) for i in analyzable_idx}
     if use_cache:
-        try:
-            cache_client = get_redis_client()
-            cache_key = f"{cache_prefix}:{generate_cache_key(request)}"
-            cache_client.setex(cache_key, 3600, json.dumps(result, ensure_ascii=False))
-        except Exception as e:
-            print(f"Redis 캐시 저장 실패 (무시): {e}")
+        cached = user_score_cache.get_many([user_keys[i] for i in analyzable_idx])
+    else:
+        cached = [None] * len(analyzable_idx)
+    user_scores = dict(zip(analyzable_idx, cached))
+
+    missing = [i for i in analyzable_idx if user_scores[i] is None]
+    if missing:
+        # 유사도 계산: 포트폴리오가 있으면 실제 계산, 없으면 50.0 (중립)
+        user_feature_vec, user_cluster_vec = _compute_portfolio_vectors(
+            snapshot, portfolio_stocks, use_cache
+        )
+        computed = _user_scores(
+            [entries[i] for i in missing], user_feature_vec, user_cluster_vec, persona
+        )
+        for i, scores in zip(missing, computed):
+            user_scores[i] = scores
+        if use_cache:
+            user_score_cache.set_many([(user_keys[i], user_scores[i]) for i in missing])
+
+    for i in analyzable_idx:
+        results[i] = _score_result(entries[i], user_scores[i])
+    return results
 
-    return result
+
+def score_stock_only(request: StockAnalyzeRequest, use_cache: bool = True) -> dict:
+    """
+    빠른 스코어링만 수행 — 뉴스/LLM 없음 (< 1초 목표)
+
+    /stock/score 엔드포인트용.
+    프론트는 이 결과를 먼저 보여주고, 이후 /stock/report/stream 으로
+    AI 리포트를 스트리밍 받는다.
+    """
+    snapshot = get_snapshot()
+    return _score_requests(
+        snapshot, [request], request.portfolio_stocks, request.persona, use_cache
+    )[0]
+
+
+def score_stocks_batch(request: StockScoreBatchRequest, use_cache: bool = True) -> list:
+    """
+    여러 종목 빠른 스코어링 (/stock/score/batch)
+
+    - 캐시 키는 /stock/score 와 동일 → 캐시 공유 (L1 미스만 Redis MGET)
+    - 포트폴리오 벡터는 배치당 한번만 계산
+    - 캐시 미스 종목은 한번의 스케일링/클러스터 예측으로 스코어링
+
+    Returns:
+        요청 순서와 같은 순서의 score_stock_only 결과 리스트
+    """
+    snapshot = get_snapshot()
+
+    # 공유 포트폴리오/페르소나 적용 (단건 요청과 같은 캐시 키를 쓰기 위함)
+    items = [
+        s.model_copy(update={
+            "portfolio_stocks": request.portfolio_stocks,
+            "persona": request.persona,
+        })
+        for s in request.stocks
+    ]
+    if not items:
+        return []
+    return _score_requests(
+        snapshot, items, request.portfolio_stocks, request.persona, use_cache
+    )
 
 
 def analyze_stock(request: StockAnalyzeRequest, use_cache: bool = True):
@@ -286,100 +339,84 @@ def analyze_stock(request: StockAnalyzeRequest, use_cache: bool = True):
         - analyzable: True → 정상 분석 가능 (포트폴리오 분석 가능)
         - analyzable: False → 분석 불가 (SPAC, 우선주 등) → 매수 차단
     """
+    snapshot = get_snapshot()
+    cache_key = analyze_cache_key(request, snapshot.version)
+
     # ===== 1. 캐시 확인 =====
+    if not use_cache:
+        return _analyze_uncached(snapshot, request, cache_key, use_cache=False)
+    cached_result, stale = analyze_cache.get(cache_key)
+    if cached_result:
+        if stale:
+            refresh_in_background(
+                analyze_cache.redis_key(cache_key),
+                lambda: _analyze_uncached(snapshot, request, cache_key, use_cache=True),
+            )
+        return cached_result
+
+    # 캐시 미스가 동시에 몰리면 한 요청만 뉴스 수집 + 리포트 생성, 나머지는 결과 대기
+    result, _ = single_flight(
+        analyze_cache.redis_key(cache_key),
+        lookup=lambda: analyze_cache.get(cache_key)[0],
+        compute=lambda: _analyze_uncached(snapshot, request, cache_key, use_cache=True),
+        lock_ttl=60,
+        wait_timeout=45,
+    )
+    return result
+
+
+def _analyze_uncached(snapshot, request: StockAnalyzeRequest, cache_key: str, use_cache: bool) -> dict:
+    """analyze_stock 캐시 미스 경로 (스타일 분석 + 뉴스 RAG + 리포트) — 결과를 캐시에 저장"""
+    result = _style_analysis(snapshot, request)
+
+    # ===== Step 4: 뉴스 RAG + 리포트 생성 =====
+    if result["analyzable"]:
+        news_list = _rag_news(request.stock_code, result["stock_name"])
+        result["report"] = _report(result, news_list)
+
+    # ===== 6. 캐시 저장 (분석 불가 결과도 캐싱) =====
     if use_cache:
-        try:
-            cache_client = get_redis_client()
-            cache_key = generate_cache_key(request)
-            cached_result = cache_client.get(cache_key)
+        analyze_cache.set(cache_key, result)
+
+    return result
 
-            if cached_result:
-                return json.loads(cached_result)
-        except Exception as e:
-            print(f"Redis 캐시 조회 실패 (무시하고 계속): {e}")
 
+def _style_analysis(snapshot, request: StockAnalyzeRequest) -> dict:
+    """
+    스타일 태그 + 스코어링 (뉴스/리포트 제외)
+
+    analyzable=False 면 그대로 최종 결과, True 면 "report" 만 비어 있는 결과
+    """
     # ===== 2. AI 학습 DB에 있는지 확인 (핵심!) =====
-    if request.stock_code not in stock_db.index:
+    stock = snapshot.lookup(request.stock_code)
+    if stock is None:
         # AI 학습 데이터에 없음 → 스타일 태그 생성 불가
-        result = {
+        return {
             "stock_code": request.stock_code,
-            "stock_name": "알 수 없는 종목",
+            "stock_name": UNKNOWN_STOCK_NAME,
             "final_style_tag": None,
             "style_description": None,
             "analyzable": False,
-            "reason": get_unanalyzable_reason("", in_db=False),
+            "reason": REASON_MESSAGES[REASON_NOT_IN_DB],
         }
 
-        # 분석 불가 결과도 캐싱 (TTL: 1시간)
-        if use_cache:
-            try:
-                cache_client = get_redis_client()
-                cache_key = generate_cache_key(request)
-                cache_client.setex(
-                    cache_key, 3600, json.dumps(result, ensure_ascii=False)
-                )
-            except Exception as e:
-                print(f"Redis 캐시 저장 실패 (무시하고 계속): {e}")
-
-        return result
-
-    # ===== 3. 종목명 조회 =====
-    try:
-        stock_name_full = stock_db.loc[request.stock_code]["한글명"]
-        # 한글명에 불필요한 텍스트가 붙어있을 수 있으므로 첫 단어만 추출
-        stock_name = (
-            str(stock_name_full).split()[0] if stock_name_full else "알 수 없는 종목"
-        )
-    except KeyError:
-        stock_name = "알 수 없는 종목"
-
-    # ===== 4. 종목명 필터링 (SPAC, 우선주 등) =====
-    if not is_valid_stock_for_analysis(stock_name):
-        result = {
+    # ===== 3. 종목명 + 4. 종목명 필터링 (SPAC, 우선주 등) — 스냅샷 로드 시 계산된 값 =====
+    stock_name = stock.name
+    if not stock.analyzable:
+        return {
             "stock_code": request.stock_code,
             "stock_name": stock_name,
             "final_style_tag": None,
             "style_description": None,
             "analyzable": False,
-            "reason": get_unanalyzable_reason(stock_name, in_db=True),
+            "reason": REASON_MESSAGES[stock.reason],
         }
 
-        # 분석 불가 결과도 캐싱
-        if use_cache:
-            try:
-                cache_client = get_redis_client()
-                cache_key = generate_cache_key(request)
-                cache_client.setex(
-                    cache_key, 3600, json.dumps(result, ensure_ascii=False)
-                )
-            except Exception as e:
-                print(f"Redis 캐시 저장 실패 (무시하고 계속): {e}")
-
-        return result
-
     # ===== 5. K-means 모델로 스타일 태그 생성 =====
-    df = pd.DataFrame(
-        [
-            {
-                "단축코드": request.stock_code,
-                "시가총액": request.market_cap,
-                "per": request.per,
-                "pbr": request.pbr,
-                "ROE": request.roe,
-                "부채비율": request.debt_ratio,
-                "배당수익률": request.dividend_yield,
-            }
-        ]
-    )
-    features = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
-
     try:
-        # inf, nan 처리
-        df[features] = df[features].replace([np.inf, -np.inf], np.nan)
-        df[features] = df[features].fillna(0)
-
-        scaled = scaler.transform(df[features])
-        pred_group = model.predict(scaled)[0]
+        # inf, nan 처리 후 스케일링 + 클러스터 예측
+        scaled = snapshot.style_model.transform(feature_matrix([request]))
+        pred_group = int(snapshot.style_model.predict(scaled)[0])
 
         # ✅ 성공: 스타일 태그 생성 완료 + 멀티팩터 스코어링 (Step 3)
         g_score = growth_score(roe=request.roe, per=request.per)
@@ -390,40 +427,7 @@ def analyze_stock(request: StockAnalyzeRequest, use_cache: bool = True):
         # 개별 종목 분석 시 유사도 정보 없으므로 중립값(50) 사용
         c_score = composite_score(50.0, g_score, s_score, DEFAULT_WEIGHTS)
 
-        # ✅ Step 4: 뉴스 RAG + 리포트 생성
-        report_text = None
-        news_list = []
-
-        # RAG 뉴스 검색 (pgvector 없어도 계속 진행)
-        try:
-            from app.infrastructure.news_pipeline import collect_and_store_news
-            from app.infrastructure.gemini_embedding_client import embed_text
-            from app.infrastructure.pgvector_client import search_similar_news
-
-            collect_and_store_news(request.stock_code, stock_name, display=10)
-            query_vec = embed_text(f"{stock_name} 투자 분석")
-            news_list = search_similar_news(request.stock_code, query_vec, top_k=5, days=30)
-        except Exception as e:
-            print(f"RAG 뉴스 검색 실패 (뉴스 없이 리포트 생성): {e}")
-
-        # 리포트 생성 (뉴스 없어도 Gemini로 생성)
-        try:
-            from app.infrastructure.report_generator import generate_report
-
-            report_text = generate_report(
-                stock_code=request.stock_code,
-                stock_name=stock_name,
-                style_tag=tag_mapping[pred_group],
-                growth_score=g_score,
-                stability_score=s_score,
-                similarity_score=50.0,
-                composite_score=c_score,
-                news_list=news_list,
-            )
-        except Exception as e:
-            print(f"리포트 생성 실패 (무시하고 계속): {e}")
-
-        result = {
+        return {
             "stock_code": request.stock_code,
             "stock_name": stock_name,
             "final_style_tag": tag_mapping[pred_group],
@@ -436,13 +440,13 @@ def analyze_stock(request: StockAnalyzeRequest, use_cache: bool = True):
                 "similarity_score": 50.0,
                 "composite_score": c_score,
             },
-            "report": report_text,  # ✅ Step 4: AI 투자 분석 리포트
+            "report": None,  # ✅ Step 4: AI 투자 분석 리포트 (뉴스 RAG 후 채움)
         }
 
     except Exception as e:
         # AI 모델 오류
         print(f"AI 분석 오류: {e}")
-        result = {
+        return {
             "stock_code": request.stock_code,
             "stock_name": stock_name,
             "final_style_tag": None,
@@ -451,18 +455,131 @@ def analyze_stock(request: StockAnalyzeRequest, use_cache: bool = True):
             "reason": "AI 모델 오류로 투자 스타일 분석에 실패했습니다.",
         }
 
-    # ===== 6. 캐시 저장 (TTL: 1시간 = 3600초) =====
+
+def _report_kwargs(result: dict, news_list: list) -> dict:
+    """스타일 분석 결과 → generate_report 인자"""
+    scores = result["scores"]
+    return dict(
+        stock_code=result["stock_code"],
+        stock_name=result["stock_name"],
+        style_tag=result["final_style_tag"],
+        growth_score=scores["growth_score"],
+        stability_score=scores["stability_score"],
+        similarity_score=scores["similarity_score"],
+        composite_score=scores["composite_score"],
+        news_list=news_list,
+    )
+
+
+def _rag_news(stock_code: str, stock_name: str) -> list:
+    """뉴스 수집 + 유사 뉴스 검색 (pgvector 없어도 빈 목록으로 계속 진행)"""
+    try:
+        from app.infrastructure.news_pipeline import retrieve_news
+
+        return retrieve_news(stock_code, stock_name, display=10, top_k=5, days=30)
+    except Exception as e:
+        print(f"RAG 뉴스 검색 실패 (뉴스 없이 리포트 생성): {e}")
+        return []
+
+
+def _report(result: dict, news_list: list) -> str | None:
+    """리포트 생성 (뉴스 없어도 Gemini로 생성, 실패 시 None)"""
+    try:
+        from app.infrastructure.report_generator import generate_report
+
+        return generate_report(**_report_kwargs(result, news_list))
+    except Exception as e:
+        print(f"리포트 생성 실패 (무시하고 계속): {e}")
+        return None
+
+
+# ============================================================
+# /stock/analyze 비동기 경로 — 네트워크 단계를 이벤트 루프에서 기다린다
+# (스레드풀 워커를 붙잡지 않으므로 워커 하나가 많은 분석을 동시에 진행)
+# ============================================================
+
+async def analyze_stock_async(request: StockAnalyzeRequest, use_cache: bool = True):
+    """
+    analyze_stock 의 asyncio 버전 (응답 형식/캐시 키 동일)
+
+    - 네이버 검색, Gemini 임베딩/리포트, pgvector 조회를 비동기 클라이언트로 호출
+    - 뉴스 수집과 쿼리 임베딩은 서로 독립이라 동시에 진행 (news_pipeline.retrieve_news_async)
+    - Redis 캐시는 redis.asyncio 로 조회/저장 (analyze_cache.get_async/set_async)
+    - stale 값은 바로 응답하고 이벤트 루프 Task 로 갱신 (refresh_in_background_async)
+    """
+    snapshot = get_snapshot()
+    cache_key = analyze_cache_key(request, snapshot.version)
+
+    if not use_cache:
+        return await _analyze_uncached_async(snapshot, request, cache_key, use_cache=False)
+    cached_result, stale = await analyze_cache.get_async(cache_key)
+    if cached_result:
+        if stale:
+            async def fresh():
+                value, still_stale = await analyze_cache.get_async(cache_key)
+                return None if still_stale else value
+
+            refresh_in_background_async(
+                analyze_cache.redis_key(cache_key),
+                lookup=fresh,
+                compute=lambda: _analyze_uncached_async(snapshot, request, cache_key, use_cache=True),
+            )
+        return cached_result
+
+    async def lookup():
+        return (await analyze_cache.get_async(cache_key))[0]
+
+    result, _ = await async_single_flight(
+        analyze_cache.redis_key(cache_key),
+        lookup=lookup,
+        compute=lambda: _analyze_uncached_async(snapshot, request, cache_key, use_cache=True),
+        lock_ttl=60,
+        wait_timeout=45,
+    )
+    return result
+
+
+async def _analyze_uncached_async(
+    snapshot, request: StockAnalyzeRequest, cache_key: str, use_cache: bool
+) -> dict:
+    result = _style_analysis(snapshot, request)
+
+    if result["analyzable"]:
+        news_list = await _rag_news_async(request.stock_code, result["stock_name"])
+        result["report"] = await _report_async(result, news_list)
+
     if use_cache:
-        try:
-            cache_client = get_redis_client()
-            cache_key = generate_cache_key(request)
-            cache_client.setex(cache_key, 3600, json.dumps(result, ensure_ascii=False))
-        except Exception as e:
-            print(f"Redis 캐시 저장 실패 (무시하고 계속): {e}")
+        await analyze_cache.set_async(cache_key, result)
 
     return result
 
 
+async def _rag_news_async(stock_code: str, stock_name: str) -> list:
+    """_rag_news 비동기 버전"""
+    try:
+        from app.infrastructure.news_pipeline import retrieve_news_async
+
+        return await retrieve_news_async(stock_code, stock_name, display=10, top_k=5, days=30)
+    except Exception as e:
+        print(f"RAG 뉴스 검색 실패 (뉴스 없이 리포트 생성): {e}")
+        return []
+
+
+async def _report_async(result: dict, news_list: list) -> str | None:
+    try:
+        from app.infrastructure.report_generator import generate_report_async
+
+        return await generate_report_async(**_report_kwargs(result, news_list))
+    except Exception as e:
+        print(f"리포트 생성 실패 (무시하고 계속): {e}")
+        return None
+
+
+def _user_vectors_from_holdings(snapshot, stocks) -> tuple:
+    """보유 종목 → (6차원 피처 벡터, 8차원 클러스터 벡터) — 각각 없으면 None"""
+    return _cached_portfolio_vectors(snapshot, stocks)
+
+
 def recommend_stocks(request) -> dict:
     """
     사용자 포트폴리오 기반 종목 추천 (Step 3)
@@ -471,52 +588,50 @@ def recommend_stocks(request) -> dict:
     - 피처 유사도 (70%): 스케일링된 6차원 재무지표 벡터 간 코사인 유사도
     - 클러스터 유사도 (30%): 8차원 스타일 벡터 간 코사인 유사도
     """
-    from app.domain.portfolio_analyze.service import get_portfolio_style_vector
-
-    # 사용자 보유 종목 데이터 준비
-    stocks_data = []
-    portfolio_rows = []
-    for s in request.stocks:
-        stocks_data.append({
-            "market_cap": s.market_cap,
-            "per": s.per,
-            "pbr": s.pbr,
-            "roe": s.roe,
-            "debt_ratio": s.debt_ratio,
-            "dividend_yield": s.dividend_yield,
-            "investment_amount": s.investment_amount,
-        })
-        portfolio_rows.append({
-            "단축코드": s.stock_code,
-            "시가총액": s.market_cap,
-            "per": s.per,
-            "pbr": s.pbr,
-            "ROE": s.roe,
-            "부채비율": s.debt_ratio,
-            "배당수익률": s.dividend_yield,
-            "투자금액": s.investment_amount,
-        })
-
-    # 6차원 피처 벡터 (스케일링된 가중평균)
-    user_feature_vec = compute_user_feature_vector(stocks_data, scaler)
-
-    # 8차원 클러스터 벡터 (투자비중 기반)
-    portfolio_df = pd.DataFrame(portfolio_rows)
-    user_cluster_vec, _ = get_portfolio_style_vector(portfolio_df)
+    snapshot = get_snapshot()
+    user_feature_vec, user_cluster_vec = _user_vectors_from_holdings(
+        snapshot, request.stocks
+    )
 
-    # 전체 종목 스코어링
-    results = score_all_stocks(
-        stock_db=stock_db,
-        scaler=scaler,
-        model=model,
+    # 전체 종목 스코어링 (스냅샷 기반 — 유사도/종합 점수만 계산)
+    results = recommend_from_universe(
+        snapshot.universe,
         user_feature_vector=user_feature_vec,
-        user_cluster_vector=user_cluster_vec if user_cluster_vec is not None else None,
+        user_cluster_vector=user_cluster_vec,
         persona=request.persona,
         top_n=request.top_n,
     )
 
     return {
         "persona": request.persona,
-        "total_scored": len(stock_db),
+        "total_scored": len(snapshot.stock_db),
         "recommendations": results,
     }
+
+
+def recommend_stocks_all_personas(request: MultiPersonaRecommendRequest) -> dict:
+    """
+    모든 페르소나 탭의 추천을 한번에 계산
+
+    유사도는 한번만 계산하고, 페르소나별 종합 점수는
+    (종목 × 3) · (3 × 페르소나) 행렬곱 한번으로 구한다.
+    """
+    snapshot = get_snapshot()
+    user_feature_vec, user_cluster_vec = _user_vectors_from_holdings(
+        snapshot, request.stocks
+    )
+
+    results = recommend_from_universe_all_personas(
+        snapshot.universe,
+        user_feature_vector=user_feature_vec,
+        user_cluster_vector=user_cluster_vec,
+        top_n=request.top_n,
+    )
+
+    return {
+        "total_scored": len(snapshot.stock_db),
+        "personas": [
+            {"persona": persona, "recommendations": recommendations}
+            for persona, recommendations in results.items()
+        ],
+    }
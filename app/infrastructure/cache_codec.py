@@ -0,0 +1,98 @@
+"""
+Redis 캐시 값 직렬화 (교체 가능한 코덱)
+- json: 기존 형식 (json.dumps(..., ensure_ascii=False) 텍스트)
+- msgpack-zstd: 첫 바이트 = 형식 버전, 나머지 = msgpack (큰 값은 zstd 압축)
+    0x01: msgpack 그대로 (작은 값 — zstd 프레임 헤더가 오히려 더 큼)
+    0x02: zstd(msgpack)
+- 어느 코덱이든 읽기는 두 형식을 모두 받는다 (버전 바이트가 없으면 기존 텍스트로 보고 legacy_loads)
+  → 배포 중 섞여 있는 기존 JSON 캐시도 그대로 읽힌다
+
+CACHE_CODEC 환경 변수로 쓰기 형식을 고른다 (기본 msgpack-zstd).
+새 형식을 모르는 이전 버전 워커와 함께 돌 때는 CACHE_CODEC=json 으로 먼저 배포한다.
+"""
+
+import json
+import os
+import threading
+
+import msgpack
+import zstandard
+
+FORMAT_MSGPACK = 0x01
+FORMAT_MSGPACK_ZSTD = 0x02
+COMPRESS_MIN_BYTES = 128
+ZSTD_LEVEL = 3
+
+_local = threading.local()  # zstd 압축기/해제기는 스레드 간 공유 불가
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    if not hasattr(_local, "compressor"):
+        _local.compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return _local.compressor
+
+
+def _decompressor() -> zstandard.ZstdDecompressor:
+    if not hasattr(_local, "decompressor"):
+        _local.decompressor = zstandard.ZstdDecompressor()
+    return _local.decompressor
+
+
+def _as_text(raw: str | bytes) -> str:
+    return raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+
+class JsonCodec:
+    """기존 텍스트 형식으로 쓰고, 바이너리 형식도 읽는 코덱"""
+
+    def __init__(self, legacy_loads=json.loads, text: bool = False):
+        self.legacy_loads = legacy_loads
+        self.text = text  # True면 값(문자열)을 JSON 인코딩 없이 그대로 저장
+
+    def dumps(self, value) -> str:
+        return str(value) if self.text else json.dumps(value, ensure_ascii=False)
+
+    def loads(self, raw: str | bytes):
+        if isinstance(raw, bytes) and raw[:1] in _BINARY_HEADERS:
+            return _loads_binary(raw)
+        return self.legacy_loads(_as_text(raw))
+
+
+class MsgpackZstdCodec(JsonCodec):
+    """버전 바이트 + msgpack (+ zstd) 로 쓰는 코덱"""
+
+    def dumps(self, value) -> bytes:
+        packed = msgpack.packb(value, use_bin_type=True)
+        if len(packed) < COMPRESS_MIN_BYTES:
+            return bytes([FORMAT_MSGPACK]) + packed
+        return bytes([FORMAT_MSGPACK_ZSTD]) + _compressor().compress(packed)
+
+
+_BINARY_HEADERS = (bytes([FORMAT_MSGPACK]), bytes([FORMAT_MSGPACK_ZSTD]))
+
+# 손상된 값(잘린 zstd 프레임, 모르는 버전 바이트, 깨진 msgpack/JSON)을 읽을 때 나는 예외
+DECODE_ERRORS = (ValueError, TypeError, msgpack.UnpackException, zstandard.ZstdError)
+
+
+def _loads_binary(raw: bytes):
+    payload = memoryview(raw)[1:]
+    if raw[0] == FORMAT_MSGPACK_ZSTD:
+        payload = _decompressor().decompress(payload)
+    return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+
+
+CODECS = {"json": JsonCodec, "msgpack-zstd": MsgpackZstdCodec}
+
+
+def get_codec(legacy_loads=json.loads, text: bool = False, name: str | None = None) -> JsonCodec:
+    """
+    CACHE_CODEC 설정에 맞는 코덱
+
+    Args:
+        legacy_loads: 기존 텍스트 값 디코딩 함수 (예: decode_swr_entry)
+        text: json 코덱에서 문자열 값을 그대로 저장할지 (기존 json_codec=False 캐시)
+    """
+    name = name or os.getenv("CACHE_CODEC", "msgpack-zstd")
+    if name not in CODECS:
+        raise ValueError(f"알 수 없는 CACHE_CODEC: {name} (가능: {', '.join(CODECS)})")
+    return CODECS[name](legacy_loads=legacy_loads, text=text)
@@ -0,0 +1,85 @@
+"""
+기업 설명 영구 저장소 (PostgreSQL company_descriptions 테이블)
+- Redis 캐시와 별개로 생성된 설명을 종목코드 기준으로 보관
+- 연결은 pgvector_client 커넥션 풀을 공유
+- 요청 경로용 load_description / save_description 은 예외를 던지지 않는다
+  (DB 장애는 "저장소 미스"로 처리, 연속 실패 시 서킷 브레이커로 잠시 건너뜀)
+"""
+
+import logging
+import os
+
+import psycopg2
+
+from app.infrastructure.pgvector_client import get_conn
+from app.infrastructure.redis_client import CircuitBreaker
+
+logger = logging.getLogger(__name__)
+
+breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("DESC_STORE_BREAKER_THRESHOLD", "3")),
+    cooldown=float(os.getenv("DESC_STORE_BREAKER_COOLDOWN", "30")),
+)
+
+
+def _guarded(action: str, fn, default):
+    """브레이커를 거쳐 DB 호출 — 차단/실패 시 default 반환"""
+    if not breaker.allow():
+        return default
+    try:
+        result = fn()
+    except psycopg2.Error as e:
+        breaker.record_failure()
+        logger.warning("기업 설명 저장소 %s 실패 (무시): %s", action, e)
+        return default
+    breaker.record_success()
+    return result
+
+
+def load_description(stock_code: str) -> str | None:
+    """저장된 설명 조회 (없거나 장애 시 None)"""
+
+    def run():
+        with get_conn() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT description FROM company_descriptions WHERE stock_code = %s",
+                    (stock_code,),
+                )
+                row = cur.fetchone()
+        return row[0] if row else None
+
+    return _guarded("조회", run, None)
+
+
+def save_description(stock_code: str, company_name: str, description: str) -> bool:
+    """설명 저장 (성공 여부 반환)"""
+
+    def run():
+        upsert_company_description(stock_code, company_name, description)
+        return True
+
+    return _guarded("저장", run, False)
+
+
+def fetch_described_codes() -> set[str]:
+    """설명이 이미 저장된 종목코드 전체"""
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT stock_code FROM company_descriptions")
+            return {row[0] for row in cur.fetchall()}
+
+
+def upsert_company_description(stock_code: str, company_name: str, description: str) -> None:
+    """종목 설명 저장 (이미 있으면 덮어쓰기)"""
+    sql = """
+        INSERT INTO company_descriptions (stock_code, company_name, description)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (stock_code) DO UPDATE
+        SET company_name = EXCLUDED.company_name,
+            description  = EXCLUDED.description,
+            updated_at   = NOW()
+    """
+    with get_conn() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, (stock_code, company_name, description))
@@ -2,8 +2,10 @@
 Gemini 임베딩 클라이언트
 - gemini-embedding-001 모델 (3072차원)
 - 배치 임베딩 지원
+- *_async: client.aio 기반 비동기 버전 (대기 중 이벤트 루프를 막지 않음)
 """
 
+import asyncio
 import os
 import logging
 import time
@@ -85,3 +87,49 @@ def embed_texts(texts: list[str], batch_size: int = 20) -> list[list[float]]:
 
     logger.info("임베딩 완료: %d / %d건", len(all_embeddings), len(texts))
     return all_embeddings
+
+
+async def embed_text_async(text: str) -> list[float]:
+    """embed_text 비동기 버전"""
+    client = _get_client()
+    response = await client.aio.models.embed_content(
+        model=EMBEDDING_MODEL,
+        contents=text,
+    )
+    return response.embeddings[0].values
+
+
+async def embed_texts_async(texts: list[str], batch_size: int = 20) -> list[list[float]]:
+    """embed_texts 비동기 버전 (실패 배치는 개별 처리, 그래도 실패하면 0 벡터)"""
+    client = _get_client()
+    all_embeddings = []
+
+    for i in range(0, len(texts), batch_size):
+        batch = texts[i:i + batch_size]
+
+        try:
+            response = await client.aio.models.embed_content(
+                model=EMBEDDING_MODEL,
+                contents=batch,
+            )
+            all_embeddings.extend(e.values for e in response.embeddings)
+        except Exception as e:
+            logger.warning("임베딩 배치 %d 실패, 개별 처리로 전환: %s", i, e)
+            for text in batch:
+                try:
+                    await asyncio.sleep(0.5)
+                    resp = await client.aio.models.embed_content(
+                        model=EMBEDDING_MODEL,
+                        contents=text,
+                    )
+                    all_embeddings.append(resp.embeddings[0].values)
+                except Exception as inner_e:
+                    logger.error("임베딩 실패 (skip): %s", inner_e)
+                    all_embeddings.append([0.0] * 3072)
+
+        # rate limit 방지
+        if i + batch_size < len(texts):
+            await asyncio.sleep(0.3)
+
+    logger.info("임베딩 완료: %d / %d건", len(all_embeddings), len(texts))
+    return all_embeddings
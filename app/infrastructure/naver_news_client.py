@@ -2,6 +2,7 @@
 네이버 검색 API (뉴스) 클라이언트
 - 종목명 기반 뉴스 검색
 - HTML 태그 제거 + 날짜 파싱
+- search_news_async: httpx.AsyncClient (커넥션 재사용) 기반 비동기 버전
 """
 
 import os
@@ -9,6 +10,7 @@ import re
 import logging
 from datetime import datetime
 
+import httpx
 import requests
 
 logger = logging.getLogger(__name__)
@@ -47,12 +49,29 @@ def search_news(
     Returns:
         [{"title", "description", "link", "pub_date"(datetime)}]
     """
+    request_args = _request_args(query, display, sort)
+    if request_args is None:
+        return []
+
+    try:
+        resp = requests.get(NAVER_SEARCH_URL, **request_args, timeout=5)
+        resp.raise_for_status()
+        data = resp.json()
+    except requests.RequestException as e:
+        logger.error("네이버 뉴스 검색 실패: %s", e)
+        return []
+
+    return _parse_results(query, data)
+
+
+def _request_args(query: str, display: int, sort: str) -> dict | None:
+    """검색 요청 헤더/파라미터 (API 키가 없으면 None)"""
     client_id = os.getenv("NAVER_CLIENT_ID")
     client_secret = os.getenv("NAVER_CLIENT_SECRET")
 
     if not client_id or not client_secret:
         logger.error("NAVER_CLIENT_ID / NAVER_CLIENT_SECRET 환경변수가 설정되지 않았습니다")
-        return []
+        return None
 
     headers = {
         "X-Naver-Client-Id": client_id,
@@ -64,15 +83,10 @@ def search_news(
         "start": 1,
         "sort": sort,
     }
+    return {"headers": headers, "params": params}
 
-    try:
-        resp = requests.get(NAVER_SEARCH_URL, headers=headers, params=params, timeout=5)
-        resp.raise_for_status()
-        data = resp.json()
-    except requests.RequestException as e:
-        logger.error("네이버 뉴스 검색 실패: %s", e)
-        return []
 
+def _parse_results(query: str, data: dict) -> list[dict]:
     results = []
     for item in data.get("items", []):
         results.append({
@@ -98,3 +112,47 @@ def search_stock_news(stock_name: str, display: int = 20) -> list[dict]:
         뉴스 리스트
     """
     return search_news(f"{stock_name} 주식", display=display, sort="date")
+
+
+_async_client: httpx.AsyncClient | None = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    """프로세스(이벤트 루프)당 하나의 AsyncClient — 연결을 재사용"""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(timeout=5)
+    return _async_client
+
+
+async def search_news_async(
+    query: str,
+    display: int = 20,
+    sort: str = "date",
+) -> list[dict]:
+    """search_news 비동기 버전"""
+    request_args = _request_args(query, display, sort)
+    if request_args is None:
+        return []
+
+    try:
+        resp = await _get_async_client().get(NAVER_SEARCH_URL, **request_args)
+        resp.raise_for_status()
+        data = resp.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error("네이버 뉴스 검색 실패: %s", e)
+        return []
+
+    return _parse_results(query, data)
+
+
+async def search_stock_news_async(stock_name: str, display: int = 20) -> list[dict]:
+    """search_stock_news 비동기 버전"""
+    return await search_news_async(f"{stock_name} 주식", display=display, sort="date")
+
+
+async def close_async_client() -> None:
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
@@ -1,17 +1,68 @@
 """
 뉴스 RAG 파이프라인
 - 종목명 → 네이버 뉴스 검색 → Gemini 임베딩 → pgvector 저장
+- 새 뉴스가 저장되면 종목별 뉴스 버전을 올린다 (리포트 캐시 무효화)
+- collect_and_store_news_async: 같은 단계를 비동기 클라이언트로 (async 엔드포인트용)
+
+RAG 검색 (retrieve_news / retrieve_news_async) 의존 관계:
+
+    쿼리 임베딩 ─────────────────────────────┐
+    네이버 검색 → 기사 임베딩 → pgvector 저장 ─┴→ 유사 뉴스 검색
+
+쿼리 임베딩은 수집한 뉴스와 무관하므로 수집과 동시에 시작하고,
+유사 뉴스 검색은 두 입력(쿼리 벡터, 저장 완료)이 모두 준비되면 바로 시작한다.
+수집이 실패해도 이미 저장된 뉴스로 검색은 진행한다.
 """
 
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
-from app.infrastructure.naver_news_client import search_stock_news
-from app.infrastructure.gemini_embedding_client import embed_texts
-from app.infrastructure.pgvector_client import insert_news_embeddings
+from app.infrastructure.naver_news_client import search_stock_news, search_stock_news_async
+from app.infrastructure.gemini_embedding_client import (
+    embed_text,
+    embed_text_async,
+    embed_texts,
+    embed_texts_async,
+)
+from app.infrastructure.pgvector_client import (
+    insert_news_embeddings,
+    insert_news_embeddings_async,
+    search_similar_news,
+    search_similar_news_async,
+)
+from app.infrastructure.redis_client import (
+    async_cache_get,
+    async_cache_incr,
+    cache_get,
+    cache_incr,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _news_version_key(stock_code: str) -> str:
+    return f"news_version:{stock_code}"
+
+
+def news_version(stock_code: str) -> str:
+    """종목 뉴스 버전 (새 뉴스가 저장될 때마다 증가, Redis 장애 시 "0")"""
+    return cache_get(_news_version_key(stock_code)) or "0"
+
+
+def bump_news_version(stock_code: str) -> None:
+    cache_incr(_news_version_key(stock_code))
+
+
+async def news_version_async(stock_code: str) -> str:
+    """news_version 의 asyncio 버전 (redis.asyncio)"""
+    return await async_cache_get(_news_version_key(stock_code)) or "0"
+
+
+async def bump_news_version_async(stock_code: str) -> None:
+    await async_cache_incr(_news_version_key(stock_code))
+
+
 def collect_and_store_news(
     stock_code: str,
     stock_name: str,
@@ -35,17 +86,49 @@ def collect_and_store_news(
         return 0
 
     # 2. 임베딩 텍스트 준비 (제목 + 요약)
-    texts = [
-        f"{n['title']}. {n['description']}" for n in news_list
-    ]
-
     # 3. Gemini 임베딩
-    embeddings = embed_texts(texts)
+    embeddings = embed_texts(_embedding_texts(news_list))
 
     # 4. DB 저장용 데이터 조합
-    rows = []
-    for news, embedding in zip(news_list, embeddings):
-        rows.append({
+    rows = _news_rows(stock_code, stock_name, news_list, embeddings)
+
+    # 5. pgvector 벌크 INSERT
+    inserted = insert_news_embeddings(rows)
+    if inserted:
+        bump_news_version(stock_code)
+    logger.info("[%s] %s: %d건 수집, %d건 저장", stock_code, stock_name, len(rows), inserted)
+    return inserted
+
+
+async def collect_and_store_news_async(
+    stock_code: str,
+    stock_name: str,
+    display: int = 20,
+) -> int:
+    """collect_and_store_news 비동기 버전 (저장된 뉴스 수 반환)"""
+    news_list = await search_stock_news_async(stock_name, display=display)
+    if not news_list:
+        logger.warning("뉴스 검색 결과 없음: %s", stock_name)
+        return 0
+
+    embeddings = await embed_texts_async(_embedding_texts(news_list))
+    rows = _news_rows(stock_code, stock_name, news_list, embeddings)
+
+    inserted = await insert_news_embeddings_async(rows)
+    if inserted:
+        await bump_news_version_async(stock_code)
+    logger.info("[%s] %s: %d건 수집, %d건 저장", stock_code, stock_name, len(rows), inserted)
+    return inserted
+
+
+def _embedding_texts(news_list: list[dict]) -> list[str]:
+    """임베딩 텍스트 (제목 + 요약)"""
+    return [f"{n['title']}. {n['description']}" for n in news_list]
+
+
+def _news_rows(stock_code: str, stock_name: str, news_list: list[dict], embeddings: list) -> list[dict]:
+    return [
+        {
             "stock_code": stock_code,
             "stock_name": stock_name,
             "title": news["title"],
@@ -53,9 +136,54 @@ def collect_and_store_news(
             "link": news["link"],
             "pub_date": news["pub_date"],
             "embedding": embedding,
-        })
+        }
+        for news, embedding in zip(news_list, embeddings)
+    ]
 
-    # 5. pgvector 벌크 INSERT
-    inserted = insert_news_embeddings(rows)
-    logger.info("[%s] %s: %d건 수집, %d건 저장", stock_code, stock_name, len(rows), inserted)
-    return inserted
+
+def _rag_query(stock_name: str) -> str:
+    return f"{stock_name} 투자 분석"
+
+
+_query_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="rag-query")
+
+
+def retrieve_news(
+    stock_code: str,
+    stock_name: str,
+    display: int = 10,
+    top_k: int = 5,
+    days: int = 30,
+) -> list[dict]:
+    """
+    최신 뉴스 수집 + 유사 뉴스 검색 (동기 — 쿼리 임베딩은 별도 스레드에서 수집과 동시에)
+
+    Raises:
+        쿼리 임베딩 / 검색 실패 예외 (수집 실패는 로그만 남기고 계속)
+    """
+    query_future = _query_executor.submit(embed_text, _rag_query(stock_name))
+    try:
+        collect_and_store_news(stock_code, stock_name, display=display)
+    except Exception as e:
+        logger.warning("뉴스 수집 실패 (저장된 뉴스로 검색): %s — %s", stock_name, e)
+    return search_similar_news(stock_code, query_future.result(), top_k=top_k, days=days)
+
+
+async def retrieve_news_async(
+    stock_code: str,
+    stock_name: str,
+    display: int = 10,
+    top_k: int = 5,
+    days: int = 30,
+) -> list[dict]:
+    """retrieve_news 비동기 버전 (쿼리 임베딩과 수집을 asyncio.gather 로 동시에)"""
+    collected, query_vec = await asyncio.gather(
+        collect_and_store_news_async(stock_code, stock_name, display=display),
+        embed_text_async(_rag_query(stock_name)),
+        return_exceptions=True,
+    )
+    if isinstance(query_vec, BaseException):
+        raise query_vec
+    if isinstance(collected, BaseException):
+        logger.warning("뉴스 수집 실패 (저장된 뉴스로 검색): %s — %s", stock_name, collected)
+    return await search_similar_news_async(stock_code, query_vec, top_k=top_k, days=days)
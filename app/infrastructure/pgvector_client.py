@@ -2,12 +2,16 @@
 pgvector 연결 및 쿼리 헬퍼
 - 커넥션 풀 기반 (psycopg2)
 - 뉴스 임베딩 저장 / 유사도 검색
+- *_async: asyncpg 풀 기반 비동기 버전 (async 엔드포인트용)
 """
 
+import asyncio
 import os
 import logging
 from contextlib import contextmanager
+from datetime import timezone
 
+import asyncpg
 import psycopg2
 from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extras import execute_values
@@ -17,17 +21,23 @@ logger = logging.getLogger(__name__)
 _pool: ThreadedConnectionPool | None = None
 
 
+def _conn_params() -> dict:
+    return dict(
+        host=os.getenv("PGVECTOR_HOST", "localhost"),
+        port=int(os.getenv("PGVECTOR_PORT", "5433")),
+        user=os.getenv("PGVECTOR_USER", "stockai"),
+        password=os.getenv("PGVECTOR_PASSWORD", "stockai1234"),
+    )
+
+
 def get_pool() -> ThreadedConnectionPool:
     global _pool
     if _pool is None:
         _pool = ThreadedConnectionPool(
             minconn=2,
             maxconn=10,
-            host=os.getenv("PGVECTOR_HOST", "localhost"),
-            port=int(os.getenv("PGVECTOR_PORT", "5433")),
-            user=os.getenv("PGVECTOR_USER", "stockai"),
-            password=os.getenv("PGVECTOR_PASSWORD", "stockai1234"),
             dbname=os.getenv("PGVECTOR_DB", "stock_news"),
+            **_conn_params(),
         )
         logger.info("pgvector connection pool created")
     return _pool
@@ -118,7 +128,7 @@ def search_similar_news(
         LIMIT %s
     """
 
-    embedding_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
+    embedding_str = _vector_literal(query_embedding)
 
     with get_conn() as conn:
         with conn.cursor() as cur:
@@ -129,9 +139,105 @@ def search_similar_news(
     return results
 
 
+def _vector_literal(values) -> str:
+    return "[" + ",".join(str(v) for v in values) + "]"
+
+
 def close_pool():
     global _pool
     if _pool is not None:
         _pool.closeall()
         _pool = None
         logger.info("pgvector connection pool closed")
+
+
+# ============================================================
+# asyncpg (비동기) — 이벤트 루프당 풀 하나
+# ============================================================
+
+_async_pool: asyncpg.Pool | None = None
+_async_pool_lock = asyncio.Lock()
+
+
+async def get_async_pool() -> asyncpg.Pool:
+    global _async_pool
+    if _async_pool is None:
+        async with _async_pool_lock:
+            if _async_pool is None:
+                _async_pool = await asyncpg.create_pool(
+                    min_size=2,
+                    max_size=int(os.getenv("PGVECTOR_ASYNC_POOL_SIZE", "20")),
+                    database=os.getenv("PGVECTOR_DB", "stock_news"),
+                    **_conn_params(),
+                )
+                logger.info("pgvector async pool created")
+    return _async_pool
+
+
+async def insert_news_embeddings_async(rows: list[dict]) -> int:
+    """insert_news_embeddings 비동기 버전 (중복 무시, 삽입된 행 수 반환)"""
+    if not rows:
+        return 0
+
+    columns = 7
+    placeholders = ", ".join(
+        "(" + ", ".join(
+            f"${i * columns + j + 1}" + ("::vector" if j == columns - 1 else "")
+            for j in range(columns)
+        ) + ")"
+        for i in range(len(rows))
+    )
+    sql = f"""
+        INSERT INTO news_embeddings
+            (stock_code, stock_name, title, description, link, pub_date, embedding)
+        VALUES {placeholders}
+        ON CONFLICT (stock_code, link) DO NOTHING
+        RETURNING id
+    """
+    args = []
+    for r in rows:
+        pub_date = r.get("pub_date")
+        args.extend([
+            r["stock_code"],
+            r["stock_name"],
+            r["title"],
+            r.get("description", ""),
+            r["link"],
+            # TIMESTAMP 컬럼은 naive 값만 받음 → UTC 기준 (psycopg2 경로 + UTC 세션과 같은 값)
+            pub_date.astimezone(timezone.utc).replace(tzinfo=None) if pub_date else None,
+            _vector_literal(r["embedding"]),
+        ])
+
+    pool = await get_async_pool()
+    inserted = len(await pool.fetch(sql, *args))
+    logger.info("inserted %d / %d news embeddings", inserted, len(rows))
+    return inserted
+
+
+async def search_similar_news_async(
+    stock_code: str,
+    query_embedding: list[float],
+    top_k: int = 5,
+    days: int = 30,
+) -> list[dict]:
+    """search_similar_news 비동기 버전"""
+    sql = """
+        SELECT title, description, link, pub_date,
+               1 - (embedding <=> $1::vector) AS similarity
+        FROM news_embeddings
+        WHERE stock_code = $2
+          AND pub_date >= NOW() - make_interval(days => $3)
+        ORDER BY embedding <=> $1::vector
+        LIMIT $4
+    """
+    pool = await get_async_pool()
+    records = await pool.fetch(sql, _vector_literal(query_embedding), stock_code, days, top_k)
+    return [dict(record) for record in records]
+
+
+async def close_async_pool() -> None:
+    global _async_pool
+    if _async_pool is not None:
+        await _async_pool.close()
+        _async_pool = None
+        logger.info("pgvector async pool closed")
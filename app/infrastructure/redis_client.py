@@ -0,0 +1,309 @@
+"""
+Redis 캐시 클라이언트
+- 프로세스 전역 커넥션 풀 하나를 공유 (요청마다 새 연결을 만들지 않음)
+- 서킷 브레이커: 연속 실패 시 쿨다운 동안 Redis를 건너뛰고 바로 계산 경로로 진행
+- 실패 로그는 일정 간격으로만 남김 (장애 중 요청마다 로그가 쌓이지 않도록)
+- 바이너리 캐시 값(cache_codec)은 응답을 디코딩하지 않는 별도 풀로 읽는다 (binary=True)
+- async_* 헬퍼: async 엔드포인트용 redis.asyncio 클라이언트 (같은 서킷 브레이커/로그 규칙)
+
+cache_* 헬퍼는 예외를 던지지 않는다 — 캐시 장애는 "캐시 미스"로 처리된다.
+"""
+
+import logging
+import os
+import threading
+import time
+import uuid
+
+import redis
+import redis.asyncio as aioredis
+
+logger = logging.getLogger(__name__)
+
+_pool: redis.ConnectionPool | None = None
+_client: redis.Redis | None = None
+_binary_pool: redis.ConnectionPool | None = None
+_binary_client: redis.Redis | None = None
+_pool_lock = threading.Lock()
+
+# 연결 자체가 안 되는 오류만 브레이커 대상 (WRONGTYPE 같은 명령 오류는 제외)
+_CONNECTION_ERRORS = (redis.ConnectionError, redis.TimeoutError)
+
+
+class CircuitBreaker:
+    """
+    연속 실패 횟수 기반 서킷 브레이커
+
+    - closed: 정상 호출
+    - open: failure_threshold 번 연속 실패 → cooldown 초 동안 호출 차단
+    - half-open: 쿨다운이 지나면 한번만 시험 호출, 성공하면 closed / 실패하면 다시 open
+    """
+
+    def __init__(self, failure_threshold: int = 3, cooldown: float = 30.0, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._clock() - self._opened_at >= self.cooldown:
+                # half-open: 시험 호출 하나만 통과시키고 나머지는 다음 쿨다운까지 차단
+                self._opened_at = self._clock()
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning("Redis 서킷 브레이커 open — %.0f초 동안 캐시를 건너뜁니다", self.cooldown)
+                self._opened_at = self._clock()
+
+
+breaker = CircuitBreaker(
+    failure_threshold=int(os.getenv("REDIS_BREAKER_THRESHOLD", "3")),
+    cooldown=float(os.getenv("REDIS_BREAKER_COOLDOWN", "30")),
+)
+
+_LOG_INTERVAL = 60.0
+_last_log_at = 0.0
+_suppressed = 0
+_log_lock = threading.Lock()
+
+
+def _log_failure(action: str, error: Exception) -> None:
+    """실패 로그를 _LOG_INTERVAL 초에 한번만 남기고, 그 사이 실패 수를 함께 기록"""
+    global _last_log_at, _suppressed
+    with _log_lock:
+        now = time.monotonic()
+        if now - _last_log_at < _LOG_INTERVAL:
+            _suppressed += 1
+            return
+        suppressed, _suppressed = _suppressed, 0
+        _last_log_at = now
+    logger.warning("Redis %s 실패 (무시, 최근 %d건 생략): %s", action, suppressed, error)
+
+
+def _pool_kwargs(decode_responses: bool) -> dict:
+    return dict(
+        host=os.getenv("REDIS_HOST", "localhost"),
+        port=int(os.getenv("REDIS_PORT", "6379")),
+        decode_responses=decode_responses,
+        socket_connect_timeout=float(os.getenv("REDIS_CONNECT_TIMEOUT", "2")),
+        socket_timeout=float(os.getenv("REDIS_SOCKET_TIMEOUT", "2")),
+        health_check_interval=30,
+        max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "50")),
+    )
+
+
+def _new_pool(decode_responses: bool) -> redis.ConnectionPool:
+    return redis.ConnectionPool(**_pool_kwargs(decode_responses))
+
+
+def get_pool() -> redis.ConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _new_pool(decode_responses=True)
+                logger.info("Redis connection pool created")
+    return _pool
+
+
+def get_redis_client() -> redis.Redis:
+    """커넥션 풀을 공유하는 Redis 클라이언트 (프로세스당 하나)"""
+    global _client
+    if _client is None:
+        _client = redis.Redis(connection_pool=get_pool())
+    return _client
+
+
+def get_binary_client() -> redis.Redis:
+    """응답을 bytes 그대로 돌려주는 클라이언트 (바이너리 캐시 값 조회용)"""
+    global _binary_pool, _binary_client
+    if _binary_client is None:
+        with _pool_lock:
+            if _binary_client is None:
+                _binary_pool = _new_pool(decode_responses=False)
+                _binary_client = redis.Redis(connection_pool=_binary_pool)
+                logger.info("Redis binary connection pool created")
+    return _binary_client
+
+
+def _call(action: str, fn, default, binary: bool = False):
+    """브레이커를 거쳐 Redis 호출 — 차단/실패 시 default 반환"""
+    if not breaker.allow():
+        return default
+    try:
+        result = fn(get_binary_client() if binary else get_redis_client())
+    except _CONNECTION_ERRORS as e:
+        breaker.record_failure()
+        _log_failure(action, e)
+        return default
+    except redis.RedisError as e:
+        _log_failure(action, e)
+        return default
+    breaker.record_success()
+    return result
+
+
+def cache_get(key: str, binary: bool = False) -> str | bytes | None:
+    """GET (장애 시 None, binary=True 면 bytes)"""
+    return _call("조회", lambda client: client.get(key), None, binary)
+
+
+def cache_mget(keys: list[str], binary: bool = False) -> list:
+    """MGET 한번으로 일괄 조회 (장애 시 전부 None, binary=True 면 bytes)"""
+    if not keys:
+        return []
+    return _call("일괄 조회", lambda client: client.mget(keys), [None] * len(keys), binary)
+
+
+def cache_setex(key: str, ttl: int, value: str | bytes) -> bool:
+    """SETEX (성공 여부 반환)"""
+    return bool(_call("저장", lambda client: client.setex(key, ttl, value), False))
+
+
+def cache_setex_many(items: list[tuple[str, str | bytes]], ttl: int) -> bool:
+    """(키, 값) 목록을 파이프라인 1회 왕복으로 SETEX"""
+    if not items:
+        return True
+
+    def run(client):
+        pipe = client.pipeline(transaction=False)
+        for key, value in items:
+            pipe.setex(key, ttl, value)
+        pipe.execute()
+        return True
+
+    return _call("일괄 저장", run, False)
+
+
+def cache_incr(key: str) -> int | None:
+    """INCR (장애 시 None)"""
+    return _call("증가", lambda client: client.incr(key), None)
+
+
+# ============================================================
+# 짧은 분산 락 (SET NX PX) — 워커 간 single-flight 용
+# ============================================================
+
+_UNAVAILABLE = object()
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def try_lock(name: str, ttl_ms: int) -> str | None:
+    """
+    락 획득 시도 — 획득하면 토큰, 다른 워커가 잡고 있으면 None
+
+    Redis를 쓸 수 없으면(장애/브레이커 open) 락 없이 진행하도록 토큰을 돌려준다.
+    """
+    token = uuid.uuid4().hex
+    acquired = _call(
+        "락 획득", lambda client: client.set(name, token, nx=True, px=ttl_ms), _UNAVAILABLE
+    )
+    if acquired is _UNAVAILABLE or acquired:
+        return token
+    return None
+
+
+def release_lock(name: str, token: str) -> None:
+    """내가 잡은 락만 해제 (TTL 만료 후 다른 워커가 잡은 락은 건드리지 않음)"""
+    _call("락 해제", lambda client: client.eval(_RELEASE_SCRIPT, 1, name, token), None)
+
+
+# ============================================================
+# asyncio 클라이언트 (redis.asyncio) — async 엔드포인트에서 이벤트 루프를 막지 않음
+# ============================================================
+
+_async_clients: dict[bool, aioredis.Redis] = {}  # binary 여부 → 클라이언트
+
+
+def get_async_client(binary: bool = False) -> aioredis.Redis:
+    """
+    redis.asyncio 클라이언트 (프로세스당 decoded/binary 하나씩)
+
+    연결은 처음 사용한 이벤트 루프에 묶이므로 앱 이벤트 루프 안에서만 사용한다.
+    """
+    client = _async_clients.get(binary)
+    if client is None:
+        pool = aioredis.ConnectionPool(**_pool_kwargs(decode_responses=not binary))
+        client = _async_clients[binary] = aioredis.Redis(connection_pool=pool)
+        logger.info("Redis async connection pool created (binary=%s)", binary)
+    return client
+
+
+async def _acall(action: str, fn, default, binary: bool = False):
+    """_call 의 asyncio 버전 (fn 은 클라이언트를 받아 awaitable 반환)"""
+    if not breaker.allow():
+        return default
+    try:
+        result = await fn(get_async_client(binary))
+    except _CONNECTION_ERRORS as e:
+        breaker.record_failure()
+        _log_failure(action, e)
+        return default
+    except redis.RedisError as e:
+        _log_failure(action, e)
+        return default
+    breaker.record_success()
+    return result
+
+
+async def async_cache_get(key: str, binary: bool = False) -> str | bytes | None:
+    """GET (장애 시 None, binary=True 면 bytes)"""
+    return await _acall("조회", lambda client: client.get(key), None, binary)
+
+
+async def async_cache_setex(key: str, ttl: int, value: str | bytes) -> bool:
+    """SETEX (성공 여부 반환)"""
+    return bool(await _acall("저장", lambda client: client.setex(key, ttl, value), False))
+
+
+async def async_cache_incr(key: str) -> int | None:
+    """INCR (장애 시 None)"""
+    return await _acall("증가", lambda client: client.incr(key), None)
+
+
+async def async_try_lock(name: str, ttl_ms: int) -> str | None:
+    """try_lock 의 asyncio 버전 (Redis를 쓸 수 없으면 락 없이 진행하도록 토큰 반환)"""
+    token = uuid.uuid4().hex
+    acquired = await _acall(
+        "락 획득", lambda client: client.set(name, token, nx=True, px=ttl_ms), _UNAVAILABLE
+    )
+    if acquired is _UNAVAILABLE or acquired:
+        return token
+    return None
+
+
+async def async_release_lock(name: str, token: str) -> None:
+    """release_lock 의 asyncio 버전"""
+    await _acall("락 해제", lambda client: client.eval(_RELEASE_SCRIPT, 1, name, token), None)
+
+
+async def close_async_clients() -> None:
+    """앱 종료 시 async 커넥션 풀 정리"""
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose(close_connection_pool=True)
@@ -1,9 +1,15 @@
 """
 Step 4-5: 리포트 생성기
 - 스코어링 결과 + RAG 뉴스 → Gemini LLM → 투자 분석 리포트
+- generate_report_async: client.aio 기반 비동기 버전 (async /stock/analyze)
+- 리포트 캐시: 리포트 내용을 결정하는 입력만으로 키를 만들어 사용자 간 공유
+  (종목코드, 스타일 태그, 정수로 반올림한 점수, 검색된 뉴스 묶음 해시, 종목 뉴스 버전)
+  → 새 뉴스가 저장되면 뉴스 버전이 올라가 다음 요청부터 새 리포트
 """
 
+import asyncio
 import os
+import hashlib
 import logging
 import time
 from typing import AsyncGenerator
@@ -11,8 +17,20 @@ from typing import AsyncGenerator
 from google import genai
 from google.genai.errors import ClientError
 
+from app.infrastructure.news_pipeline import news_version, news_version_async
+from app.infrastructure.cache_codec import get_codec
+from app.infrastructure.tiered_cache import TieredCache
+
 logger = logging.getLogger(__name__)
 
+# 점수는 정수 단위로 반올림해 키에 넣는다 (소수점 차이로 리포트를 다시 만들지 않음)
+REPORT_SCORE_DECIMALS = 0
+
+report_cache = TieredCache(
+    "stock_report", redis_ttl=86400, l1_ttl=600, maxsize=2048,
+    codec=get_codec(legacy_loads=str, text=True),
+)
+
 
 def _get_client() -> genai.Client:
     api_key = os.getenv("GEMINI_API_KEY")
@@ -66,6 +84,30 @@ def _format_news_section(news_list: list[dict]) -> str:
     return "\n".join(lines)
 
 
+def news_digest(news_list: list[dict]) -> str:
+    """검색된 뉴스 묶음 해시 (순서 무관, 링크 기준)"""
+    ids = sorted(n.get("link") or n.get("title", "") for n in news_list)
+    return hashlib.md5("\n".join(ids).encode()).hexdigest()
+
+
+def report_scores(*scores: float) -> tuple[float, ...]:
+    """리포트에 쓰는 점수 (캐시 키와 프롬프트가 같은 값을 보도록 REPORT_SCORE_DECIMALS 로 반올림)"""
+    return tuple(round(score, REPORT_SCORE_DECIMALS) for score in scores)
+
+
+def report_cache_key(
+    stock_code: str,
+    style_tag: str,
+    scores: tuple[float, ...],
+    news_list: list[dict],
+    version: str,
+) -> str:
+    """리포트 캐시 키 (종목명은 종목코드로 정해지므로 제외)"""
+    rounded = ",".join(str(score) for score in report_scores(*scores))
+    raw = f"{stock_code}|{style_tag}|{rounded}|{news_digest(news_list)}|{version}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
 def generate_report(
     stock_code: str,
     stock_name: str,
@@ -75,9 +117,10 @@ def generate_report(
     similarity_score: float,
     composite_score: float,
     news_list: list[dict],
+    use_cache: bool = True,
 ) -> str:
     """
-    스코어링 + 뉴스 기반 투자 분석 리포트 생성
+    스코어링 + 뉴스 기반 투자 분석 리포트 생성 (리포트 캐시 우선)
 
     Args:
         stock_code: 종목코드
@@ -88,22 +131,22 @@ def generate_report(
         similarity_score: 유사도 점수
         composite_score: 종합 점수
         news_list: RAG 검색 결과 뉴스 리스트
+        use_cache: 리포트 캐시 사용 여부 (LLM 실패 시의 기본 문구는 저장하지 않음)
 
     Returns:
         LLM 생성 리포트 텍스트
     """
-    news_section = _format_news_section(news_list)
+    scores = report_scores(growth_score, stability_score, similarity_score, composite_score)
+    cache_key = None
+    if use_cache:
+        cache_key = report_cache_key(
+            stock_code, style_tag, scores, news_list, news_version(stock_code)
+        )
+        cached = report_cache.get(cache_key)
+        if cached:
+            return cached
 
-    prompt = REPORT_PROMPT.format(
-        stock_code=stock_code,
-        stock_name=stock_name,
-        style_tag=style_tag,
-        growth_score=growth_score,
-        stability_score=stability_score,
-        similarity_score=similarity_score,
-        composite_score=composite_score,
-        news_section=news_section,
-    )
+    prompt = _build_prompt(stock_code, stock_name, style_tag, *scores, news_list)
 
     client = _get_client()
     max_retries = 3
@@ -116,6 +159,8 @@ def generate_report(
             )
             report = response.text.strip()
             if report:
+                if cache_key:
+                    report_cache.set(cache_key, report)
                 return report
         except ClientError as e:
             error_str = str(e)
@@ -132,10 +177,10 @@ def generate_report(
                 continue
             break
 
-    return f"{stock_name}({stock_code})의 종합 점수는 {composite_score}점입니다. (현재 AI 분석량이 많아 상세 리포트를 생성하지 못했습니다.)"
+    return _fallback_report(stock_code, stock_name, scores[-1])
 
 
-async def generate_report_stream(
+async def generate_report_async(
     stock_code: str,
     stock_name: str,
     style_tag: str,
@@ -144,15 +189,67 @@ async def generate_report_stream(
     similarity_score: float,
     composite_score: float,
     news_list: list[dict],
-) -> AsyncGenerator[str, None]:
+    use_cache: bool = True,
+) -> str:
     """
-    Gemini 스트리밍으로 리포트를 토큰 단위로 생성 (SSE용)
+    generate_report 비동기 버전 (client.aio, 같은 리포트 캐시/재시도 규칙)
 
-    Yields:
-        str: Gemini가 생성하는 텍스트 청크
+    뉴스 버전/리포트 캐시 조회·저장은 redis.asyncio 로 기다린다 (스레드풀을 쓰지 않음)
     """
-    news_section = _format_news_section(news_list)
-    prompt = REPORT_PROMPT.format(
+    scores = report_scores(growth_score, stability_score, similarity_score, composite_score)
+    cache_key = None
+    if use_cache:
+        version = await news_version_async(stock_code)
+        cache_key = report_cache_key(stock_code, style_tag, scores, news_list, version)
+        cached = await report_cache.get_async(cache_key)
+        if cached:
+            return cached
+
+    prompt = _build_prompt(stock_code, stock_name, style_tag, *scores, news_list)
+
+    client = _get_client()
+    max_retries = 3
+
+    for attempt in range(max_retries):
+        try:
+            response = await client.aio.models.generate_content(
+                model="models/gemini-2.5-flash",
+                contents=prompt,
+            )
+            report = response.text.strip()
+            if report:
+                if cache_key:
+                    await report_cache.set_async(cache_key, report)
+                return report
+        except ClientError as e:
+            error_str = str(e)
+            if "429" in error_str or "503" in error_str:
+                if attempt < max_retries - 1:
+                    await asyncio.sleep(2)
+                    continue
+            logger.error("리포트 생성 API 오류: %s", e)
+            break
+        except Exception as e:
+            logger.error("리포트 생성 실패: %s", e)
+            if attempt < max_retries - 1:
+                await asyncio.sleep(1)
+                continue
+            break
+
+    return _fallback_report(stock_code, stock_name, scores[-1])
+
+
+def _build_prompt(
+    stock_code: str,
+    stock_name: str,
+    style_tag: str,
+    growth_score: float,
+    stability_score: float,
+    similarity_score: float,
+    composite_score: float,
+    news_list: list[dict],
+) -> str:
+    return REPORT_PROMPT.format(
         stock_code=stock_code,
         stock_name=stock_name,
         style_tag=style_tag,
@@ -160,9 +257,34 @@ async def generate_report_stream(
         stability_score=stability_score,
         similarity_score=similarity_score,
         composite_score=composite_score,
-        news_section=news_section,
+        news_section=_format_news_section(news_list),
     )
 
+
+def _fallback_report(stock_code: str, stock_name: str, composite_score: float) -> str:
+    """LLM 호출이 모두 실패했을 때의 기본 문구 (캐시에 저장하지 않음)"""
+    return f"{stock_name}({stock_code})의 종합 점수는 {composite_score}점입니다. (현재 AI 분석량이 많아 상세 리포트를 생성하지 못했습니다.)"
+
+
+async def generate_report_stream(
+    stock_code: str,
+    stock_name: str,
+    style_tag: str,
+    growth_score: float,
+    stability_score: float,
+    similarity_score: float,
+    composite_score: float,
+    news_list: list[dict],
+) -> AsyncGenerator[str, None]:
+    """
+    Gemini 스트리밍으로 리포트를 토큰 단위로 생성 (SSE용)
+
+    Yields:
+        str: Gemini가 생성하는 텍스트 청크
+    """
+    scores = report_scores(growth_score, stability_score, similarity_score, composite_score)
+    prompt = _build_prompt(stock_code, stock_name, style_tag, *scores, news_list)
+
     client = _get_client()
     try:
         stream = await client.aio.models.generate_content_stream(
@@ -174,4 +296,4 @@ async def generate_report_stream(
                 yield chunk.text
     except Exception as e:
         logger.error("스트리밍 리포트 생성 실패: %s", e)
-        yield f"\n\n{stock_name}({stock_code})의 종합 점수는 {composite_score}점입니다. (스트리밍 오류로 상세 리포트를 생성하지 못했습니다.)"
+        yield f"\n\n{stock_name}({stock_code})의 종합 점수는 {scores[-1]}점입니다. (스트리밍 오류로 상세 리포트를 생성하지 못했습니다.)"
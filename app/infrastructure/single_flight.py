@@ -0,0 +1,228 @@
+"""
+캐시 미스 요청 합치기 (single-flight)
+- 같은 키가 동시에 캐시 미스 나면 한 호출만 계산하고 나머지는 그 결과를 기다린다
+- 프로세스 안: 키별 threading.Lock — 뒤에 온 스레드는 앞 스레드가 끝난 뒤 캐시를 다시 확인
+- 워커 간: Redis 짧은 락 (SET NX PX) — 락을 못 잡은 워커는 캐시에 결과가 생길 때까지 폴링
+- 기다리는 시간이 wait_timeout 을 넘거나 Redis를 쓸 수 없으면 직접 계산 (가용성 우선)
+
+compute 는 결과를 캐시에 저장하는 책임까지 진다. (기다리는 쪽은 lookup 으로 캐시만 본다)
+
+refresh_in_background: stale 값 갱신용 — 요청은 기다리지 않고, 키당 한 워커만 갱신
+async_single_flight: async 엔드포인트용 (같은 규칙, 대기 중 이벤트 루프를 막지 않음)
+refresh_in_background_async: async 엔드포인트의 stale 값 갱신 — 스레드풀 대신 이벤트 루프 Task
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Awaitable, Callable, TypeVar
+
+from app.infrastructure.redis_client import (
+    async_release_lock,
+    async_try_lock,
+    release_lock,
+    try_lock,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_local_locks: dict[str, list] = {}  # 키 → [Lock, 대기 수]
+_local_guard = threading.Lock()
+
+
+@contextmanager
+def _local_lock(key: str):
+    """키별 프로세스 내 락 (대기자가 없어지면 정리)"""
+    with _local_guard:
+        entry = _local_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            yield
+    finally:
+        with _local_guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                _local_locks.pop(key, None)
+
+
+def single_flight(
+    key: str,
+    lookup: Callable[[], T | None],
+    compute: Callable[[], T],
+    lock_ttl: float = 30.0,
+    wait_timeout: float = 30.0,
+    poll_interval: float = 0.1,
+) -> tuple[T, bool]:
+    """
+    캐시 미스 시 키당 한번만 compute 실행
+
+    Args:
+        key: 락 이름 (캐시 키와 같은 규칙, 예: "company_desc:삼성전자")
+        lookup: 캐시 조회 (없으면 None)
+        compute: 실제 계산 + 캐시 저장
+        lock_ttl: Redis 락 TTL (초) — 계산하던 워커가 죽어도 이 시간 뒤 풀림
+        wait_timeout: 다른 워커 결과를 기다리는 최대 시간 (초)
+
+    Returns:
+        (결과, 캐시에서 가져왔는지 여부)
+    """
+    lock_name = f"lock:{key}"
+    with _local_lock(key):
+        # 같은 프로세스의 앞선 호출이 이미 채웠을 수 있음
+        value = lookup()
+        if value is not None:
+            return value, True
+
+        deadline = time.monotonic() + wait_timeout
+        while True:
+            token = try_lock(lock_name, int(lock_ttl * 1000))
+            if token is not None:
+                try:
+                    return compute(), False
+                finally:
+                    release_lock(lock_name, token)
+
+            # 다른 워커가 계산 중 → 캐시에 결과가 생길 때까지 대기
+            time.sleep(poll_interval)
+            value = lookup()
+            if value is not None:
+                return value, True
+            if time.monotonic() >= deadline:
+                logger.warning("single-flight 대기 시간 초과, 직접 계산: %s", key)
+                return compute(), False
+
+
+_refresh_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-refresh")
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+
+
+def refresh_in_background(key: str, compute: Callable[[], object], lock_ttl: float = 60.0) -> bool:
+    """
+    stale 값 백그라운드 갱신 예약 (호출한 요청은 바로 반환)
+
+    - 같은 프로세스에서 이미 갱신 중인 키는 다시 예약하지 않는다
+    - 다른 워커가 Redis 락을 잡고 갱신 중이면 건너뛴다
+
+    Returns:
+        새로 예약했는지 여부
+    """
+    with _refreshing_lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+
+    def run():
+        lock_name = f"lock:{key}"
+        try:
+            token = try_lock(lock_name, int(lock_ttl * 1000))
+            if token is None:
+                return
+            try:
+                compute()
+            finally:
+                release_lock(lock_name, token)
+        except Exception as e:
+            logger.warning("백그라운드 갱신 실패 (stale 값 유지): %s — %s", key, e)
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    _refresh_executor.submit(run)
+    return True
+
+
+# ============================================================
+# asyncio 버전 — 기다리는 동안 이벤트 루프 스레드를 막지 않는다
+# ============================================================
+
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def async_single_flight(
+    key: str,
+    lookup: Callable[[], Awaitable[T | None]],
+    compute: Callable[[], Awaitable[T]],
+    lock_ttl: float = 30.0,
+    wait_timeout: float = 30.0,
+    poll_interval: float = 0.1,
+) -> tuple[T, bool]:
+    """
+    single_flight 의 asyncio 버전 (lookup/compute 는 코루틴 함수)
+
+    - 같은 프로세스: 키당 Task 하나를 모든 호출이 함께 기다린다
+    - 워커 간: Redis 락 (redis.asyncio) + 캐시 폴링 (asyncio.sleep)
+    - 먼저 온 요청이 끊겨도(취소) 계산은 계속되어 나머지 요청이 결과를 받는다
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _async_flight(key, lookup, compute, lock_ttl, wait_timeout, poll_interval)
+        )
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(task)
+
+
+async def _async_flight(key, lookup, compute, lock_ttl, wait_timeout, poll_interval):
+    lock_name = f"lock:{key}"
+    value = await lookup()
+    if value is not None:
+        return value, True
+
+    deadline = time.monotonic() + wait_timeout
+    while True:
+        token = await async_try_lock(lock_name, int(lock_ttl * 1000))
+        if token is not None:
+            try:
+                return await compute(), False
+            finally:
+                await async_release_lock(lock_name, token)
+
+        # 다른 워커가 계산 중 → 캐시에 결과가 생길 때까지 대기
+        await asyncio.sleep(poll_interval)
+        value = await lookup()
+        if value is not None:
+            return value, True
+        if time.monotonic() >= deadline:
+            logger.warning("single-flight 대기 시간 초과, 직접 계산: %s", key)
+            return await compute(), False
+
+
+_background_refreshes: set[asyncio.Task] = set()  # 실행 중인 갱신 Task 참조 (GC로 사라지지 않도록)
+
+
+def refresh_in_background_async(
+    key: str,
+    lookup: Callable[[], Awaitable[T | None]],
+    compute: Callable[[], Awaitable[T]],
+    lock_ttl: float = 60.0,
+) -> bool:
+    """
+    refresh_in_background 의 asyncio 버전 (실행 중인 이벤트 루프에 Task 예약, 요청은 바로 반환)
+
+    async_single_flight 로 실행하므로 같은 키의 계산과 합쳐지고 워커 간에는 Redis 락을 쓴다.
+    lookup 은 stale 이 아닌 값만 반환해야 한다 — 다른 워커가 먼저 갱신했으면 compute 를 건너뛴다.
+
+    Returns:
+        새로 예약했는지 여부
+    """
+    if key in _inflight:
+        return False
+
+    async def run():
+        try:
+            await async_single_flight(key, lookup, compute, lock_ttl=lock_ttl, wait_timeout=lock_ttl)
+        except Exception as e:
+            logger.warning("백그라운드 갱신 실패 (stale 값 유지): %s — %s", key, e)
+
+    task = asyncio.ensure_future(run())
+    _background_refreshes.add(task)
+    task.add_done_callback(_background_refreshes.discard)
+    return True
@@ -0,0 +1,249 @@
+"""
+2단 캐시 (L1 프로세스 메모리 → L2 Redis)
+- L1: 네임스페이스별 크기 제한 + TTL (cachetools.TTLCache), 디코딩된 객체를 그대로 보관
+  → 같은 워커 안의 반복 조회는 Redis 왕복도, json.loads 도 없다
+- L2: 공유 Redis (app.infrastructure.redis_client, 서킷 브레이커 적용)
+  값 직렬화는 app.infrastructure.cache_codec (기본 msgpack+zstd, 기존 JSON 값도 읽음)
+- get_async/set_async: async 엔드포인트용 (Redis는 redis.asyncio, L1은 같은 메모리 캐시)
+- L1 TTL은 Redis TTL을 넘지 않는다 (워커 간 불일치 허용 범위 = L1 TTL)
+- 히트/미스는 Prometheus 카운터로 집계 (namespace, tier 라벨)
+- 디코딩할 수 없는 Redis 값(손상/모르는 형식)은 미스로 처리 (로그는 일정 간격으로만)
+
+L1에서 꺼낸 값은 여러 요청이 공유하므로 호출부에서 수정하면 안 된다.
+
+SWRCache: soft/hard 만료 (stale-while-revalidate)
+- hard 만료 = Redis TTL (값이 아예 없어짐), soft 만료 = 저장 후 soft_ttl 초
+- soft 만료가 지난 값은 그대로 응답하고 호출부가 백그라운드로 갱신한다
+"""
+
+import json
+import logging
+import threading
+import time
+
+from cachetools import TTLCache
+from prometheus_client import Counter
+
+from app.infrastructure.cache_codec import DECODE_ERRORS, JsonCodec, get_codec
+from app.infrastructure.redis_client import (
+    async_cache_get,
+    async_cache_setex,
+    cache_get,
+    cache_mget,
+    cache_setex,
+    cache_setex_many,
+)
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = Counter(
+    "stockit_cache_lookups_total",
+    "캐시 조회 수 (tier: l1/redis, result: hit/miss)",
+    ["namespace", "tier", "result"],
+)
+
+_DECODE_LOG_INTERVAL = 60.0
+_last_decode_log_at = 0.0
+_decode_log_lock = threading.Lock()
+
+
+def _log_decode_error(key: str, error: Exception) -> None:
+    """디코딩 실패 로그는 _DECODE_LOG_INTERVAL 초에 한번만"""
+    global _last_decode_log_at
+    with _decode_log_lock:
+        now = time.monotonic()
+        if now - _last_decode_log_at < _DECODE_LOG_INTERVAL:
+            return
+        _last_decode_log_at = now
+    logger.warning("캐시 값 디코딩 실패 (미스로 처리): %s — %r", key, error)
+
+
+class TieredCache:
+    """
+    네임스페이스 하나의 L1 + Redis 캐시
+
+    Args:
+        namespace: Redis 키 접두사이자 메트릭 라벨 (예: "stock_score")
+        redis_ttl: Redis TTL (초)
+        l1_ttl: L1 TTL (초, redis_ttl 보다 크면 redis_ttl로 제한)
+        maxsize: L1 최대 항목 수 (넘으면 LRU 순으로 제거)
+        codec: Redis 값 직렬화 (기본 get_codec() — CACHE_CODEC 설정)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        redis_ttl: int,
+        l1_ttl: float,
+        maxsize: int,
+        codec: JsonCodec | None = None,
+    ):
+        self.namespace = namespace
+        self.redis_ttl = redis_ttl
+        self.l1_ttl = min(l1_ttl, redis_ttl)
+        self._l1 = TTLCache(maxsize=maxsize, ttl=self.l1_ttl)
+        self._lock = threading.Lock()  # TTLCache는 스레드 안전하지 않음 (sync 엔드포인트는 스레드풀)
+        self.codec = codec or get_codec()
+        self._dumps = self.codec.dumps
+        self._loads = self.codec.loads
+        self._counters = {
+            (tier, result): CACHE_LOOKUPS.labels(namespace=namespace, tier=tier, result=result)
+            for tier in ("l1", "redis")
+            for result in ("hit", "miss")
+        }
+
+    def redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def _count(self, tier: str, result: str, n: int = 1) -> None:
+        if n:
+            self._counters[(tier, result)].inc(n)
+
+    def _l1_get(self, key: str):
+        with self._lock:
+            return self._l1.get(key)
+
+    def _l1_set(self, key: str, value) -> None:
+        with self._lock:
+            self._l1[key] = value
+
+    def get(self, key: str):
+        """L1 → Redis 순서로 조회 (없으면 None). Redis 히트는 L1에 채운다."""
+        value = self._l1_get(key)
+        if value is not None:
+            self._count("l1", "hit")
+            return value
+        self._count("l1", "miss")
+
+        return self._from_redis(key, cache_get(self.redis_key(key), binary=True))
+
+    async def get_async(self, key: str):
+        """get 의 asyncio 버전"""
+        value = self._l1_get(key)
+        if value is not None:
+            self._count("l1", "hit")
+            return value
+        self._count("l1", "miss")
+
+        return self._from_redis(key, await async_cache_get(self.redis_key(key), binary=True))
+
+    def _decode(self, key: str, raw):
+        """Redis 값 디코딩 — 손상된 값은 None (미스)"""
+        try:
+            return self._loads(raw)
+        except DECODE_ERRORS as e:
+            _log_decode_error(self.redis_key(key), e)
+            return None
+
+    def _from_redis(self, key: str, raw):
+        value = self._decode(key, raw) if raw else None
+        if value is None:
+            self._count("redis", "miss")
+            return None
+        self._count("redis", "hit")
+        self._l1_set(key, value)
+        return value
+
+    def get_many(self, keys: list[str]) -> list:
+        """여러 키 조회 — L1 미스만 MGET 한번으로 Redis 조회 (요청 순서 유지)"""
+        values = [self._l1_get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        self._count("l1", "hit", len(keys) - len(missing))
+        self._count("l1", "miss", len(missing))
+        if not missing:
+            return values
+
+        raws = cache_mget([self.redis_key(keys[i]) for i in missing], binary=True)
+        hits = 0
+        for i, raw in zip(missing, raws):
+            value = self._decode(keys[i], raw) if raw else None
+            if value is not None:
+                values[i] = value
+                self._l1_set(keys[i], value)
+                hits += 1
+        self._count("redis", "hit", hits)
+        self._count("redis", "miss", len(missing) - hits)
+        return values
+
+    def set(self, key: str, value) -> None:
+        self._l1_set(key, value)
+        cache_setex(self.redis_key(key), self.redis_ttl, self._dumps(value))
+
+    async def set_async(self, key: str, value) -> None:
+        self._l1_set(key, value)
+        await async_cache_setex(self.redis_key(key), self.redis_ttl, self._dumps(value))
+
+    def set_many(self, items: list[tuple[str, object]]) -> None:
+        """(키, 값) 목록 저장 — Redis는 파이프라인 1회 왕복"""
+        for key, value in items:
+            self._l1_set(key, value)
+        cache_setex_many(
+            [(self.redis_key(key), self._dumps(value)) for key, value in items],
+            self.redis_ttl,
+        )
+
+    def clear_local(self) -> None:
+        """L1만 비우기 (테스트/스냅샷 교체용)"""
+        with self._lock:
+            self._l1.clear()
+
+
+def decode_swr_entry(raw: str) -> dict:
+    """
+    SWRCache 저장 형식 {"value", "stored_at"} 디코딩
+
+    이전 형식(순수 문자열, 또는 봉투 없는 JSON)은 stored_at=0 으로 읽어
+    바로 응답하되 즉시 갱신 대상이 되게 한다.
+    """
+    try:
+        entry = json.loads(raw)
+    except ValueError:
+        return {"value": raw, "stored_at": 0}
+    if isinstance(entry, dict) and set(entry) == {"value", "stored_at"}:
+        return entry
+    return {"value": entry, "stored_at": 0}
+
+
+def swr_codec() -> JsonCodec:
+    """SWRCache 용 코덱 (이전 형식 값은 decode_swr_entry 로 읽음)"""
+    return get_codec(legacy_loads=decode_swr_entry)
+
+
+class SWRCache:
+    """
+    TieredCache 위의 soft/hard 만료 (stale-while-revalidate)
+
+    Args:
+        cache: codec=swr_codec() 로 만든 TieredCache (redis_ttl 이 hard TTL)
+        soft_ttl: 이 시간(초)이 지난 값은 stale 로 표시
+    """
+
+    def __init__(self, cache: TieredCache, soft_ttl: float):
+        self.cache = cache
+        self.soft_ttl = soft_ttl
+
+    def redis_key(self, key: str) -> str:
+        return self.cache.redis_key(key)
+
+    def get(self, key: str) -> tuple:
+        """(값, stale 여부) — 값이 없으면 (None, False)"""
+        entry = self.cache.get(key)
+        if entry is None:
+            return None, False
+        return self._unwrap(entry)
+
+    async def get_async(self, key: str) -> tuple:
+        """get 의 asyncio 버전"""
+        entry = await self.cache.get_async(key)
+        if entry is None:
+            return None, False
+        return self._unwrap(entry)
+
+    def _unwrap(self, entry: dict) -> tuple:
+        return entry["value"], time.time() - entry["stored_at"] >= self.soft_ttl
+
+    def set(self, key: str, value) -> None:
+        self.cache.set(key, {"value": value, "stored_at": time.time()})
+
+    async def set_async(self, key: str, value) -> None:
+        await self.cache.set_async(key, {"value": value, "stored_at": time.time()})
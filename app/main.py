@@ -1,4 +1,6 @@
-from fastapi import FastAPI
+import os
+
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 # ⛔️ 잘못된 경로 (컨테이너 안에서는 'domain'이 루트가 아님)
@@ -10,6 +12,13 @@ from app.domain.stock_analyze.controller import router as stock_router
 from app.domain.portfolio_analyze.controller import router as portfolio_router
 from app.domain.company_describe.controller import router as company_router
 from app.domain.performance_test.controller import router as performance_router
+from app.domain.model_snapshot.controller import router as model_router
+from app.ai_models.snapshot import (
+    get_snapshot,
+    pin_snapshot,
+    unpin_snapshot,
+    start_snapshot_watcher,
+)
 
 from prometheus_fastapi_instrumentator import Instrumentator
 
@@ -31,9 +40,37 @@ app.add_middleware(
 Instrumentator().instrument(app).expose(app)
 
 
+@app.middleware("http")
+async def pin_model_snapshot(request: Request, call_next):
+    """요청 시작 시점의 종목 DB/모델 스냅샷을 고정하고 버전을 응답 헤더로 반환"""
+    snapshot, token = pin_snapshot()
+    try:
+        response = await call_next(request)
+    finally:
+        unpin_snapshot(token)
+    response.headers["X-Model-Version"] = snapshot.version
+    return response
+
+
 @app.on_event("startup")
 async def startup():
-    pass
+    # 종목 DB/모델 스냅샷 미리 로드 + 파일 변경 감시 (0이면 감시 안 함)
+    get_snapshot()
+    watch_interval = float(os.getenv("SNAPSHOT_WATCH_INTERVAL", "60"))
+    if watch_interval > 0:
+        start_snapshot_watcher(watch_interval)
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    # async 엔드포인트가 만든 HTTP 클라이언트 / asyncpg 풀 / redis.asyncio 풀 정리
+    from app.infrastructure.naver_news_client import close_async_client
+    from app.infrastructure.pgvector_client import close_async_pool
+    from app.infrastructure.redis_client import close_async_clients
+
+    await close_async_client()
+    await close_async_pool()
+    await close_async_clients()
 
 
 app.include_router(stock_router, prefix="/stock", tags=["Stock Analyze"])
@@ -42,6 +79,7 @@ app.include_router(company_router, prefix="/company", tags=["Company Describe"])
 app.include_router(
     performance_router, prefix="/test/performance", tags=["Performance Test"]
 )
+app.include_router(model_router, prefix="/model", tags=["Model Snapshot"])
 
 
 @app.get("/")
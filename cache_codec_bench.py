@@ -0,0 +1,119 @@
+"""
+캐시 직렬화 벤치마크 (기존 JSON 텍스트 vs msgpack+zstd)
+
+실제 캐시에 들어가는 모양의 값으로 크기와 인코딩/디코딩 시간을 비교한다.
+    - stock_analyze: 분석 결과 + 한국어 리포트 (300~500자)
+    - stock_report: 리포트 문자열
+    - company_desc: 기업 설명 (SWR 봉투)
+    - stock_intrinsic / stock_score_user: 종목 점수 / [유사도, 종합 점수]
+    - portfolio_vec: 포트폴리오 평균 벡터
+    - recommend_list: 추천 종목 목록 (50개)
+
+사용법:
+    python cache_codec_bench.py [--repeat 2000]
+"""
+
+import argparse
+import json
+import time
+
+from app.infrastructure.cache_codec import JsonCodec, MsgpackZstdCodec
+
+REPORT_TEXT = (
+    "종합 평가: 삼성전자는 종합 점수 58.4점으로 안정성이 돋보이는 가치주입니다. "
+    "메모리 반도체 업황 회복과 HBM 수요 증가로 실적 개선이 기대됩니다.\n"
+    "강점 분석\n- 낮은 부채비율(25.4%)로 재무 안정성이 높습니다.\n"
+    "- 꾸준한 배당으로 주주환원 정책이 안정적입니다.\n"
+    "리스크 요인\n- 성장성 점수가 상대적으로 낮아 단기 모멘텀이 약합니다.\n"
+    "- 글로벌 경기 둔화 시 IT 수요 감소 가능성이 있습니다.\n"
+    "뉴스 기반 인사이트: 최근 뉴스는 AI 서버용 메모리 공급 확대와 파운드리 수주에 주목하고 있으며 "
+    "시장 분위기는 점진적 회복 기대감이 우세합니다.\n"
+    "투자 의견: 매수 — 업황 회복 국면에서 밸류에이션 부담이 낮습니다."
+)
+
+
+def sample_payloads() -> dict:
+    analyze = {
+        "value": {
+            "stock_code": "005930",
+            "stock_name": "삼성전자",
+            "final_style_tag": "안정형 가치주",
+            "style_description": "재무 구조가 탄탄하고 저평가된 대형 우량주 그룹입니다.",
+            "analyzable": True,
+            "reason": None,
+            "scores": {
+                "growth_score": 41.23,
+                "stability_score": 78.91,
+                "similarity_score": 50.0,
+                "composite_score": 58.4,
+            },
+            "report": REPORT_TEXT,
+        },
+        "stored_at": 1760000000.123,
+    }
+    recommend = [
+        {
+            "stock_code": f"{i:06d}",
+            "stock_name": f"추천종목{i}",
+            "style_tag": ("고성장 기술주", "안정형 가치주", "배당주", "경기민감주")[i % 4],
+            "similarity_score": round(91.25 - i * 0.37, 2),
+            "growth_score": round(40 + (i * 7.3) % 50, 2),
+            "stability_score": round(30 + (i * 11.9) % 60, 2),
+            "composite_score": round(75.05 - i * 0.29, 2),
+        }
+        for i in range(50)
+    ]
+    return {
+        "stock_analyze": analyze,
+        "stock_report": REPORT_TEXT,
+        "company_desc": {
+            "value": "삼성전자(Samsung Electronics)는 대한민국을 대표하는 세계적인 종합 전자 기업입니다. "
+            "메모리 반도체, 스마트폰, TV, 가전제품 등 광범위한 분야에서 글로벌 리더십을 가지고 있습니다.",
+            "stored_at": 1760000000.123,
+        },
+        "stock_intrinsic": {"growth_score": 41.23, "stability_score": 78.91, "cluster": 2},
+        "stock_score_user": [71.25, 63.05],
+        "portfolio_vec": {"feature": [0.123456789] * 6, "cluster": [0.25, 0.25, 0.5, 0.0]},
+        "recommend_list": recommend,
+    }
+
+
+def bench(codec, value, repeat: int) -> tuple[int, float, float]:
+    raw = codec.dumps(value)
+    size = len(raw.encode() if isinstance(raw, str) else raw)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        codec.dumps(value)
+    encode_us = (time.perf_counter() - started) / repeat * 1e6
+    stored = raw.encode() if isinstance(raw, str) else raw  # Redis에서 읽으면 bytes
+    started = time.perf_counter()
+    for _ in range(repeat):
+        codec.loads(stored)
+    decode_us = (time.perf_counter() - started) / repeat * 1e6
+    return size, encode_us, decode_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    json_codec, binary_codec = JsonCodec(), MsgpackZstdCodec()
+    report = {}
+    for name, value in sample_payloads().items():
+        j_size, j_enc, j_dec = bench(json_codec, value, args.repeat)
+        b_size, b_enc, b_dec = bench(binary_codec, value, args.repeat)
+        report[name] = {
+            "json_bytes": j_size,
+            "msgpack_zstd_bytes": b_size,
+            "size_ratio": round(b_size / j_size, 3),
+            "json_encode_us": round(j_enc, 2),
+            "msgpack_zstd_encode_us": round(b_enc, 2),
+            "json_decode_us": round(j_dec, 2),
+            "msgpack_zstd_decode_us": round(b_dec, 2),
+        }
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+캐시 키 히트율 비교 (기존 generate_cache_key vs 정규화 키)
+
+트래픽 파일(JSONL) 한 줄 = 요청 하나:
+    {"endpoint": "/stock/score" | "/stock/analyze", "body": {StockAnalyzeRequest JSON}}
+    (endpoint 없이 body만 있는 줄은 /stock/score 로 취급)
+
+사용법:
+    python cache_key_hitrate.py traffic.jsonl
+    python cache_key_hitrate.py --synthetic 20000   # 종목 DB로 가상 트래픽 생성
+
+캐시 크기/TTL 제한 없이 "이전에 같은 키가 나왔는가"로 히트를 센다.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from collections import Counter
+
+from app.domain.stock_analyze.cache_keys import analyze_cache_key, score_cache_key
+from app.domain.stock_analyze.dto import StockAnalyzeRequest
+
+
+def legacy_cache_key(request: StockAnalyzeRequest) -> str:
+    """정규화 전 generate_cache_key (재무지표 repr + 요청 순서 그대로의 포트폴리오 + 페르소나)"""
+    data_str = f"{request.stock_code}:{request.market_cap}:{request.per}:{request.pbr}:{request.roe}:{request.debt_ratio}:{request.dividend_yield}"
+    if request.portfolio_stocks:
+        portfolio_str = ",".join(f"{s.stock_code}:{s.investment_amount}" for s in request.portfolio_stocks)
+        data_str += f":{portfolio_str}"
+    if request.persona:
+        data_str += f":{request.persona}"
+    return f"stock_analyze:{hashlib.md5(data_str.encode()).hexdigest()}"
+
+
+def load_traffic(path: str):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            body = row.get("body", row)
+            yield row.get("endpoint", "/stock/score"), StockAnalyzeRequest(**body)
+
+
+def synthetic_traffic(n: int, seed: int = 0):
+    """
+    종목 DB 기반 가상 트래픽
+    - 인기 종목 편중 (상위 50개가 대부분), 사용자 200명 (보유 종목 1~5개)
+    - 같은 사용자가 보유 종목 순서를 바꿔 보내거나, 전체 금액만 달라진 경우 포함
+    - 정수/실수 표현 차이, 없는 페르소나 이름 포함
+    """
+    from app.ai_models.scoring import PERSONA_WEIGHTS
+    from app.ai_models.universe_store import read_stock_db
+
+    rng = random.Random(seed)
+    stock_db = read_stock_db()
+    codes = list(stock_db.index)
+    hot = codes[:50]
+
+    def fundamentals(code, as_int=False):
+        row = stock_db.loc[code]
+        values = {
+            "market_cap": float(row["시가총액"]),
+            "per": round(float(row["per"]), 2),
+            "pbr": round(float(row["pbr"]), 2),
+            "roe": round(float(row["ROE"]), 2),
+            "debt_ratio": round(float(row["부채비율"]), 2),
+            "dividend_yield": round(float(row["배당수익률"]), 2),
+        }
+        if as_int:
+            values = {k: int(v) if float(v).is_integer() else v for k, v in values.items()}
+        return values
+
+    personas = [None, *PERSONA_WEIGHTS, "알수없는페르소나"]
+    users = []
+    for _ in range(200):
+        holdings = [
+            dict(stock_code=c, investment_amount=rng.choice([1, 2, 3, 5]) * 1_000_000, **fundamentals(c))
+            for c in rng.sample(codes, rng.randint(1, 5))
+        ]
+        users.append((holdings, rng.choice(personas)))
+
+    for _ in range(n):
+        code = rng.choice(hot) if rng.random() < 0.8 else rng.choice(codes)
+        holdings, persona = rng.choice(users)
+        holdings = list(holdings)
+        if rng.random() < 0.3:
+            rng.shuffle(holdings)
+        if rng.random() < 0.2:
+            scale = rng.choice([2, 10])
+            holdings = [dict(h, investment_amount=h["investment_amount"] * scale) for h in holdings]
+        body = dict(fundamentals(code, as_int=rng.random() < 0.5), stock_code=code)
+        endpoint = "/stock/analyze" if rng.random() < 0.3 else "/stock/score"
+        if rng.random() < 0.7:
+            body.update(portfolio_stocks=holdings, persona=persona)
+        yield endpoint, StockAnalyzeRequest(**body)
+
+
+def compare(traffic) -> dict:
+    seen_legacy, seen_new = set(), set()
+    hits = Counter()
+    totals = Counter()
+    for endpoint, request in traffic:
+        totals[endpoint] += 1
+        old_key = f"{endpoint}:{legacy_cache_key(request)}"
+        if endpoint == "/stock/analyze":
+            new_key = "analyze:" + analyze_cache_key(request)
+        else:
+            new_key = "score:" + score_cache_key(request)
+        hits[("legacy", endpoint)] += old_key in seen_legacy
+        hits[("new", endpoint)] += new_key in seen_new
+        seen_legacy.add(old_key)
+        seen_new.add(new_key)
+
+    report = {}
+    for endpoint, total in sorted(totals.items()):
+        report[endpoint] = {
+            "requests": total,
+            "legacy_hit_rate": round(hits[("legacy", endpoint)] / total * 100, 2),
+            "new_hit_rate": round(hits[("new", endpoint)] / total * 100, 2),
+        }
+    report["distinct_keys"] = {"legacy": len(seen_legacy), "new": len(seen_new)}
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("traffic", nargs="?", help="요청 JSONL 파일")
+    parser.add_argument("--synthetic", type=int, default=0, help="가상 요청 수")
+    args = parser.parse_args()
+
+    if args.traffic:
+        traffic = load_traffic(args.traffic)
+    elif args.synthetic:
+        traffic = synthetic_traffic(args.synthetic)
+    else:
+        parser.print_help()
+        sys.exit(1)
+    print(json.dumps(compare(traffic), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+공통 테스트 픽스처
+- fake_redis: 캐시(tiered_cache)와 single-flight 락이 쓰는 Redis 헬퍼를 dict 기반 가짜로 대체
+  (동기/async 헬퍼 모두, 락은 항상 획득)
+- csv_snapshot: 유니버스 저장소 없이 CSV에서 만든 스냅샷 (서빙 경로의 CSV 대체 로더와 동일)
+"""
+import pytest
+
+from app.ai_models.inference import load_style_model
+from app.ai_models.snapshot import ModelSnapshot
+from app.ai_models.stock_filters import is_valid_stock_for_analysis
+from app.ai_models.universe_store import MODEL_DIR, load_universe_csv
+from app.infrastructure import single_flight, tiered_cache
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.reads = 0
+
+    def get(self, key, binary=False):
+        self.reads += 1
+        return self.store.get(key)
+
+    def mget(self, keys, binary=False):
+        self.reads += 1
+        return [self.store.get(k) for k in keys]
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+        return True
+
+    def setex_many(self, items, ttl):
+        self.store.update(items)
+        return True
+
+    async def async_get(self, key, binary=False):
+        return self.get(key, binary)
+
+    async def async_setex(self, key, ttl, value):
+        return self.setex(key, ttl, value)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    fake = FakeRedis()
+    monkeypatch.setattr(tiered_cache, "cache_get", fake.get)
+    monkeypatch.setattr(tiered_cache, "cache_mget", fake.mget)
+    monkeypatch.setattr(tiered_cache, "cache_setex", fake.setex)
+    monkeypatch.setattr(tiered_cache, "cache_setex_many", fake.setex_many)
+    monkeypatch.setattr(tiered_cache, "async_cache_get", fake.async_get)
+    monkeypatch.setattr(tiered_cache, "async_cache_setex", fake.async_setex)
+
+    async def async_try_lock(name, ttl_ms):
+        return "token"
+
+    async def async_release_lock(name, token):
+        return None
+
+    monkeypatch.setattr(single_flight, "try_lock", lambda name, ttl_ms: "token")
+    monkeypatch.setattr(single_flight, "release_lock", lambda name, token: None)
+    monkeypatch.setattr(single_flight, "async_try_lock", async_try_lock)
+    monkeypatch.setattr(single_flight, "async_release_lock", async_release_lock)
+    return fake
+
+
+@pytest.fixture(scope="session")
+def csv_snapshot() -> ModelSnapshot:
+    style_model = load_style_model(MODEL_DIR)
+    stock_db, universe = load_universe_csv(style_model, is_valid_stock_for_analysis)
+    return ModelSnapshot("csv", stock_db, style_model, universe)
@@ -385,6 +385,10 @@ def collect_all_data():
 if __name__ == "__main__":
     if ACCESS_TOKEN:
         collect_all_data()
+
+        # 서빙용 style_model.npz / 유니버스 저장소를 새 CSV 기준으로 다시 생성
+        from app.ai_models.universe_store import rebuild_serving_artifacts
+        print(f"유니버스 저장소 갱신 완료: {rebuild_serving_artifacts()}")
     else:
         print("토큰 발급에 실패하여 프로그램을 종료합니다.")
 
@@ -25,3 +25,13 @@ CREATE INDEX IF NOT EXISTS idx_news_pub_date   ON news_embeddings (pub_date DESC
 CREATE INDEX IF NOT EXISTS idx_news_embedding ON news_embeddings
     USING hnsw (embedding vector_cosine_ops)
     WITH (m = 16, ef_construction = 64);
+
+-- 기업 설명 (Gemini 생성 결과 영구 저장, 일괄 워밍업/캐시 재적재용)
+CREATE TABLE IF NOT EXISTS company_descriptions (
+    stock_code   VARCHAR(20)  PRIMARY KEY,      -- 종목코드 (예: '005930')
+    company_name VARCHAR(100) NOT NULL,         -- 종목명 (예: '삼성전자')
+    description  TEXT         NOT NULL,         -- 두 문장 요약
+    updated_at   TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_company_desc_name ON company_descriptions (company_name);
@@ -0,0 +1,100 @@
+"""
+비동기 /stock/analyze 테스트 (네트워크 클라이언트는 가짜로 대체)
+- 동기 경로와 같은 결과를 내는지
+- 뉴스 수집과 쿼리 임베딩이 동시에 진행되는지
+- stale 값은 바로 응답하고, 갱신은 비동기 경로로 키당 한번만 하는지
+"""
+import asyncio
+import time
+
+from app.domain.stock_analyze import service
+from app.domain.stock_analyze.dto import StockAnalyzeRequest
+from app.infrastructure import news_pipeline, report_generator, single_flight
+
+NEWS = [{"title": "삼성전자 HBM 공급", "description": "", "link": "https://n/1", "similarity": 0.9}]
+
+REQUEST = StockAnalyzeRequest(
+    stock_code="005930", market_cap=6363611.0, per=21.72, pbr=1.86,
+    roe=6.64, debt_ratio=26.36, dividend_yield=370.0,
+)
+
+
+def _patch(monkeypatch, timeline):
+    async def collect(stock_code, stock_name, display=20):
+        timeline.append(("collect", time.monotonic()))
+        await asyncio.sleep(0.1)
+        return 1
+
+    async def embed(text):
+        timeline.append(("embed", time.monotonic()))
+        await asyncio.sleep(0.1)
+        return [0.1] * 3
+
+    async def search(stock_code, query_embedding, top_k=5, days=30):
+        timeline.append(("search", time.monotonic()))
+        return NEWS
+
+    async def report_async(**kwargs):
+        return f"{kwargs['stock_name']} 리포트 ({len(kwargs['news_list'])}건)"
+
+    monkeypatch.setattr(news_pipeline, "collect_and_store_news_async", collect)
+    monkeypatch.setattr(news_pipeline, "embed_text_async", embed)
+    monkeypatch.setattr(news_pipeline, "search_similar_news_async", search)
+    monkeypatch.setattr(report_generator, "generate_report_async", report_async)
+
+    # 동기 경로용
+    monkeypatch.setattr(news_pipeline, "collect_and_store_news", lambda *a, **k: 1)
+    monkeypatch.setattr(news_pipeline, "embed_text", lambda text: [0.1] * 3)
+    monkeypatch.setattr(news_pipeline, "search_similar_news", lambda *a, **k: NEWS)
+    monkeypatch.setattr(
+        report_generator,
+        "generate_report",
+        lambda **kwargs: f"{kwargs['stock_name']} 리포트 ({len(kwargs['news_list'])}건)",
+    )
+
+
+def test_async_matches_sync_and_overlaps_steps(monkeypatch):
+    timeline = []
+    _patch(monkeypatch, timeline)
+
+    result = asyncio.run(service.analyze_stock_async(REQUEST, use_cache=False))
+    assert result == service.analyze_stock(REQUEST, use_cache=False)
+    assert result["analyzable"] and result["report"] == "삼성전자 리포트 (1건)"
+
+    started = dict(timeline)
+    assert abs(started["collect"] - started["embed"]) < 0.05  # 동시에 시작
+    assert started["search"] - started["collect"] >= 0.1  # 검색은 수집이 끝난 뒤
+
+
+def test_collect_failure_still_searches_stored_news(monkeypatch):
+    timeline = []
+    _patch(monkeypatch, timeline)
+
+    async def failing_collect(stock_code, stock_name, display=20):
+        raise RuntimeError("naver down")
+
+    monkeypatch.setattr(news_pipeline, "collect_and_store_news_async", failing_collect)
+    assert asyncio.run(news_pipeline.retrieve_news_async("005930", "삼성전자")) == NEWS
+
+
+def test_stale_hit_refreshes_with_async_pipeline(monkeypatch, fake_redis):
+    timeline = []
+    _patch(monkeypatch, timeline)
+    monkeypatch.setattr(report_generator, "generate_report", None)  # 동기 경로를 타면 실패
+    service.analyze_cache.cache.clear_local()
+
+    snapshot = service.get_snapshot()
+    cache_key = service.analyze_cache_key(REQUEST, snapshot.version)
+    service.analyze_cache.cache.set(cache_key, {"value": {"report": "오래된 리포트"}, "stored_at": 0})
+
+    async def run():
+        stale = await asyncio.gather(*(service.analyze_stock_async(REQUEST) for _ in range(3)))
+        await asyncio.gather(*single_flight._background_refreshes)
+        return stale, await service.analyze_stock_async(REQUEST)
+
+    stale, refreshed = asyncio.run(run())
+    assert [r["report"] for r in stale] == ["오래된 리포트"] * 3
+    assert refreshed["report"] == "삼성전자 리포트 (1건)"
+    assert service.analyze_cache.get(cache_key) == (refreshed, False)
+    assert [step for step, _ in timeline].count("collect") == 1
+    service.analyze_cache.cache.clear_local()
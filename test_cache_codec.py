@@ -0,0 +1,44 @@
+"""
+캐시 코덱 테스트
+- msgpack+zstd 왕복, 작은 값은 압축하지 않음, 기존 JSON/문자열 값도 읽힘
+"""
+import json
+
+from app.infrastructure.cache_codec import (
+    FORMAT_MSGPACK,
+    FORMAT_MSGPACK_ZSTD,
+    JsonCodec,
+    MsgpackZstdCodec,
+    get_codec,
+)
+from app.infrastructure.tiered_cache import decode_swr_entry
+
+REPORT = {
+    "stock_code": "005930",
+    "stock_name": "삼성전자",
+    "analyzable": True,
+    "scores": {"growth_score": 61.23, "composite_score": 58.4},
+    "report": "종합 평가: 메모리 반도체 업황 회복으로 실적 개선이 기대됩니다. " * 10,
+}
+
+
+def test_round_trip_and_size():
+    codec = MsgpackZstdCodec()
+    raw = codec.dumps(REPORT)
+    assert raw[0] == FORMAT_MSGPACK_ZSTD
+    assert len(raw) < len(json.dumps(REPORT, ensure_ascii=False).encode())
+    assert codec.loads(raw) == REPORT
+
+    small = codec.dumps([55.0, 61.2])
+    assert small[0] == FORMAT_MSGPACK
+    assert codec.loads(small) == [55.0, 61.2]
+
+
+def test_reads_legacy_and_other_codec_values():
+    codec = MsgpackZstdCodec()
+    legacy = json.dumps(REPORT, ensure_ascii=False)
+    assert codec.loads(legacy.encode()) == REPORT
+    assert JsonCodec().loads(codec.dumps(REPORT)) == REPORT
+
+    swr = get_codec(legacy_loads=decode_swr_entry, name="msgpack-zstd")
+    assert swr.loads("기존 설명 문자열".encode()) == {"value": "기존 설명 문자열", "stored_at": 0}
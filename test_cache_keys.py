@@ -0,0 +1,43 @@
+"""
+캐시 키 정규화 테스트
+- 결과가 같은 요청은 같은 키, 결과가 다른 요청은 다른 키인지 검증
+"""
+from app.domain.stock_analyze.cache_keys import analyze_cache_key, score_cache_key
+from app.domain.stock_analyze.dto import StockAnalyzeRequest
+
+BASE = dict(stock_code="005930", market_cap=4.5e14, per=12, pbr=1.1, roe=9.5, debt_ratio=30, dividend_yield=2.1)
+HOLDINGS = [
+    dict(stock_code="000660", market_cap=1e14, per=8.0, pbr=1.5, roe=15.0, debt_ratio=40.0, dividend_yield=1.0, investment_amount=1_000_000),
+    dict(stock_code="035420", market_cap=3e13, per=20.0, pbr=1.2, roe=6.0, debt_ratio=50.0, dividend_yield=0.5, investment_amount=3_000_000),
+]
+
+
+def _request(**overrides):
+    return StockAnalyzeRequest(**{**BASE, **overrides})
+
+
+def test_score_key_is_canonical():
+    key = score_cache_key(_request(portfolio_stocks=HOLDINGS, persona="워렌 버핏"))
+
+    assert score_cache_key(_request(per=12.00001, portfolio_stocks=HOLDINGS[::-1], persona="워렌 버핏")) == key
+    # 금액 규모만 다르고 비중이 같으면 같은 키
+    scaled = [dict(h, investment_amount=h["investment_amount"] * 10) for h in HOLDINGS]
+    assert score_cache_key(_request(portfolio_stocks=scaled, persona="워렌 버핏")) == key
+    # 비중이 다르면 다른 키
+    reweighted = [HOLDINGS[0], dict(HOLDINGS[1], investment_amount=1_000_000)]
+    assert score_cache_key(_request(portfolio_stocks=reweighted, persona="워렌 버핏")) != key
+
+
+def test_score_key_ignores_inert_inputs():
+    key = score_cache_key(_request())
+
+    assert score_cache_key(_request(persona="없는 페르소나")) == key
+    zero = [dict(h, investment_amount=0) for h in HOLDINGS]
+    assert score_cache_key(_request(portfolio_stocks=zero)) == key
+    assert score_cache_key(_request(roe=9.6)) != key
+
+
+def test_analyze_key_ignores_portfolio_and_persona():
+    key = analyze_cache_key(_request())
+    assert analyze_cache_key(_request(portfolio_stocks=HOLDINGS, persona="워렌 버핏")) == key
+    assert analyze_cache_key(_request(), version="other") != key
@@ -0,0 +1,72 @@
+"""
+비동기 /company/describe 테스트 (Redis/Gemini/영구 저장소는 가짜로 대체)
+- 동시에 같은 기업을 요청해도 Gemini 호출은 한번인지
+- Gemini 응답을 기다리는 동안 이벤트 루프가 다른 작업을 계속 처리하는지
+- stale 값 백그라운드 갱신도 요청이 넘긴 client 를 쓰는지
+"""
+import asyncio
+from types import SimpleNamespace
+
+from app.domain.company_describe import service
+
+
+def test_concurrent_describes_share_one_call_without_blocking_loop(monkeypatch, fake_redis):
+    monkeypatch.setattr(service, "stock_code_for", lambda name: None)
+    service.description_cache.cache.clear_local()
+    calls = []
+
+    async def generate_content(model, contents):
+        calls.append(model)
+        await asyncio.sleep(0.1)
+        return SimpleNamespace(text=" 삼성전자는 반도체 기업입니다. ")
+
+    client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(generate_content=generate_content)))
+
+    async def run():
+        ticks = []
+
+        async def heartbeat():
+            for _ in range(5):
+                ticks.append(1)
+                await asyncio.sleep(0.01)
+
+        results = await asyncio.gather(
+            *(service.get_company_description_async("삼성전자", client=client) for _ in range(5)),
+            heartbeat(),
+        )
+        return results[:5], ticks
+
+    results, ticks = asyncio.run(run())
+    assert [description for description, _ in results] == ["삼성전자는 반도체 기업입니다."] * 5
+    assert len(calls) == 1
+    assert len(ticks) == 5
+    assert "company_desc:삼성전자" in fake_redis.store
+
+    # 두번째 요청은 캐시 히트
+    service.description_cache.cache.clear_local()
+    assert asyncio.run(service.get_company_description_async("삼성전자", client=client)) == (
+        "삼성전자는 반도체 기업입니다.",
+        True,
+    )
+    assert len(calls) == 1
+
+
+def test_stale_refresh_uses_callers_client(monkeypatch, fake_redis):
+    monkeypatch.setattr(service, "stock_code_for", lambda name: None)
+    service.description_cache.cache.clear_local()
+    service.description_cache.cache.set("카카오", {"value": "오래된 설명", "stored_at": 0})
+    refreshes = []
+    monkeypatch.setattr(service, "refresh_in_background", lambda key, compute: refreshes.append(compute))
+
+    prompts = []
+
+    def generate_content(model, contents):
+        prompts.append(contents)
+        return SimpleNamespace(text="새 설명")
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+
+    assert asyncio.run(service.get_company_description_async("카카오", client=client)) == ("오래된 설명", True)
+    assert len(refreshes) == 1
+    assert refreshes[0]() == ("새 설명", False)
+    assert len(prompts) == 1
@@ -0,0 +1,48 @@
+"""
+기업 설명 영구 저장소 테스트
+- Redis 미스 시 저장소에서 다시 채우고 LLM을 부르지 않는지
+- DB 장애는 미스로 처리하고 연속 실패 시 브레이커가 DB 호출을 건너뛰는지
+- CSV에서 만든 스냅샷에서도 종목명 → 종목코드를 찾는지 (겹치는 이름은 None)
+"""
+import psycopg2
+
+from app.domain.company_describe import service
+from app.infrastructure import description_store
+from app.infrastructure.redis_client import CircuitBreaker
+
+
+def test_cold_cache_refills_from_store(monkeypatch, fake_redis):
+    monkeypatch.setattr(service, "stock_code_for", lambda name: "005930")
+    monkeypatch.setattr(service, "load_description", lambda code: f"{code} 저장된 설명")
+
+    def no_llm():
+        raise AssertionError("LLM을 호출하면 안 됨")
+
+    monkeypatch.setattr(service, "get_gemini_client", no_llm)
+    service.description_cache.cache.clear_local()
+
+    assert service.get_company_description("삼성전자") == ("005930 저장된 설명", True)
+    assert "company_desc:삼성전자" in fake_redis.store
+
+
+def test_store_failure_is_a_miss_and_opens_breaker(monkeypatch):
+    calls = []
+
+    def broken_conn():
+        calls.append(1)
+        raise psycopg2.OperationalError("connection refused")
+
+    monkeypatch.setattr(description_store, "get_conn", broken_conn)
+    monkeypatch.setattr(description_store, "breaker", CircuitBreaker(failure_threshold=2, cooldown=60))
+
+    assert description_store.load_description("005930") is None
+    assert description_store.save_description("005930", "삼성전자", "설명") is False
+    assert description_store.load_description("005930") is None
+    assert len(calls) == 2
+
+
+def test_stock_code_for_on_csv_snapshot(csv_snapshot):
+    assert service.stock_code_for("동화약품", csv_snapshot) == "000020"
+    assert service.stock_code_for("삼성전자", csv_snapshot) == "005930"
+    assert service.stock_code_for("CJ", csv_snapshot) is None  # 여러 종목이 같은 이름
+    assert service.stock_code_for("없는기업", csv_snapshot) is None
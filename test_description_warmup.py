@@ -0,0 +1,80 @@
+"""
+기업 설명 일괄 워밍업 테스트 (Gemini 스텁 + 가짜 Redis/저장소)
+- 저장된 종목은 건너뛰고, 캐시에 있는 설명은 LLM 없이 저장, 실패 종목은 저장하지 않음
+- 대상 종목명은 CSV 스냅샷에서도 정리된 이름 (분석 불가 종목 제외)
+"""
+from types import SimpleNamespace
+
+from app.domain.company_describe import service
+from app.domain.company_describe.warmup import RateLimiter, universe_companies, warm_up
+
+
+class StubModels:
+    def __init__(self, failing: set[str]):
+        self.failing = failing
+        self.prompts = []
+
+    def generate_content(self, model, contents):
+        self.prompts.append(contents)
+        if any(f"'{name}'" in contents for name in self.failing):
+            return SimpleNamespace(text="")  # 빈 응답 → 재시도 후 실패
+        return SimpleNamespace(text="스텁 설명입니다.")
+
+
+def test_warm_up_skips_done_and_reports_failures(monkeypatch, fake_redis):
+    monkeypatch.setattr(service.time, "sleep", lambda seconds: None)
+    service.description_cache.cache.clear_local()
+    service.description_cache.set("캐시기업", "캐시에 있던 설명")
+    models = StubModels(failing={"실패기업"})
+    client = SimpleNamespace(models=models)
+    saved = {}
+
+    companies = [("000001", "완료기업"), ("000002", "캐시기업"), ("000003", "신규기업"), ("000004", "실패기업")]
+    stats = warm_up(
+        companies,
+        client=client,
+        done_codes={"000001"},
+        save=lambda code, name, desc: saved.__setitem__(code, desc),
+        rate=1000,
+        concurrency=2,
+    )
+
+    assert saved == {"000002": "캐시에 있던 설명", "000003": "스텁 설명입니다."}
+    assert stats["skipped"] == 1
+    assert (stats["from_cache"], stats["generated"], stats["failed"]) == (1, 1, 1)
+    assert stats["failures"] == ["000004"]
+    assert stats["api_calls"] == len(models.prompts) == 1 + 3  # 신규 1회 + 실패 종목 재시도 3회
+
+    # 이어서 실행: 저장된 종목은 LLM을 다시 부르지 않는다
+    rerun = warm_up(
+        companies,
+        client=SimpleNamespace(models=StubModels(failing=set())),
+        done_codes={"000001", *saved},
+        save=lambda code, name, desc: saved.__setitem__(code, desc),
+        rate=1000,
+    )
+    assert (rerun["generated"], rerun["api_calls"]) == (1, 1)
+    assert saved["000004"] == "스텁 설명입니다."
+
+
+def test_rate_limiter_spaces_calls():
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(rate=2, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.wait()
+    assert sleeps == [0.5, 0.5]
+
+
+def test_universe_companies_uses_clean_names(csv_snapshot):
+    companies = dict(universe_companies(csv_snapshot))
+
+    assert companies["000020"] == "동화약품"
+    assert all(" " not in name for name in companies.values())
+    assert all(csv_snapshot.lookup(code).analyzable for code in companies)
+    assert len(companies) < len(csv_snapshot.stock_db)
@@ -1,39 +1,13 @@
 """
-필터링 로직 단위 테스트 (의존성 없이)
+필터링 로직 단위 테스트 (표준 라이브러리만 쓰는 app.ai_models.stock_filters 규칙 그대로 사용)
 """
-import re
-
-
-def is_valid_stock_for_analysis(stock_name: str) -> bool:
-    """
-    스타일 태그 생성이 가능한 종목인지 검증
-    
-    Returns:
-        True: 분석 가능 (정상 종목)
-        False: 분석 불가 (SPAC, 우선주, 인버스 등)
-    """
-    if not stock_name or stock_name == "알 수 없는 종목":
-        return False
-
-    # 1. 우선주 필터링
-    if "(우)" in stock_name:
-        return False
-    # "숫자+우" 또는 "숫자+우+영문" 패턴 (예: 1우, 2우B, 3우C)
-    if re.search(r"\d+우[A-Z]?$", stock_name):
-        return False
-    # 종목명 끝이 "우"로 끝나는 경우 (예: SK텔레콤우, LG화학우)
-    if stock_name.endswith("우"):
-        return False
-
-    # 2. SPAC 필터링
-    if "스팩" in stock_name or "SPAC" in stock_name.upper():
-        return False
-
-    # 3. 인버스/레버리지 필터링
-    if "인버스" in stock_name or "레버리지" in stock_name:
-        return False
-
-    return True
+from app.ai_models.stock_filters import (
+    REASON_INVERSE_LEVERAGE,
+    REASON_PREFERRED,
+    REASON_SPAC,
+    build_stock_index,
+    is_valid_stock_for_analysis,
+)
 
 
 def test_normal_stocks():
@@ -148,6 +122,21 @@ def test_edge_cases():
     print()
 
 
+def test_stock_index():
+    """종목 인덱스: 정리된 종목명 + 분석 가능 여부 + 사유 코드"""
+    index = build_stock_index(
+        ["005930", "005935", "123456", "114800", "252670", "000000"],
+        ["삼성전자  ST3002700090000 NN0", "삼성전자1우", "교보18호스팩", "KODEX인버스", "KODEX 인버스", None],
+    )
+    assert index["005930"] == ("삼성전자", True, None)
+    assert index["005935"] == ("삼성전자1우", False, REASON_PREFERRED)
+    assert index["123456"].reason == REASON_SPAC
+    assert index["114800"].reason == REASON_INVERSE_LEVERAGE
+    assert index["252670"] == ("KODEX", True, None)  # 첫 단어만 남기는 기존 정리 규칙 그대로
+    assert index["000000"].name == "알 수 없는 종목"
+    assert not index["000000"].analyzable
+
+
 def main():
     print("\n" + "=" * 60)
     print("SPAC/우선주 필터링 로직 테스트")
@@ -159,6 +148,7 @@ def main():
     test_spac_stocks()
     test_inverse_etf()
     test_edge_cases()
+    test_stock_index()
     
     print("=" * 60)
     print("✅ 테스트 완료!")
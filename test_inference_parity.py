@@ -0,0 +1,63 @@
+"""
+sklearn-free 추론기 정합성 테스트
+- StyleModel 표준화/클러스터 예측 결과가 joblib StandardScaler/KMeans와 같은지 검증
+"""
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from app.ai_models.inference import StyleModel, load_style_model
+
+BASE_DIR = Path(__file__).resolve().parent / "app"
+MODEL_DIR = BASE_DIR / "ai_models"
+FEATURES = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
+
+
+def _load_sklearn():
+    scaler = joblib.load(str(MODEL_DIR / "scaler.pkl"))
+    model = joblib.load(str(MODEL_DIR / "kmeans_model.pkl"))
+    return scaler, model
+
+
+def _sample_features():
+    """전체 종목 + 섭동 + 분포 밖 랜덤 입력"""
+    df = pd.read_csv(BASE_DIR / "data" / "stockit_ai_features_v1.csv", dtype={"단축코드": str})
+    base = df[FEATURES].to_numpy(dtype=float)
+    rng = np.random.default_rng(0)
+    perturbed = base * rng.uniform(0.5, 1.5, size=base.shape)
+    random = rng.normal(size=(2000, 6)) * [1e5, 50, 5, 30, 200, 5]
+    return np.vstack([base, perturbed, random])
+
+
+def test_style_model_matches_sklearn():
+    scaler, model = _load_sklearn()
+    style_model = StyleModel.from_sklearn(scaler, model)
+    features = _sample_features()
+
+    expected_scaled = scaler.transform(pd.DataFrame(features, columns=FEATURES))
+    scaled = style_model.transform(features)
+
+    assert np.array_equal(scaled, expected_scaled)
+    assert np.array_equal(style_model.predict(scaled), model.predict(expected_scaled))
+
+
+def test_exported_style_model_is_current():
+    """저장된 style_model.npz 가 joblib 아티팩트와 같은 파라미터"""
+    scaler, model = _load_sklearn()
+    style_model = load_style_model(MODEL_DIR)
+
+    assert np.array_equal(style_model.mean, scaler.mean_)
+    assert np.array_equal(style_model.scale, scaler.scale_)
+    assert np.array_equal(style_model.centers, model.cluster_centers_)
+
+
+def test_style_model_single_row():
+    """1행 입력(요청 경로)도 2차원 결과"""
+    scaler, model = _load_sklearn()
+    style_model = StyleModel.from_sklearn(scaler, model)
+    row = _sample_features()[:1]
+
+    assert style_model.predict(style_model.transform(row)).shape == (1,)
+    assert style_model.predict(style_model.transform(row[0])).shape == (1,)
@@ -0,0 +1,22 @@
+"""
+종목 DB/모델 스냅샷 교체 테스트
+- 요청에 고정(pin)된 스냅샷은 재로드 후에도 그대로 유지되는지 검증
+"""
+from app.ai_models import snapshot as snap
+
+
+def test_reload_same_content_keeps_snapshot():
+    current = snap.get_snapshot()
+    assert snap.reload_snapshot() is current
+
+
+def test_pinned_snapshot_survives_reload():
+    pinned, token = snap.pin_snapshot()
+    try:
+        reloaded = snap.reload_snapshot(force=True)
+        assert reloaded is not pinned
+        assert reloaded.version == pinned.version
+        assert snap.get_snapshot() is pinned
+    finally:
+        snap.unpin_snapshot(token)
+    assert snap.get_snapshot() is reloaded
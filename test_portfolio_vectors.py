@@ -0,0 +1,71 @@
+"""
+포트폴리오 벡터 정합성 테스트
+- features.portfolio_vectors 가 기존 DataFrame 경로
+  (투자금액 가중평균 스케일링 벡터 + get_portfolio_style_vector)와 같은지 검증
+- 투자금액 0 종목, 종목 DB에 없는 종목, inf/NaN 지표 포함
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ai_models.features import portfolio_vectors
+from app.ai_models.snapshot import get_snapshot
+from app.domain.portfolio_analyze.service import get_portfolio_style_vector
+from app.domain.stock_analyze.recommend_dto import RecommendStock
+
+FEATURES = ["시가총액", "per", "pbr", "ROE", "부채비율", "배당수익률"]
+
+
+def _holding(code, amount, market_cap=6363611.0, per=21.72, pbr=1.86, roe=6.64, debt_ratio=26.36, dividend_yield=370.0):
+    return RecommendStock(stock_code=code, market_cap=market_cap, per=per, pbr=pbr, roe=roe,
+                          debt_ratio=debt_ratio, dividend_yield=dividend_yield, investment_amount=amount)
+
+
+def _reference_vectors(holdings, style_model):
+    """기존 DataFrame 경로 (compute_user_feature_vector + get_portfolio_style_vector)"""
+    rows = [
+        [h.market_cap, h.per, h.pbr, h.roe, h.debt_ratio, h.dividend_yield]
+        for h in holdings if h.investment_amount > 0
+    ]
+    amounts = np.array([h.investment_amount for h in holdings if h.investment_amount > 0])
+    if not rows:
+        return None, None
+
+    df = pd.DataFrame(rows, columns=FEATURES).replace([np.inf, -np.inf], np.nan).fillna(0)
+    feature_vector = np.average(style_model.transform(df), axis=0, weights=amounts / amounts.sum())
+
+    stocks_df = pd.DataFrame(
+        [[h.market_cap, h.per, h.pbr, h.roe, h.debt_ratio, h.dividend_yield, h.investment_amount] for h in holdings],
+        columns=[*FEATURES, "투자금액"],
+    )
+    cluster_vector, _ = get_portfolio_style_vector(stocks_df)
+    return feature_vector, cluster_vector
+
+
+CASES = {
+    "mixed": [
+        _holding("005930", 3_000_000),
+        _holding("000660", 1_000_000, market_cap=4069533.0, per=20.57, pbr=5.35, roe=37.52,
+                 debt_ratio=48.13, dividend_yield=7.5),
+        _holding("035720", 0, per=-40.0, roe=-3.0),  # 투자금액 0 → 제외
+        _holding("999999", 500_000, market_cap=1000.0, per=float("inf"), pbr=float("nan"),
+                 roe=-12.0, debt_ratio=310.0, dividend_yield=0.0),  # 종목 DB에 없음 + inf/NaN
+    ],
+    "single": [_holding("005930", 1)],
+    "all_zero": [_holding("005930", 0), _holding("000660", 0)],
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_portfolio_vectors_match_dataframe_path(name):
+    holdings = CASES[name]
+    style_model = get_snapshot().style_model
+
+    feature_vector, cluster_vector = portfolio_vectors(holdings, style_model)
+    expected_feature, expected_cluster = _reference_vectors(holdings, style_model)
+
+    if expected_feature is None:
+        assert feature_vector is None and cluster_vector is None
+        return
+    np.testing.assert_allclose(feature_vector, expected_feature, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(cluster_vector, expected_cluster, rtol=0, atol=1e-12)
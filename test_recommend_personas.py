@@ -0,0 +1,40 @@
+"""
+전체 페르소나 추천(/stock/recommend/personas) 테스트
+- 페르소나별 결과가 recommend_from_universe(..., persona=p) 단건 추천과 점수·순서까지 같은지
+- 분석 불가/DB에 없는 종목만 보유한 경우도 같은지
+"""
+import pytest
+
+from app.ai_models.scoring import PERSONA_WEIGHTS
+from app.domain.stock_analyze import service
+from app.domain.stock_analyze.recommend_dto import MultiPersonaRecommendRequest, RecommendRequest, RecommendStock
+
+ANALYZABLE = [
+    RecommendStock(stock_code="005930", market_cap=6363611.0, per=21.72, pbr=1.86, roe=6.64,
+                   debt_ratio=26.36, dividend_yield=370.0, investment_amount=3_000_000),
+    RecommendStock(stock_code="000660", market_cap=4069533.0, per=20.57, pbr=5.35, roe=37.52,
+                   debt_ratio=48.13, dividend_yield=7.5, investment_amount=1_000_000),
+]
+UNANALYZABLE = [
+    RecommendStock(stock_code="005935", market_cap=500000.0, per=18.0, pbr=1.5, roe=6.6,
+                   debt_ratio=26.0, dividend_yield=400.0, investment_amount=2_000_000),  # 우선주
+    RecommendStock(stock_code="999999", market_cap=1000.0, per=-3.0, pbr=0.4, roe=-12.0,
+                   debt_ratio=310.0, dividend_yield=0.0, investment_amount=500_000),  # DB에 없음
+]
+
+
+@pytest.mark.parametrize("holdings", [ANALYZABLE, UNANALYZABLE], ids=["analyzable", "unanalyzable"])
+def test_all_personas_match_single_persona(fake_redis, holdings):
+    top_n = 20
+    combined = service.recommend_stocks_all_personas(
+        MultiPersonaRecommendRequest(stocks=holdings, top_n=top_n)
+    )
+
+    assert [p["persona"] for p in combined["personas"]] == [None, *PERSONA_WEIGHTS]
+    for entry in combined["personas"]:
+        single = service.recommend_stocks(
+            RecommendRequest(stocks=holdings, persona=entry["persona"], top_n=top_n)
+        )
+        assert single["total_scored"] == combined["total_scored"]
+        assert entry["recommendations"] == single["recommendations"], entry["persona"]
+        assert len(entry["recommendations"]) == top_n
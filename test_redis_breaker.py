@@ -0,0 +1,41 @@
+"""
+Redis 서킷 브레이커 테스트
+- 연속 실패 시 쿨다운 동안 호출을 차단하고, 쿨다운 후 시험 호출 1회만 허용하는지 검증
+"""
+from app.infrastructure.redis_client import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_breaker_opens_after_threshold():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, cooldown=30, clock=clock)
+
+    for _ in range(2):
+        assert breaker.allow()
+        breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.record_failure()
+    assert breaker.is_open
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_allows_single_trial():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 31
+    assert breaker.allow()
+    assert not breaker.allow()  # 시험 호출 중에는 나머지 차단
+
+    breaker.record_success()
+    assert not breaker.is_open
+    assert breaker.allow()
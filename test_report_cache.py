@@ -0,0 +1,101 @@
+"""
+리포트 캐시 테스트 (Gemini 스텁 + 가짜 Redis)
+- 점수 소수점 차이는 같은 리포트, 뉴스 묶음/뉴스 버전이 바뀌면 새 리포트
+- 비동기 버전도 같은 캐시를 redis.asyncio 경로로 읽는지
+- 프롬프트/기본 문구의 점수가 캐시 키와 같은 반올림 값인지
+"""
+import asyncio
+from types import SimpleNamespace
+
+from app.infrastructure import report_generator
+
+
+def _setup(monkeypatch, version):
+    monkeypatch.setattr(report_generator, "news_version", lambda code: version[0])
+    report_generator.report_cache.clear_local()
+
+    calls = []
+
+    def generate_content(model, contents):
+        calls.append(contents)
+        return SimpleNamespace(text=f"리포트 {len(calls)}")
+
+    client = SimpleNamespace(models=SimpleNamespace(generate_content=generate_content))
+    monkeypatch.setattr(report_generator, "_get_client", lambda: client)
+    return calls
+
+
+def _report_kwargs(composite, news):
+    return dict(
+        stock_code="005930",
+        stock_name="삼성전자",
+        style_tag="가치주",
+        growth_score=60.0,
+        stability_score=70.0,
+        similarity_score=50.0,
+        composite_score=composite,
+        news_list=news,
+    )
+
+
+def _report(composite, news):
+    return report_generator.generate_report(**_report_kwargs(composite, news))
+
+
+def test_report_shared_until_news_changes(monkeypatch, fake_redis):
+    version = ["0"]
+    calls = _setup(monkeypatch, version)
+    news = [{"title": "a", "link": "https://n/1"}, {"title": "b", "link": "https://n/2"}]
+
+    first = _report(61.2, news)
+    assert _report(61.4, list(reversed(news))) == first
+    assert len(calls) == 1
+
+    # 검색된 뉴스 묶음이 바뀌면 새 리포트
+    _report(61.2, news[:1])
+    assert len(calls) == 2
+
+    # 새 뉴스 저장 → 뉴스 버전 증가 → 같은 입력도 새 리포트
+    version[0] = "1"
+    assert _report(61.2, news) != first
+    assert len(calls) == 3
+
+
+def test_async_report_reads_same_cache(monkeypatch, fake_redis):
+    version = ["0"]
+    calls = _setup(monkeypatch, version)
+
+    async def news_version_async(code):
+        return version[0]
+
+    monkeypatch.setattr(report_generator, "news_version_async", news_version_async)
+    news = [{"title": "a", "link": "https://n/1"}]
+
+    first = _report(61.2, news)
+    report_generator.report_cache.clear_local()
+    report = asyncio.run(report_generator.generate_report_async(**_report_kwargs(61.4, news)))
+    assert report == first
+    assert len(calls) == 1
+
+
+def test_prompt_uses_cache_key_scores(monkeypatch, fake_redis):
+    calls = _setup(monkeypatch, ["0"])
+    news = [{"title": "a", "link": "https://n/1"}]
+    kwargs = _report_kwargs(61.2, news)
+    raw_scores = (kwargs["growth_score"], kwargs["stability_score"], kwargs["similarity_score"], 61.2)
+    key_scores = report_generator.report_scores(*raw_scores)
+
+    # 같은 키로 묶이는 점수는 캐시 없이도 같은 프롬프트
+    _report(61.2, news)
+    report_generator.generate_report(**_report_kwargs(61.4, news), use_cache=False)
+    assert calls[0] == calls[1]
+    assert calls[0] == report_generator._build_prompt("005930", "삼성전자", "가치주", *key_scores, news)
+    assert f"종합 점수: {key_scores[-1]}점" in calls[0]
+
+    def failing(model, contents):
+        raise RuntimeError("down")
+
+    monkeypatch.setattr(report_generator, "_get_client", lambda: SimpleNamespace(models=SimpleNamespace(generate_content=failing)))
+    monkeypatch.setattr(report_generator.time, "sleep", lambda seconds: None)
+    fallback = report_generator.generate_report(**_report_kwargs(61.4, news), use_cache=False)
+    assert f"종합 점수는 {key_scores[-1]}점" in fallback
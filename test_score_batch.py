@@ -0,0 +1,59 @@
+"""
+배치 스코어링(/stock/score/batch) 테스트
+- 결과 순서가 요청 순서와 같은지
+- 분석 가능/불가 종목이 섞여도 항목별 사유가 유지되는지
+- 공유 포트폴리오/페르소나가 개별 항목 값을 덮어쓰고, 각 항목이 score_stock_only 와 같은지
+"""
+from app.ai_models.stock_filters import REASON_MESSAGES, REASON_NOT_IN_DB, REASON_SPAC
+from app.domain.stock_analyze import service
+from app.domain.stock_analyze.dto import PortfolioStock, StockAnalyzeRequest, StockScoreBatchRequest
+
+PORTFOLIO = [
+    PortfolioStock(stock_code="005930", market_cap=6363611.0, per=21.72, pbr=1.86, roe=6.64,
+                   debt_ratio=26.36, dividend_yield=370.0, investment_amount=3_000_000),
+    PortfolioStock(stock_code="000660", market_cap=4069533.0, per=20.57, pbr=5.35, roe=37.52,
+                   debt_ratio=48.13, dividend_yield=7.5, investment_amount=1_000_000),
+]
+OTHER_PORTFOLIO = PORTFOLIO[1:]
+
+
+def _stock(code, **overrides):
+    values = dict(stock_code=code, market_cap=1_000_000.0, per=12.0, pbr=1.1, roe=11.0,
+                  debt_ratio=80.0, dividend_yield=2.5)
+    values.update(overrides)
+    # 개별 항목의 포트폴리오/페르소나는 배치 공유 값으로 덮어써져야 한다
+    return StockAnalyzeRequest(**values, portfolio_stocks=OTHER_PORTFOLIO, persona="피터 린치")
+
+
+def test_batch_matches_single_scoring(fake_redis):
+    stocks = [
+        _stock("000660", roe=37.52, per=20.57),
+        _stock("999999"),  # 종목 DB에 없음
+        _stock("005930"),
+        _stock("442770"),  # 스팩
+        _stock("035720", debt_ratio=250.0),
+    ]
+    request = StockScoreBatchRequest(stocks=stocks, portfolio_stocks=PORTFOLIO, persona="워렌 버핏")
+
+    results = service.score_stocks_batch(request, use_cache=False)
+
+    assert [r["stock_code"] for r in results] == [s.stock_code for s in stocks]
+    assert [r["analyzable"] for r in results] == [True, False, True, False, True]
+    assert results[1]["reason"] == REASON_MESSAGES[REASON_NOT_IN_DB]
+    assert results[3]["reason"] == REASON_MESSAGES[REASON_SPAC]
+
+    for stock, result in zip(stocks, results):
+        single = stock.model_copy(update={"portfolio_stocks": PORTFOLIO, "persona": "워렌 버핏"})
+        assert result == service.score_stock_only(single, use_cache=False), stock.stock_code
+
+    # 공유 포트폴리오가 실제로 적용됨 (개별 항목 포트폴리오로 계산하면 유사도가 다름)
+    own = service.score_stock_only(stocks[0], use_cache=False)
+    assert own["scores"]["similarity_score"] != results[0]["scores"]["similarity_score"]
+
+    # 캐시 경로도 같은 결과
+    assert service.score_stocks_batch(request) == results
+    assert service.score_stocks_batch(request) == results
+
+
+def test_empty_batch():
+    assert service.score_stocks_batch(StockScoreBatchRequest(stocks=[])) == []
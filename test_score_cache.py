@@ -0,0 +1,122 @@
+"""
+/stock/score 2단계 캐시 테스트 (Redis는 fake_redis)
+- 포트폴리오가 다른 사용자: 종목 단위(intrinsic_cache) 히트, 사용자 단위(user_score_cache) 미스
+- 같은 요청: 두 캐시 모두 히트 (재계산 없음)
+- 분석 불가 종목도 캐시되고 그대로 반환되는지
+- 포트폴리오 벡터 캐시: 지문이 같은 보유 종목(순서/금액 규모만 다름)은 한번만 계산
+"""
+import pytest
+
+from app.ai_models.snapshot import get_snapshot
+from app.ai_models.stock_filters import REASON_MESSAGES, REASON_NOT_IN_DB
+from app.domain.stock_analyze import service
+from app.domain.stock_analyze.dto import PortfolioStock, StockAnalyzeRequest, StockScoreBatchRequest
+
+SAMSUNG = PortfolioStock(stock_code="005930", market_cap=6363611.0, per=21.72, pbr=1.86, roe=6.64,
+                         debt_ratio=26.36, dividend_yield=370.0, investment_amount=3_000_000)
+HYNIX = PortfolioStock(stock_code="000660", market_cap=4069533.0, per=20.57, pbr=5.35, roe=37.52,
+                       debt_ratio=48.13, dividend_yield=7.5, investment_amount=1_000_000)
+LOSS_MAKER = PortfolioStock(stock_code="035720", market_cap=1000.0, per=-35.0, pbr=0.4, roe=-12.0,
+                            debt_ratio=310.0, dividend_yield=0.0, investment_amount=500_000)
+
+
+def _stock(code):
+    return StockAnalyzeRequest(stock_code=code, market_cap=1_000_000.0, per=12.0, pbr=1.1, roe=11.0,
+                               debt_ratio=80.0, dividend_yield=2.5)
+
+
+def _batch(portfolio):
+    stocks = [_stock("005930"), _stock("999999"), _stock("000660")]
+    return StockScoreBatchRequest(stocks=stocks, portfolio_stocks=portfolio, persona="워렌 버핏")
+
+
+@pytest.fixture
+def computed(monkeypatch, fake_redis):
+    """캐시 미스로 실제 계산된 종목 수 기록 (L1은 테스트마다 비움)"""
+    for cache in (service.intrinsic_cache, service.user_score_cache, service.portfolio_vector_cache):
+        cache.clear_local()
+    counts = {"intrinsic": [], "user": []}
+    intrinsic_entries, user_scores = service._intrinsic_entries, service._user_scores
+
+    def count_intrinsic(snapshot, requests):
+        counts["intrinsic"].append(len(requests))
+        return intrinsic_entries(snapshot, requests)
+
+    def count_user(entries, *args, **kwargs):
+        counts["user"].append(len(entries))
+        return user_scores(entries, *args, **kwargs)
+
+    monkeypatch.setattr(service, "_intrinsic_entries", count_intrinsic)
+    monkeypatch.setattr(service, "_user_scores", count_user)
+    yield counts
+    for cache in (service.intrinsic_cache, service.user_score_cache, service.portfolio_vector_cache):
+        cache.clear_local()
+
+
+def test_two_level_cache(computed):
+    first = service.score_stocks_batch(_batch([SAMSUNG, HYNIX]))
+    assert computed == {"intrinsic": [3], "user": [2]}
+
+    # 다른 포트폴리오: 종목 단위 결과는 재사용, 유사도/종합 점수만 다시 계산
+    other = service.score_stocks_batch(_batch([LOSS_MAKER]))
+    assert computed == {"intrinsic": [3], "user": [2, 2]}
+    assert other[0]["scores"]["growth_score"] == first[0]["scores"]["growth_score"]
+    assert other[0]["scores"]["similarity_score"] != first[0]["scores"]["similarity_score"]
+
+    # 같은 요청 (보유 종목 순서만 다름): 두 캐시 모두 히트
+    again = service.score_stocks_batch(_batch([HYNIX, SAMSUNG]))
+    assert computed == {"intrinsic": [3], "user": [2, 2]}
+    assert again == first
+
+    # 단건 /stock/score 도 같은 키를 공유
+    single = _stock("000660").model_copy(update={"portfolio_stocks": [SAMSUNG, HYNIX], "persona": "워렌 버핏"})
+    assert service.score_stock_only(single) == first[2]
+    assert computed == {"intrinsic": [3], "user": [2, 2]}
+
+
+def test_unanalyzable_entries_are_cached(computed, fake_redis):
+    first = service.score_stocks_batch(_batch([SAMSUNG]))
+    expected = {
+        "stock_code": "999999",
+        "stock_name": service.UNKNOWN_STOCK_NAME,
+        "final_style_tag": None,
+        "style_description": None,
+        "analyzable": False,
+        "reason": REASON_MESSAGES[REASON_NOT_IN_DB],
+        "scores": None,
+    }
+    assert first[1] == expected
+    assert len(fake_redis.store) == 3 + 2 + 1  # 종목 단위 3 + 사용자 단위 2 + 포트폴리오 벡터 1
+
+    # L1을 비워도 Redis 값으로 그대로 복원 (재계산 없음)
+    service.intrinsic_cache.clear_local()
+    service.user_score_cache.clear_local()
+    again = service.score_stocks_batch(_batch([SAMSUNG]))
+    assert computed == {"intrinsic": [3], "user": [2]}
+    assert again == first
+
+
+def test_portfolio_vectors_cached_by_fingerprint(monkeypatch, computed):
+    calls = []
+    portfolio_vectors = service.portfolio_vectors
+
+    def count_vectors(holdings, style_model):
+        calls.append(len(holdings))
+        return portfolio_vectors(holdings, style_model)
+
+    monkeypatch.setattr(service, "portfolio_vectors", count_vectors)
+    snapshot = get_snapshot()
+    doubled = [h.model_copy(update={"investment_amount": h.investment_amount * 2}) for h in (SAMSUNG, HYNIX)]
+
+    feature, cluster = service._cached_portfolio_vectors(snapshot, [SAMSUNG, HYNIX])
+    for holdings in ([HYNIX, SAMSUNG], doubled):  # 순서만 다름 / 비중은 같고 금액 규모만 다름
+        cached_feature, cached_cluster = service._cached_portfolio_vectors(snapshot, holdings)
+        assert cached_feature.tolist() == feature.tolist()
+        assert cached_cluster.tolist() == cluster.tolist()
+    assert calls == [2]
+
+    # 보유 종목이 바뀌면 다시 계산
+    changed = [SAMSUNG, HYNIX.model_copy(update={"investment_amount": 2_000_000})]
+    service._cached_portfolio_vectors(snapshot, changed)
+    service._cached_portfolio_vectors(snapshot, [SAMSUNG, HYNIX, LOSS_MAKER])
+    assert calls == [2, 2, 3]
@@ -0,0 +1,156 @@
+"""
+벡터화 스코어링 엔진 단위 테스트
+- /stock/recommend 경로(recommend_from_universe) 결과가 기존 iterrows 스칼라 루프와 완전히 같은지 검증
+  (성장성/안정성/유사도/종합 점수 + 종합 점수 내림차순·종목코드 오름차순 순서)
+"""
+import numpy as np
+
+from app.ai_models.inference import load_style_model
+from app.ai_models.scoring import (
+    PERSONA_WEIGHTS,
+    composite_score,
+    cosine_similarity,
+    cosine_similarity_to_score,
+    growth_score,
+    growth_score_array,
+    recommend_from_universe,
+    similarity_score_array,
+    stability_score,
+    stability_score_array,
+    top_n_indices,
+)
+from app.ai_models.stock_filters import is_valid_stock_for_analysis
+from app.ai_models.universe import FEATURE_COLUMNS, build_universe_snapshot
+from app.ai_models.universe_store import MODEL_DIR, read_stock_db
+
+
+def _reference_growth_score(roe, per):
+    """clip 커널 도입 전 if/elif 구현 (회귀 기준)"""
+    if roe <= 0:
+        roe_score = 0.0
+    elif roe >= 20:
+        roe_score = 100.0
+    else:
+        roe_score = (roe / 20) * 100
+
+    if per <= 0 or per > 100:
+        per_score = 0.0
+    elif 10 <= per <= 20:
+        per_score = 100.0
+    elif 5 <= per < 10:
+        per_score = (per - 5) / 5 * 100
+    elif 20 < per <= 35:
+        per_score = (35 - per) / 15 * 100
+    else:
+        per_score = 0.0
+
+    return round(max(0, min(100, roe_score * 0.6 + per_score * 0.4)), 2)
+
+
+def _reference_stability_score(debt_ratio, dividend_yield):
+    """clip 커널 도입 전 if/elif 구현 (회귀 기준)"""
+    if debt_ratio <= 50:
+        debt_score = 100.0
+    elif debt_ratio <= 200:
+        debt_score = (200 - debt_ratio) / 150 * 100
+    else:
+        debt_score = 0.0
+
+    if dividend_yield <= 0:
+        div_score = 0.0
+    elif dividend_yield >= 5:
+        div_score = 100.0
+    else:
+        div_score = (dividend_yield / 5) * 100
+
+    return round(max(0, min(100, debt_score * 0.6 + div_score * 0.4)), 2)
+
+
+def _scalar_recommendations(stock_db, style_model, user_feature_vector, user_cluster_vector, persona):
+    """기존 score_all_stocks 의 iterrows 루프 (정렬은 종합 점수 내림차순, 동점은 종목코드 오름차순)"""
+    df = stock_db.copy()
+    df["clean_name"] = df["한글명"].astype(str).str.split().str[0]
+    df = df[df["clean_name"].apply(is_valid_stock_for_analysis)]
+    df[FEATURE_COLUMNS] = df[FEATURE_COLUMNS].replace([np.inf, -np.inf], np.nan).fillna(0)
+    scaled = style_model.transform(df[FEATURE_COLUMNS])
+    clusters = style_model.predict(scaled)
+    weights = PERSONA_WEIGHTS.get(persona)
+
+    rows = []
+    for i, (code, row) in enumerate(df.iterrows()):
+        g = _reference_growth_score(row["ROE"], row["per"])
+        s = _reference_stability_score(row["부채비율"], row["배당수익률"])
+        feature_sim = cosine_similarity_to_score(cosine_similarity(user_feature_vector, scaled[i]))
+        cluster_vec = np.zeros(8)
+        cluster_vec[int(clusters[i])] = 1.0
+        cluster_sim = cosine_similarity_to_score(cosine_similarity(user_cluster_vector, cluster_vec))
+        sim = round(feature_sim * 0.7 + cluster_sim * 0.3, 2)
+        rows.append((code, g, s, sim, composite_score(sim, g, s, weights)))
+    rows.sort(key=lambda r: (-r[4], r[0]))
+    return rows
+
+
+def test_recommend_matches_scalar():
+    """실제 종목 DB 전체에 대해 추천 경로 결과가 스칼라 루프와 일치 (순서 포함)"""
+    stock_db = read_stock_db()
+    style_model = load_style_model(MODEL_DIR)
+    universe = build_universe_snapshot(stock_db, style_model, is_valid_stock_for_analysis)
+    rng = np.random.default_rng(7)
+    user_feature_vector = rng.normal(size=6)
+    user_cluster_vector = rng.dirichlet(np.ones(8))
+
+    for persona in [None, *PERSONA_WEIGHTS]:
+        expected = _scalar_recommendations(
+            stock_db, style_model, user_feature_vector, user_cluster_vector, persona
+        )
+        result = recommend_from_universe(
+            universe,
+            user_feature_vector=user_feature_vector,
+            user_cluster_vector=user_cluster_vector,
+            persona=persona,
+            top_n=len(universe.candidates),
+        )
+        actual = [
+            (r["stock_code"], r["growth_score"], r["stability_score"],
+             r["similarity_score"], r["composite_score"])
+            for r in result
+        ]
+        assert actual == expected, persona
+
+
+def test_score_kernels_breakpoints():
+    """구간 경계값에서 기존 if/elif 구현과 일치 (배열 커널 + 스칼라 래퍼)"""
+    values = np.array([-10, -0.01, 0, 0.01, 4.99, 5, 7.5, 10, 15, 20, 20.01, 27.5,
+                       35, 35.01, 50, 99.99, 100, 100.01, 125, 199.99, 200, 250])
+    roe, per = np.meshgrid(values, values)
+    debt, div = np.meshgrid(values, values / 20)
+    roe, per, debt, div = (a.ravel() for a in (roe, per, debt, div))
+
+    expected_growth = [_reference_growth_score(r, p) for r, p in zip(roe, per)]
+    expected_stability = [_reference_stability_score(d, y) for d, y in zip(debt, div)]
+
+    assert list(growth_score_array(roe, per)) == expected_growth
+    assert list(stability_score_array(debt, div)) == expected_stability
+    assert [growth_score(r, p) for r, p in zip(roe, per)] == expected_growth
+    assert [stability_score(d, y) for d, y in zip(debt, div)] == expected_stability
+
+
+def test_similarity_zero_vectors():
+    """사용자 벡터 norm이 0이면 유사도 0 → 50점"""
+    rng = np.random.default_rng(42)
+    scaled = rng.normal(size=(10, 6))
+    clusters = rng.integers(0, 8, size=10)
+    result = similarity_score_array(scaled, clusters, np.zeros(6), np.zeros(8))
+    assert np.all(result == 50.0)
+
+
+def test_top_n_indices_matches_full_sort():
+    """부분 선택 결과가 (점수 내림차순, 코드 오름차순) 전체 정렬과 일치"""
+    rng = np.random.default_rng(3)
+    scores = rng.integers(0, 40, size=500) / 4  # 동점이 많도록
+    codes = rng.permutation(500)
+
+    expected = sorted(range(500), key=lambda i: (-scores[i], codes[i]))
+    for top_n in [1, 10, 50, 499, 500, 600]:
+        assert list(top_n_indices(scores, codes, top_n)) == expected[:top_n]
+    assert len(top_n_indices(scores, codes, 0)) == 0
@@ -0,0 +1,86 @@
+"""
+single-flight 테스트
+- 동시에 캐시 미스가 나도 compute 는 한번만 실행되는지 검증 (Redis 락은 가짜로 대체)
+"""
+import threading
+import time
+
+from app.infrastructure import single_flight as sf
+
+
+def test_concurrent_misses_compute_once(monkeypatch):
+    monkeypatch.setattr(sf, "try_lock", lambda name, ttl_ms: "token")
+    monkeypatch.setattr(sf, "release_lock", lambda name, token: None)
+
+    cache = {}
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        cache["k"] = "value"
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(sf.single_flight("k", lambda: cache.get("k"), compute)))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(calls) == 1
+    assert sorted(results) == [("value", False)] + [("value", True)] * 7
+
+
+def test_waits_for_other_worker(monkeypatch):
+    """다른 워커가 락을 잡고 있으면 캐시에 결과가 생길 때까지 기다린다"""
+    monkeypatch.setattr(sf, "try_lock", lambda name, ttl_ms: None)
+    cache = {}
+    threading.Timer(0.05, lambda: cache.update(k="from-other-worker")).start()
+
+    value, cached = sf.single_flight("k", lambda: cache.get("k"), lambda: "computed", poll_interval=0.01)
+    assert (value, cached) == ("from-other-worker", True)
+
+
+def test_wait_timeout_falls_back_to_compute(monkeypatch):
+    monkeypatch.setattr(sf, "try_lock", lambda name, ttl_ms: None)
+
+    value, cached = sf.single_flight(
+        "k", lambda: None, lambda: "computed", wait_timeout=0.05, poll_interval=0.01
+    )
+    assert (value, cached) == ("computed", False)
+
+
+def test_async_concurrent_misses_compute_once(monkeypatch):
+    import asyncio
+
+    async def try_lock(name, ttl_ms):
+        return "token"
+
+    async def release_lock(name, token):
+        return None
+
+    monkeypatch.setattr(sf, "async_try_lock", try_lock)
+    monkeypatch.setattr(sf, "async_release_lock", release_lock)
+
+    cache = {}
+    calls = []
+
+    async def lookup():
+        return cache.get("k")
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        cache["k"] = "value"
+        return "value"
+
+    async def run():
+        return await asyncio.gather(*(sf.async_single_flight("k", lookup, compute) for _ in range(8)))
+
+    results = asyncio.run(run())
+    assert [value for value, _ in results] == ["value"] * 8
+    assert len(calls) == 1
@@ -0,0 +1,33 @@
+"""
+stale-while-revalidate 캐시 테스트
+- soft TTL 이 지난 값은 stale 로 표시되고, 이전 형식(봉투 없는 값)도 그대로 읽힌다
+"""
+import json
+
+from app.infrastructure.tiered_cache import SWRCache, TieredCache, decode_swr_entry, swr_codec
+
+
+def test_decode_legacy_entries():
+    assert decode_swr_entry("삼성전자는 반도체 기업입니다.") == {
+        "value": "삼성전자는 반도체 기업입니다.",
+        "stored_at": 0,
+    }
+    assert decode_swr_entry('{"final_score": 70}') == {"value": {"final_score": 70}, "stored_at": 0}
+
+
+def test_soft_expiry_marks_stale(fake_redis):
+    store = fake_redis.store
+    cache = SWRCache(
+        TieredCache("swr_test", redis_ttl=100, l1_ttl=10, maxsize=8, codec=swr_codec()),
+        soft_ttl=60,
+    )
+    assert cache.get("a") == (None, False)
+
+    cache.set("a", "fresh")
+    assert cache.get("a") == ("fresh", False)
+
+    # 다른 워커에서 오래전에 저장한 값
+    store["swr_test:b"] = json.dumps({"value": "old", "stored_at": 0})
+    store["swr_test:c"] = "legacy plain text"
+    assert cache.get("b") == ("old", True)
+    assert cache.get("c") == ("legacy plain text", True)
@@ -0,0 +1,56 @@
+"""
+2단 캐시(L1 → Redis) 테스트
+- Redis는 dict 기반 가짜(conftest.fake_redis)로 대체해 L1 히트 시 Redis를 다시 조회하지 않는지 검증
+"""
+from app.infrastructure.cache_codec import JsonCodec
+from app.infrastructure.tiered_cache import TieredCache
+
+
+def test_l1_hit_skips_redis(fake_redis):
+    fake = fake_redis
+    cache = TieredCache("test_ns", redis_ttl=60, l1_ttl=30, maxsize=10, codec=JsonCodec())
+
+    cache.set("k", {"score": 1.5})
+    assert fake.store["test_ns:k"] == '{"score": 1.5}'
+    assert cache.get("k") == {"score": 1.5}
+    assert fake.reads == 0
+
+    # 다른 워커가 저장한 값 → Redis 히트 후 L1에 채움
+    fake.store["test_ns:other"] = '{"score": 2.0}'
+    assert cache.get("other") == {"score": 2.0}
+    assert cache.get("other") == {"score": 2.0}
+    assert fake.reads == 1
+
+
+def test_get_many_reads_only_l1_misses(fake_redis):
+    fake = fake_redis
+    cache = TieredCache("test_ns", redis_ttl=60, l1_ttl=30, maxsize=10)
+
+    cache.set_many([("a", "A"), ("b", "B")])
+    cache.clear_local()
+    cache.set("a", "A")
+    assert cache.get_many(["a", "b", "c"]) == ["A", "B", None]
+    assert fake.reads == 1
+    assert cache.get_many(["a", "b"]) == ["A", "B"]
+    assert fake.reads == 1
+
+
+def test_l1_ttl_capped_by_redis_ttl():
+    assert TieredCache("test_ns", redis_ttl=60, l1_ttl=600, maxsize=10).l1_ttl == 60
+
+
+def test_corrupt_values_are_misses(fake_redis):
+    cache = TieredCache("test_ns", redis_ttl=60, l1_ttl=30, maxsize=10)
+    fake_redis.store["test_ns:zstd"] = b"\x02not a zstd frame"
+    fake_redis.store["test_ns:msgpack"] = b"\x01\xc1"
+    fake_redis.store["test_ns:unknown"] = b"\xff\xfe garbage"
+    cache.set("ok", "OK")
+    cache.clear_local()
+
+    assert cache.get("zstd") is None
+    assert cache.get_many(["msgpack", "ok", "unknown"]) == [None, "OK", None]
+
+    # 다시 계산해 저장하면 손상된 값을 덮어쓴다
+    cache.set("zstd", "fresh")
+    cache.clear_local()
+    assert cache.get("zstd") == "fresh"
@@ -0,0 +1,71 @@
+"""
+유니버스 저장소(.npy 메모리 매핑) 테스트
+- 저장소에서 읽은 스냅샷이 CSV에서 계산한 스냅샷과 같은 값인지 검증
+- 저장소/CSV 로더의 stock_db 가 열·dtype·값까지 같은지 검증
+"""
+import numpy as np
+import pandas as pd
+
+from app.ai_models.inference import load_style_model
+from app.ai_models.universe import FEATURE_COLUMNS, build_universe_snapshot
+from app.ai_models.universe_store import (
+    DATA_DIR,
+    MODEL_DIR,
+    STOCK_DB_FILE,
+    build_universe_store,
+    load_universe_csv,
+    load_universe_store,
+    read_stock_db,
+)
+from app.ai_models.stock_filters import is_valid_stock_for_analysis
+
+
+def test_store_matches_csv(tmp_path):
+    style_model = load_style_model(MODEL_DIR)
+    build_universe_store(is_valid_stock_for_analysis, store_dir=tmp_path, style_model=style_model)
+    stock_db, universe = load_universe_store(
+        style_model, is_valid_stock_for_analysis, store_dir=tmp_path
+    )
+    expected = build_universe_snapshot(read_stock_db(), style_model, is_valid_stock_for_analysis)
+
+    assert list(stock_db.index) == list(expected.all.codes)
+    assert np.array_equal(universe.valid, expected.valid)
+    assert np.array_equal(universe.candidates, expected.candidates)
+    for name in ("codes", "names", "scaled", "row_norms", "clusters", "growth", "stability", "code_rank"):
+        assert np.array_equal(getattr(universe.all, name), getattr(expected.all, name)), name
+
+
+def test_store_and_csv_loaders_build_same_stock_db(tmp_path):
+    style_model = load_style_model(MODEL_DIR)
+    build_universe_store(is_valid_stock_for_analysis, store_dir=tmp_path, style_model=style_model)
+    store_db, _ = load_universe_store(style_model, is_valid_stock_for_analysis, store_dir=tmp_path)
+    csv_db, _ = load_universe_csv(style_model, is_valid_stock_for_analysis)
+
+    pd.testing.assert_frame_equal(store_db, csv_db)
+    assert list(csv_db.columns) == ["한글명", *FEATURE_COLUMNS]
+    assert all(csv_db[column].dtype == np.float32 for column in FEATURE_COLUMNS)
+    assert csv_db.loc["000020", "한글명"] == "동화약품"
+
+
+def test_store_candidates_stay_memory_mapped(tmp_path):
+    style_model = load_style_model(MODEL_DIR)
+    build_universe_store(is_valid_stock_for_analysis, store_dir=tmp_path, style_model=style_model)
+    _, universe = load_universe_store(style_model, is_valid_stock_for_analysis, store_dir=tmp_path)
+
+    # 분석 가능 종목은 행 번호만 — 배열 자체는 매핑된 파일을 그대로 본다
+    assert universe.candidates.dtype.kind == "i"
+    for name in ("scaled", "row_norms", "clusters", "growth", "stability", "code_rank"):
+        assert not getattr(universe.all, name).flags.owndata, name
+
+
+def test_stale_store_is_ignored(tmp_path):
+    style_model = load_style_model(MODEL_DIR)
+    csv_copy = tmp_path / STOCK_DB_FILE
+    csv_copy.write_bytes((DATA_DIR / STOCK_DB_FILE).read_bytes())
+    store_dir = tmp_path / "store"
+    build_universe_store(is_valid_stock_for_analysis, csv_copy, store_dir, style_model)
+
+    with open(csv_copy, "a", encoding="utf-8") as f:
+        f.write("\n")
+
+    assert load_universe_store(style_model, is_valid_stock_for_analysis, csv_copy, store_dir) is None
@@ -47,4 +47,9 @@ stock_info.to_csv(final_output_file, index=False, encoding='utf-8')
 
 print(f"2. {final_output_file} (종목별 태그 결과) 저장 완료")
 print("\n--- 그룹별 종목 개수 ---")
-print(stock_info['group_tag'].value_counts().sort_index())
\ No newline at end of file
+print(stock_info['group_tag'].value_counts().sort_index())
+
+# 4. 서빙용 style_model.npz / 유니버스 저장소를 새 모델 기준으로 다시 생성
+from app.ai_models.universe_store import rebuild_serving_artifacts
+
+print(f"3. 유니버스 저장소 갱신 완료: {rebuild_serving_artifacts()}")